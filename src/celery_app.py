@@ -86,8 +86,14 @@ celery_app.conf.update(
     task_routes={
         "tasks.file_processing.process_project_files": {"queue": "file_processing"},
         "tasks.data_indexing.index_data_content": {"queue": "data_indexing"},
+        "tasks.data_indexing.build_vector_index": {"queue": "data_indexing"},
+        "tasks.data_indexing.upgrade_text_search_index": {"queue": "data_indexing"},
+        "tasks.file_processing.process_assets_group": {"queue": "file_processing"},
         "tasks.process_workflow.process_and_push_workflow": {"queue": "file_processing"},
+        "tasks.process_workflow.process_project_files_fanout": {"queue": "file_processing"},
+        "tasks.process_workflow.collect_processing_results": {"queue": "default"},
         "tasks.maintenance.clean_celery_executions_table": {"queue": "default"},
+        "tasks.maintenance.backfill_asset_ids": {"queue": "default"},
     },
 
     beat_schedule={
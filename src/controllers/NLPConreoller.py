@@ -1,16 +1,28 @@
 from .BaseController import BaseController
 from models.db_schemas import Project, DataChunk
 from stores.llm.LLMEnums import DocumentTypeEnums
+from stores.vectordb.VectorDBEnums import SearchModeEnums, SearchProfileEnums
+from utils.query_embedding_cache import QueryEmbeddingCache
 from typing import List
+import hashlib
 import json
+import numpy as np
 
 class NLPController(BaseController):
-    def __init__(self, vector_db_client, generation_client, embedding_client, template_parser):
+    def __init__(self, vector_db_client, generation_client, embedding_client, template_parser,
+                 embedding_cache=None, query_embedding_cache=None,
+                 answer_cache=None, answer_cache_ttl: int = None,
+                 semantic_answer_cache=None):
         super().__init__()
         self.vector_db_client = vector_db_client
         self.generation_client = generation_client
         self.embedding_client = embedding_client
         self.template_parser = template_parser
+        self.embedding_cache = embedding_cache
+        self.query_embedding_cache = query_embedding_cache
+        self.answer_cache = answer_cache
+        self.answer_cache_ttl = answer_cache_ttl
+        self.semantic_answer_cache = semantic_answer_cache
     
     def create_collection_name(self, project_id: str):
         return f"collection_{self.vector_db_client.default_vector_size}_{project_id}".strip()
@@ -32,10 +44,7 @@ class NLPController(BaseController):
         collection_name = self.create_collection_name(project_id = project.project_id)
         
         # mange items to be indexed
-        texts = [chunk.chunk_text for chunk in chunks]
-        metadata = [chunk.chunk_metadata for chunk in chunks]
-        vectors = self.embedding_client.embed_text(text=texts, 
-                            document_type=DocumentTypeEnums.DOCUMENT.value) 
+        vectors = await self.embed_chunks(chunks=chunks)
       
         # create collection if not exists
         _ = await self.vector_db_client.create_collection(
@@ -45,7 +54,79 @@ class NLPController(BaseController):
         )
 
         # insert items into collection
-        _ = await self.vector_db_client.insert_many(
+        return await self.insert_into_vector_db(
+            project=project,
+            chunks=chunks,
+            vectors=vectors,
+            chunk_ids=chunk_ids
+        )
+
+    async def embed_chunks(self, chunks: List[DataChunk]):
+        texts = [chunk.chunk_text for chunk in chunks]
+
+        vectors = await self.embed_texts(
+            texts=texts,
+            document_type=DocumentTypeEnums.DOCUMENT.value
+        )
+
+        if not vectors or len(vectors) != len(texts):
+            raise Exception(f"Embedding failed for a batch of {len(texts)} chunks")
+
+        # float32 rows go to the vector store in pgvector's binary format
+        return np.asarray(vectors, dtype=np.float32)
+
+    async def embed_texts(self, texts: List[str], document_type: str):
+        if not self.embedding_cache:
+            return await self.embedding_client.embed_text_async(
+                text=texts,
+                document_type=document_type
+            )
+
+        cache_key = (
+            self.app_settings.EMBEDDING_BACKEND,
+            self.embedding_client.embedding_model_id,
+            document_type,
+        )
+
+        texts_hashes = [hashlib.sha256(text.encode("utf-8")).hexdigest() for text in texts]
+
+        cached_vectors = await self.embedding_cache.get_vectors(
+            *cache_key, text_hashes=list(set(texts_hashes))
+        )
+
+        # only send each missing text once to the provider
+        missing = {}
+        for text, text_hash in zip(texts, texts_hashes):
+            if text_hash not in cached_vectors and text_hash not in missing:
+                missing[text_hash] = text
+
+        if len(missing):
+            vectors = await self.embedding_client.embed_text_async(
+                text=list(missing.values()),
+                document_type=document_type
+            )
+
+            if not vectors or len(vectors) != len(missing):
+                return None
+
+            new_vectors = dict(zip(missing.keys(), vectors))
+            _ = await self.embedding_cache.insert_vectors(*cache_key, vectors=new_vectors)
+            cached_vectors.update(new_vectors)
+
+        return [cached_vectors[text_hash] for text_hash in texts_hashes]
+
+    async def insert_into_vector_db(self, project: Project, chunks: List[DataChunk],
+                                    vectors: list, chunk_ids: List[int]):
+        collection_name = self.create_collection_name(project_id = project.project_id)
+
+        texts = [chunk.chunk_text for chunk in chunks]
+        # the asset id travels with each record so searches can be scoped to a document
+        metadata = [
+            {**(chunk.chunk_metadata or {}), "asset_id": chunk.chunk_asset_id}
+            for chunk in chunks
+        ]
+
+        return await self.vector_db_client.insert_many(
             collection_name=collection_name,
             texts=texts,
             vectors=vectors,
@@ -53,54 +134,114 @@ class NLPController(BaseController):
             record_ids=chunk_ids
         )
 
-        return True
+    async def embed_query(self, text: str):
+        query_vectors = await self.embed_queries(texts=[text])
+        if query_vectors is None:
+            return None
+        return query_vectors[0]
 
-    async def search_vector_db_collection(self, project: Project, text: str, limit: int =5):
-        
-        query_vector = None
-        collection_name = self.create_collection_name(project_id = project.project_id)
-        
-        # get embedding for the query text
-        vectors = self.embedding_client.embed_text(
-            text=text, 
+    async def embed_queries(self, texts: List[str]):
+        # cached queries are served locally, the rest go to the provider in one call
+        model_id = self.embedding_client.embedding_model_id
+        query_vectors = [None] * len(texts)
+
+        if self.query_embedding_cache:
+            query_vectors = await self.query_embedding_cache.get_many(model_id, texts)
+
+        missing_idx = [idx for idx, vector in enumerate(query_vectors) if vector is None]
+        if not missing_idx:
+            return query_vectors
+
+        vectors = await self.embedding_client.embed_text_async(
+            text=[texts[idx] for idx in missing_idx], 
             document_type=DocumentTypeEnums.QUERY.value
         )
 
-        # perform search in vector db
-        if not vectors or len(vectors) == 0:
-            return False
+        if not vectors or len(vectors) != len(missing_idx) or not len(vectors[0]):
+            return None
+
+        for idx, vector in zip(missing_idx, vectors):
+            query_vectors[idx] = np.asarray(vector, dtype=np.float32)
+
+        if self.query_embedding_cache:
+            await self.query_embedding_cache.set_many(
+                model_id,
+                [texts[idx] for idx in missing_idx],
+                [query_vectors[idx] for idx in missing_idx]
+            )
+
+        return query_vectors
+
+    def get_search_mode(self, search_mode: str = None):
+        search_mode = search_mode or self.app_settings.VECTOR_DB_SEARCH_MODE
+        if search_mode not in [mode.value for mode in SearchModeEnums]:
+            return SearchModeEnums.VECTOR.value
+        return search_mode
+
+    def get_search_profile(self, project: Project, search_profile: str = None):
+        # request, then project, then the deployment default
+        search_profile = (search_profile or project.project_search_profile
+                          or self.app_settings.VECTOR_DB_SEARCH_PROFILE)
+        if search_profile not in [profile.value for profile in SearchProfileEnums]:
+            return SearchProfileEnums.BALANCED.value
+        return search_profile
+
+    async def search_vector_db_collection(self, project: Project, text: str, limit: int =5,
+                                          query_vector=None, search_mode: str = None,
+                                          filters: dict = None, search_profile: str = None):
+        
+        collection_name = self.create_collection_name(project_id = project.project_id)
         
-        if isinstance(vectors, list) and len(vectors) > 0:
-            query_vector = vectors[0]
+        # get embedding for the query text, unless the caller already has it
+        if query_vector is None:
+            query_vector = await self.embed_query(text=text)
 
-        if not query_vector:
+        if query_vector is None:
             return False
 
-        results = await self.vector_db_client.search_by_vector(
-            collection_name=collection_name,
-            vector=query_vector,
-            limit=limit
-        )
+        search_profile = self.get_search_profile(project, search_profile)
+
+        if self.get_search_mode(search_mode) == SearchModeEnums.HYBRID.value:
+            # exact identifiers and names are matched by the full text side
+            results = await self.vector_db_client.search_hybrid(
+                collection_name=collection_name,
+                text=text,
+                vector=query_vector,
+                limit=limit,
+                filters=filters,
+                search_profile=search_profile
+            )
+        else:
+            results = await self.vector_db_client.search_by_vector(
+                collection_name=collection_name,
+                vector=query_vector,
+                limit=limit,
+                filters=filters,
+                search_profile=search_profile
+            )
 
         if not results:
             return False
         
         return results
-    
-    async def answer_rag_query(self, project: Project, query: str, limit: int =5  ):
 
-        answer, full_prompt, chat_history = None, None, None
+    async def search_vector_db_collection_batch(self, project: Project, texts: List[str], limit: int =5,
+                                                filters: dict = None, search_profile: str = None):
+        collection_name = self.create_collection_name(project_id = project.project_id)
 
-        # retrieve relevant documents from vector db
-        retrieved_docs = await self.search_vector_db_collection(
-            project=project,
-            text=query,
-            limit=limit
-        )
+        query_vectors = await self.embed_queries(texts=texts)
+        if query_vectors is None:
+            return False
 
-        if not retrieved_docs or len(retrieved_docs) == 0:
-            return answer, full_prompt, chat_history
-        
+        return await self.vector_db_client.search_by_vectors(
+            collection_name=collection_name,
+            vectors=query_vectors,
+            limit=limit,
+            filters=filters,
+            search_profile=self.get_search_profile(project, search_profile)
+        )
+    
+    def build_rag_prompt(self, query: str, retrieved_docs: list):
         # construct llm prompt
         system_prompt = self.template_parser.get("rag", "system_prompt")
 
@@ -127,12 +268,144 @@ class NLPController(BaseController):
             footer_prompt,
         ])
 
-        answer = self.generation_client.generate_text(
+        return full_prompt, chat_history
+
+    def create_answer_cache_key(self, project: Project, query: str, limit: int, search_mode: str = None,
+                                filters: dict = None, search_profile: str = None):
+        # a new index version changes every key, so stale answers are never served
+        key_parts = [
+            str(project.project_id),
+            str(project.project_index_version),
+            QueryEmbeddingCache.normalize_text(query),
+            str(limit),
+            self.get_search_mode(search_mode),
+            json.dumps(filters or {}, sort_keys=True),
+            self.get_search_profile(project, search_profile),
+            str(self.generation_client.generation_model_id),
+            str(self.template_parser.language),
+        ]
+        return hashlib.sha256("\x1f".join(key_parts).encode("utf-8")).hexdigest()
+
+    def create_semantic_cache_partition(self, project: Project, limit: int, search_mode: str = None,
+                                        search_profile: str = None):
+        # an answer is only reused for questions asked with the same settings
+        return (
+            limit,
+            self.get_search_mode(search_mode),
+            self.get_search_profile(project, search_profile),
+            self.generation_client.generation_model_id,
+            self.template_parser.language,
+        )
+
+    async def answer_rag_query(self, project: Project, query: str, limit: int =5, search_mode: str = None,
+                               filters: dict = None, search_profile: str = None):
+        """
+        Returns (answer, full_prompt, chat_history, semantic_match). semantic_match is the
+        earlier question whose answer was reused by the semantic cache, None otherwise.
+        """
+        answer, full_prompt, chat_history = None, None, None
+
+        cache_key = None
+        if self.answer_cache:
+            cache_key = self.create_answer_cache_key(project=project, query=query, limit=limit,
+                                                     search_mode=search_mode, filters=filters,
+                                                     search_profile=search_profile)
+            cached_answer = await self.answer_cache.get_answer(cache_key, ttl_seconds=self.answer_cache_ttl)
+            if cached_answer:
+                return (cached_answer.answer_text, cached_answer.answer_full_prompt,
+                        cached_answer.answer_chat_history, None)
+
+        # answers are matched per project and settings, scoped questions bypass the semantic cache
+        use_semantic_cache = self.semantic_answer_cache is not None and not filters
+
+        query_vector, cache_partition = None, None
+        if use_semantic_cache:
+            cache_partition = self.create_semantic_cache_partition(project=project, limit=limit,
+                                                                   search_mode=search_mode,
+                                                                   search_profile=search_profile)
+
+            # paraphrases of an answered question skip retrieval and generation
+            query_vector = await self.embed_query(text=query)
+            if query_vector is None:
+                return answer, full_prompt, chat_history, None
+
+            cached_answer = self.semantic_answer_cache.get(
+                project.project_id, project.project_index_version, query_vector,
+                partition=cache_partition
+            )
+            if cached_answer is not None:
+                # the cached prompt holds the other question, only the answer is reused
+                cached_answer_text, matched_query = cached_answer
+                return cached_answer_text, None, None, matched_query
+
+        # retrieve relevant documents from vector db
+        retrieved_docs = await self.search_vector_db_collection(
+            project=project,
+            text=query,
+            limit=limit,
+            query_vector=query_vector,
+            search_mode=search_mode,
+            filters=filters,
+            search_profile=search_profile
+        )
+
+        if not retrieved_docs or len(retrieved_docs) == 0:
+            return answer, full_prompt, chat_history, None
+        
+        full_prompt, chat_history = self.build_rag_prompt(query=query, retrieved_docs=retrieved_docs)
+
+        answer = await self.generation_client.generate_text_async(
+            prompt=full_prompt,
+            chat_history=chat_history,
+        )
+
+        if answer and cache_key:
+            _ = await self.answer_cache.insert_answer(
+                cache_key=cache_key,
+                project_id=project.project_id,
+                index_version=project.project_index_version,
+                query=query,
+                answer=answer,
+                full_prompt=full_prompt,
+                chat_history=chat_history
+            )
+
+        if answer and use_semantic_cache:
+            self.semantic_answer_cache.set(
+                project.project_id, project.project_index_version, query_vector,
+                (answer, query),
+                partition=cache_partition
+            )
+
+        return answer, full_prompt, chat_history, None
+
+    async def answer_rag_query_stream(self, project: Project, query: str, limit: int =5,
+                                      search_mode: str = None, filters: dict = None,
+                                      search_profile: str = None):
+        """
+        Same as answer_rag_query, but returns the retrieved documents right away
+        with an async iterator over the generated tokens.
+        """
+        retrieved_docs = await self.search_vector_db_collection(
+            project=project,
+            text=query,
+            limit=limit,
+            search_mode=search_mode,
+            filters=filters,
+            search_profile=search_profile
+        )
+
+        if not retrieved_docs or len(retrieved_docs) == 0:
+            return None, None
+
+        full_prompt, chat_history = self.build_rag_prompt(query=query, retrieved_docs=retrieved_docs)
+
+        tokens = self.generation_client.generate_text_stream(
             prompt=full_prompt,
             chat_history=chat_history,
         )
 
-        return answer, full_prompt, chat_history
+        return retrieved_docs, tokens
 
 
 
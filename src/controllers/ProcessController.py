@@ -2,9 +2,16 @@ from importlib.metadata import metadata
 from .BaseController import BaseController
 from .ProjectController import ProjectController
 import os
+import hashlib
+import logging
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from langchain_community.document_loaders import TextLoader, PyMuPDFLoader 
-from models import ProcessingStatus
-from typing import List
+from models import ProcessingStatus, ChunkSeparatorEnums
+from utils.chunking_engine import ChunkingEngine
+from utils.pdf_extraction import get_pdf_page_count, extract_pdf_pages_text
+from typing import Iterable, Iterator
 from dataclasses import dataclass
 
 @dataclass
@@ -12,6 +19,8 @@ class Document:
     page_content: str
     metadata: dict
 
+logger = logging.getLogger(__name__)
+
 class ProcessController(BaseController):
     def __init__(self, project_id: str):
         super().__init__()
@@ -41,44 +50,107 @@ class ProcessController(BaseController):
         if loader :
             return loader.load()
         return None
+
+    def get_file_hash(self, file_id: str):
+        file_path = os.path.join(self.project_path, file_id)
+
+        if not os.path.exists(file_path):
+            return None
+
+        file_hash = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            while content := f.read(self.app_settings.FILE_CHUNK_SIZE):
+                file_hash.update(content)
+
+        return file_hash.hexdigest()
+
+    def get_file_content_iterator(self, file_id: str):
+        # yields pages one by one instead of loading the whole document
+        file_path = os.path.join(self.project_path, file_id)
+        if self.should_extract_in_parallel(file_id):
+            return self.get_pdf_content_parallel(file_path)
+
+        loader = self.get_file_loader(file_id)
+        if loader :
+            return loader.lazy_load()
+        return None
         
+    def should_extract_in_parallel(self, file_id: str):
+        if self.app_settings.PDF_EXTRACTION_WORKERS <= 1:
+            return False
+
+        # prefork pool children are daemonic and may not start their own processes
+        if multiprocessing.current_process().daemon:
+            logger.warning("PDF_EXTRACTION_WORKERS needs a non-daemonic worker (celery --pool=threads or solo), "
+                           "extracting sequentially")
+            return False
+
+        if self.get_file_extension(file_id).lower() != ProcessingStatus.PDF.value:
+            return False
+
+        file_path = os.path.join(self.project_path, file_id)
+        if not os.path.exists(file_path):
+            return False
+
+        return get_pdf_page_count(file_path) >= self.app_settings.PDF_PARALLEL_MIN_PAGES
+
+    def get_pdf_content_parallel(self, file_path: str) -> Iterator[Document]:
+        page_count = get_pdf_page_count(file_path)
+        pages_per_task = max(self.app_settings.PDF_PAGES_PER_TASK, 1)
+        max_workers = self.app_settings.PDF_EXTRACTION_WORKERS
+
+        page_ranges = deque(
+            (page_start, min(page_start + pages_per_task, page_count))
+            for page_start in range(0, page_count, pages_per_task)
+        )
+
+        # spawn: fitz is not fork-safe and celery workers are forked processes
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+
+            # keep a bounded window of ranges in flight and yield them in page order
+            in_flight = deque()
+            while page_ranges or in_flight:
+                while page_ranges and len(in_flight) < max_workers * 2:
+                    page_start, page_end = page_ranges.popleft()
+                    in_flight.append((page_start, executor.submit(
+                        extract_pdf_pages_text, file_path, page_start, page_end
+                    )))
+
+                page_start, future = in_flight.popleft()
+                for offset, page_text in enumerate(future.result()):
+                    yield Document(
+                        page_content=page_text,
+                        metadata={
+                            "source": file_path,
+                            "page": page_start + offset,
+                            "total_pages": page_count,
+                        })
+
     def process_file_content(self, file_content: list,
                              chunk_size: int = 100, 
-                             chunk_overlap: int = 20):
-   
-        file_content_text = [doc.page_content for doc in file_content]
-        file_content_metadata = [doc.metadata for doc in file_content]
-
-        chunks = self.process_simpler_splitter(
-            texts=file_content_text,
-            metadatas=file_content_metadata,
-            chunk_size=chunk_size        
-            )
+                             chunk_overlap: int = 20,
+                             separator: str = ChunkSeparatorEnums.NEWLINE.value):
 
-        return chunks
+        return list(self.process_file_content_stream(
+            file_content=file_content,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            separator=separator
+            ))
 
-    def process_simpler_splitter(self, texts: List[str],metadatas: List[dict],
-                                       chunk_size: int, splitter_tag: str = '\n'):
-        
-        full_text = " ".join(texts)
-
-        # split based on the splitter tag
-        lines = [doc.strip() for doc in full_text.split(splitter_tag) if len(doc.strip()) > 1]
-
-        chunks = []
-        current_chunk = ""
-
-        for line in lines:
-            current_chunk += line + splitter_tag
-            if len(current_chunk) >= chunk_size:
-                chunks.append(Document(
-                    page_content=current_chunk.strip(),
-                      metadata={}))
-                
-                current_chunk = ""
-        if current_chunk:
-            chunks.append(Document(
-                page_content=current_chunk.strip(),
-                  metadata={}))
-        
-        return chunks
\ No newline at end of file
+    def process_file_content_stream(self, file_content: Iterable,
+                                    chunk_size: int = 100,
+                                    chunk_overlap: int = 20,
+                                    separator: str = ChunkSeparatorEnums.NEWLINE.value) -> Iterator[Document]:
+
+        chunking_engine = ChunkingEngine(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            separator=separator
+            )
+
+        for chunk_text, chunk_metadata in chunking_engine.split(file_content):
+            yield Document(
+                page_content=chunk_text,
+                metadata=chunk_metadata)
@@ -11,6 +11,11 @@ class settings(BaseSettings):
     FILE_ALLOWED_TYPES: list
     MAX_FILE_SIZE_MB: int
     FILE_CHUNK_SIZE: int
+    FILE_PROCESSING_BATCH_SIZE: int = 500
+    PDF_EXTRACTION_WORKERS: int = 1
+    PDF_PARALLEL_MIN_PAGES: int = 200
+    PDF_PAGES_PER_TASK: int = 50
+    FILE_PROCESSING_FANOUT_GROUPS: int = 0
     
     POSTGRES_USERNAME: str
     POSTGRES_PASSWORD: str
@@ -29,16 +34,78 @@ class settings(BaseSettings):
     GENERATION_MODEL_ID: str = None
     EMBEDDING_MODEL_ID: str = None
     EMBEDDING_MODEL_SIZE: int = None
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_TTL_SECONDS: int = 2592000
+    EMBEDDING_CACHE_MAX_ROWS: int = 1000000
+
+    QUERY_EMBEDDING_CACHE_ENABLED: bool = True
+    QUERY_EMBEDDING_CACHE_MAX_MB: int = 64
+    QUERY_EMBEDDING_CACHE_TTL_SECONDS: int = 3600
+    QUERY_EMBEDDING_CACHE_REDIS_URL: str = None
+    RAG_ANSWER_CACHE_ENABLED: bool = True
+    RAG_ANSWER_CACHE_TTL_SECONDS: int = 86400
+    SEMANTIC_ANSWER_CACHE_ENABLED: bool = False
+    SEMANTIC_ANSWER_CACHE_THRESHOLD: float = 0.95
+    SEMANTIC_ANSWER_CACHE_MAX_ENTRIES: int = 1000
+    SEMANTIC_ANSWER_CACHE_MAX_PROJECTS: int = 100
+    SEARCH_BATCH_MAX_QUERIES: int = 256
+
+    LOCAL_EMBEDDING_DEVICE: str = "cpu"
+    LOCAL_EMBEDDING_THREADS: int = 0
+    LOCAL_EMBEDDING_MAX_BATCH_SIZE: int = 64
+    LOCAL_EMBEDDING_MAX_WAIT_MS: int = 5
+    LOCAL_EMBEDDING_QUERY_PREFIX: str = ""
+    LOCAL_EMBEDDING_DOCUMENT_PREFIX: str = ""
 
     INPUT_MAX_TOKEN: int = None
     GENERATION_MAX_TOKEN: int = None
     GENERATION_TEMPERATURE: float = None
 
+    LLM_HTTP_MAX_CONNECTIONS: int = 100
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LLM_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    LLM_HTTP_TIMEOUT: float = 60.0
+    LLM_HTTP_CONNECT_TIMEOUT: float = 5.0
+
     VECTOR_DB_BACKEND_LITRAL: List[str]
     VECTOR_DB_BACKEND: str 
     VECTOR_DB_PATH: str 
     VECTOR_DB_DISTANCE_METHOD: str = None
+    VECTOR_DB_URL: str = None
+    VECTOR_DB_API_KEY: str = None
+    VECTOR_DB_PREFER_GRPC: bool = False
+    VECTOR_DB_GRPC_PORT: int = 6334
+    VECTOR_DB_TIMEOUT: int = 30
+    VECTOR_DB_POOL_SIZE: int = 20
+    VECTOR_DB_UPLOAD_PARALLEL: int = 4
+    VECTOR_DB_QDRANT_ON_DISK: bool = False
+    VECTOR_DB_QDRANT_HNSW_ON_DISK: bool = False
+    VECTOR_DB_QDRANT_QUANTIZATION: str = None
+    VECTOR_DB_QDRANT_QUANTIZATION_ALWAYS_RAM: bool = True
+    VECTOR_DB_QDRANT_RESCORE: bool = True
+    VECTOR_DB_QDRANT_OVERSAMPLING: float = 2.0
     VECTOR_DB_PGVEC_INDEX_THRESHOLD: int = 100
+    VECTOR_DB_PGVEC_INDEX_TYPE: str = "hnsw"
+    VECTOR_DB_PGVEC_BULK_LOAD: bool = True
+    VECTOR_DB_PGVEC_MAINTENANCE_WORK_MEM: str = "1GB"
+    VECTOR_DB_PGVEC_MAX_PARALLEL_WORKERS: int = 4
+    VECTOR_DB_PGVEC_STORAGE_MODE: str = "vector"
+    VECTOR_DB_PGVEC_RESCORE_FACTOR: int = 4
+    VECTOR_DB_PGVEC_TEXT_SEARCH_CONFIG: str = None
+    VECTOR_DB_PGVEC_ITERATIVE_SCAN: str = "relaxed_order"
+    VECTOR_DB_SEARCH_MODE: str = "vector"
+    VECTOR_DB_HYBRID_RRF_K: int = 60
+    VECTOR_DB_HYBRID_CANDIDATES_FACTOR: int = 4
+    VECTOR_DB_SEARCH_PROFILE: str = "balanced"
+    VECTOR_DB_FAST_EF_SEARCH: int = 40
+    VECTOR_DB_BALANCED_EF_SEARCH: int = 100
+    VECTOR_DB_PGVEC_FAST_PROBES: int = 1
+    VECTOR_DB_PGVEC_BALANCED_PROBES: int = 10
+    VECTOR_DB_EXACT_SEARCH_THRESHOLD: int = 5000
+
+    INDEXING_PAGE_SIZE: int = 50
+    INDEXING_EMBEDDING_CONCURRENCY: int = 2
+    INDEXING_QUEUE_SIZE: int = 4
     
     PRIMARY_LANGUAGE: str = "en"
     DEFAULT_LANGUAGE: str = "en"
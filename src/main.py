@@ -7,6 +7,8 @@ from stores.llm.templates.template_parser import TemplateParser
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from utils.metrics import setup_metrics
+from utils.query_embedding_cache import QueryEmbeddingCache
+from utils.semantic_answer_cache import SemanticAnswerCache
 
 app = FastAPI()
 
@@ -24,6 +26,7 @@ async def startup_span():
     )        
 
     llm_provider_factory = LLMProviderFactory(config=settings)
+    app.llm_provider_factory = llm_provider_factory
     vectordb_provider_factory = VectorDBProviderFactory(config=settings, db_client=app.db_client)
 
     # Initialize LLM providers
@@ -38,6 +41,22 @@ async def startup_span():
     app.vector_db_client = vectordb_provider_factory.create(settings.VECTOR_DB_BACKEND)
     await app.vector_db_client.connect()
 
+    app.query_embedding_cache = None
+    if settings.QUERY_EMBEDDING_CACHE_ENABLED:
+        app.query_embedding_cache = QueryEmbeddingCache(
+            max_bytes=settings.QUERY_EMBEDDING_CACHE_MAX_MB * 1024 * 1024,
+            ttl_seconds=settings.QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+            redis_url=settings.QUERY_EMBEDDING_CACHE_REDIS_URL or None
+        )
+
+    app.semantic_answer_cache = None
+    if settings.SEMANTIC_ANSWER_CACHE_ENABLED:
+        app.semantic_answer_cache = SemanticAnswerCache(
+            threshold=settings.SEMANTIC_ANSWER_CACHE_THRESHOLD,
+            max_entries=settings.SEMANTIC_ANSWER_CACHE_MAX_ENTRIES,
+            max_projects=settings.SEMANTIC_ANSWER_CACHE_MAX_PROJECTS
+        )
+
     app.template_parser = TemplateParser(
             language=settings.PRIMARY_LANGUAGE,
             default_language=settings.DEFAULT_LANGUAGE
@@ -46,6 +65,10 @@ async def startup_span():
 async def shutdown_span():
     app.db_engine.dispose()
     await app.vector_db_client.disconnect()
+    await app.llm_provider_factory.close()
+
+    if app.query_embedding_cache:
+        await app.query_embedding_cache.close()
 
 # app.router.lifespan.on_startup.append(startup_span)
 # app.router.lifespan.on_shutdown.append(shutdown_span)
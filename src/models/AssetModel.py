@@ -1,6 +1,7 @@
 from .BaseDataModel import BaseDataModel
 from .db_schemas import Asset
 from sqlalchemy.future import select
+from sqlalchemy import update
 
 class AssetModel(BaseDataModel):
     def __init__(self, db_client: object):
@@ -30,6 +31,16 @@ class AssetModel(BaseDataModel):
             assets = results.scalars().all()
         return assets
     
+    async def get_assets_by_ids(self, asset_project_id: str, asset_ids: list):
+        async with self.db_client() as session:
+            statement = select(Asset).where(
+                Asset.asset_project_id == asset_project_id,
+                Asset.asset_id.in_(asset_ids)
+            ).order_by(Asset.asset_id)
+            results = await session.execute(statement)
+            assets = results.scalars().all()
+        return assets
+    
     async def get_asset_record_by_name(self, asset_project_id: str, asset_name: str):
         async with self.db_client() as session:
             statement = select(Asset).where(
@@ -49,4 +60,42 @@ class AssetModel(BaseDataModel):
             result = await session.execute(statement)
             record = result.scalar_one_or_none()
         return record
-    
\ No newline at end of file
+
+    async def update_asset_processing_state(self, asset_id: int, content_hash: str,
+                                            processing_config: dict):
+        async with self.db_client() as session:
+            statement = update(Asset).where(
+                Asset.asset_id == asset_id
+            ).values(
+                asset_content_hash=content_hash,
+                asset_config=processing_config,
+                asset_indexed=False
+            )
+            await session.execute(statement)
+            await session.commit()
+        return True
+
+    async def set_assets_indexed(self, asset_project_id: int, asset_ids: list = None):
+        # no asset_ids: the whole project was indexed
+        async with self.db_client() as session:
+            statement = update(Asset).where(
+                Asset.asset_project_id == asset_project_id
+            )
+            if asset_ids is not None:
+                statement = statement.where(Asset.asset_id.in_(asset_ids))
+            await session.execute(statement.values(asset_indexed=True))
+            await session.commit()
+        return True
+
+    async def reset_assets_processing_state(self, asset_project_id: int):
+        # after a project reset no asset can be considered unchanged
+        async with self.db_client() as session:
+            statement = update(Asset).where(
+                Asset.asset_project_id == asset_project_id
+            ).values(
+                asset_content_hash=None,
+                asset_indexed=False
+            )
+            await session.execute(statement)
+            await session.commit()
+        return True
@@ -3,6 +3,8 @@ from .db_schemas import DataChunk
 from bson.objectid import ObjectId
 from sqlalchemy.future import select
 from sqlalchemy import delete, func
+from sqlalchemy.sql import text as sql_text
+import json
 
 class ChunkModel(BaseDataModel):
        
@@ -39,24 +41,129 @@ class ChunkModel(BaseDataModel):
                     await session.commit()
             return len(chunks)
 
+        async def insert_chunks_bulk(self, chunks: list[dict]):
+            """
+            Stream chunk rows with asyncpg's binary COPY.
+            Ids are reserved from the table sequence first so they can be returned
+            for indexing; uuid and timestamps come from server defaults.
+            Returns the new chunk ids in the same order as the input.
+            """
+            if not chunks:
+                return []
+
+            columns = ["chunk_id", "chunk_text", "chunk_metadata", "chunk_order",
+                       "chunk_project_id", "chunk_asset_id"]
+
+            async with self.db_client() as session:
+                async with session.begin():
+                    result = await session.execute(sql_text(
+                        "SELECT nextval(pg_get_serial_sequence(:table_name, 'chunk_id')) "
+                        "FROM generate_series(1, :rows_count)"
+                    ), {"table_name": DataChunk.__tablename__, "rows_count": len(chunks)})
+                    chunk_ids = sorted(result.scalars().all())
+
+                    records = [
+                        (
+                            chunk_id,
+                            chunk["chunk_text"],
+                            json.dumps(chunk["chunk_metadata"], ensure_ascii=False)
+                                if chunk.get("chunk_metadata") is not None else None,
+                            chunk["chunk_order"],
+                            chunk["chunk_project_id"],
+                            chunk["chunk_asset_id"],
+                        )
+                        for chunk_id, chunk in zip(chunk_ids, chunks)
+                    ]
+
+                    connection = await session.connection()
+                    raw_connection = await connection.get_raw_connection()
+                    await raw_connection.driver_connection.copy_records_to_table(
+                        DataChunk.__tablename__,
+                        records=records,
+                        columns=columns
+                    )
+
+            return chunk_ids
+
         async def delete_chunks_by_project_id(self, project_id: ObjectId):
             async with self.db_client() as session:
                 statement = delete(DataChunk).where(DataChunk.chunk_project_id == project_id)
                 result = await session.execute(statement)
                 await session.commit()
             return result.rowcount                    
+
+        async def delete_chunks_by_asset_id(self, asset_id: int):
+            async with self.db_client() as session:
+                statement = delete(DataChunk).where(DataChunk.chunk_asset_id == asset_id)
+                result = await session.execute(statement)
+                await session.commit()
+            return result.rowcount
+
+        async def get_asset_chunk_ids(self, asset_id: int):
+            async with self.db_client() as session:
+                statement = select(DataChunk.chunk_id).where(DataChunk.chunk_asset_id == asset_id)
+                results = await session.execute(statement)
+                chunk_ids = results.scalars().all()
+            return list(chunk_ids)
         
-        async def get_project_chunks(self, project_id: ObjectId, page_no: int = 1, page_size: int = 50):
+        async def get_project_chunks(self, project_id: ObjectId, page_no: int = 1, page_size: int = 50,
+                                     asset_ids: list = None):
             async with self.db_client() as session:
-                statement = select(DataChunk).where(DataChunk.chunk_project_id == project_id).offset((page_no - 1) * page_size).limit(page_size)
+                statement = select(DataChunk).where(DataChunk.chunk_project_id == project_id)
+                if asset_ids is not None:
+                    statement = statement.where(DataChunk.chunk_asset_id.in_(asset_ids))
+                statement = statement.order_by(DataChunk.chunk_id).offset((page_no - 1) * page_size).limit(page_size)
                 results = await session.execute(statement)
                 chunks = results.scalars().all()
             return chunks
         
-        async def get_total_chunks_count(self, project_id: ObjectId):
+        async def get_project_chunks_after(self, project_id: ObjectId, last_chunk_id: int = 0,
+                                           page_size: int = 50, asset_ids: list = None):
+            async with self.db_client() as session:
+                statement = select(DataChunk).where(
+                    DataChunk.chunk_project_id == project_id,
+                    DataChunk.chunk_id > last_chunk_id
+                )
+                if asset_ids is not None:
+                    statement = statement.where(DataChunk.chunk_asset_id.in_(asset_ids))
+                statement = statement.order_by(DataChunk.chunk_id).limit(page_size)
+                results = await session.execute(statement)
+                chunks = results.scalars().all()
+            return chunks
+
+        async def iter_project_chunks(self, project_id: ObjectId, page_size: int = None,
+                                      asset_ids: list = None, after_chunk_id: int = 0):
+            """
+            Keyset pagination over a project's chunks in chunk_id order.
+            Backed by the (chunk_project_id, chunk_id) index, every page costs the same.
+            """
+            page_size = page_size or self.app_settings.INDEXING_PAGE_SIZE
+            last_chunk_id = after_chunk_id
+
+            while True:
+                page_chunks = await self.get_project_chunks_after(
+                    project_id=project_id,
+                    last_chunk_id=last_chunk_id,
+                    page_size=page_size,
+                    asset_ids=asset_ids
+                )
+
+                if not page_chunks:
+                    break
+
+                yield page_chunks
+                last_chunk_id = page_chunks[-1].chunk_id
+
+        async def get_total_chunks_count(self, project_id: ObjectId, asset_ids: list = None,
+                                         after_chunk_id: int = 0):
             count = 0
             async with self.db_client() as session:
-                statement = select(func.count(DataChunk.chunk_id)).where(DataChunk.chunk_project_id == project_id)
+                statement = select(func.count(DataChunk.chunk_id)).where(
+                    DataChunk.chunk_project_id == project_id,
+                    DataChunk.chunk_id > after_chunk_id
+                )
+                if asset_ids is not None:
+                    statement = statement.where(DataChunk.chunk_asset_id.in_(asset_ids))
                 results = await session.execute(statement)
                 count = results.scalar()
             return count
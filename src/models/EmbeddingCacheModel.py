@@ -0,0 +1,84 @@
+from .BaseDataModel import BaseDataModel
+from .db_schemas import EmbeddingCache
+from sqlalchemy.future import select
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from datetime import datetime, timedelta, timezone
+
+class EmbeddingCacheModel(BaseDataModel):
+    def __init__(self, db_client: object):
+        super().__init__(db_client)
+        self.db_client = db_client
+
+    @classmethod
+    async def create_instance(cls, db_client: object):
+        instance = cls(db_client)
+        return instance
+
+    async def get_vectors(self, backend: str, model_id: str, document_type: str,
+                          text_hashes: list):
+        # one round trip for the whole batch, returns {text_hash: vector}
+        if not text_hashes:
+            return {}
+
+        async with self.db_client() as session:
+            statement = select(
+                EmbeddingCache.embedding_text_hash,
+                EmbeddingCache.embedding_vector
+            ).where(
+                EmbeddingCache.embedding_backend == backend,
+                EmbeddingCache.embedding_model_id == model_id,
+                EmbeddingCache.embedding_document_type == document_type,
+                EmbeddingCache.embedding_text_hash.in_(text_hashes)
+            )
+            results = await session.execute(statement)
+            records = results.all()
+
+        return {
+            record.embedding_text_hash: list(record.embedding_vector)
+            for record in records
+        }
+
+    async def insert_vectors(self, backend: str, model_id: str, document_type: str,
+                             vectors: dict):
+        if not vectors:
+            return 0
+
+        async with self.db_client() as session:
+            async with session.begin():
+                statement = insert(EmbeddingCache).values([
+                    {
+                        "embedding_backend": backend,
+                        "embedding_model_id": model_id,
+                        "embedding_document_type": document_type,
+                        "embedding_text_hash": text_hash,
+                        "embedding_vector": [float(v) for v in vector],
+                    }
+                    for text_hash, vector in vectors.items()
+                ]).on_conflict_do_nothing()
+                await session.execute(statement)
+
+        return len(vectors)
+
+    async def delete_stale_vectors(self, ttl_seconds: int, max_rows: int = 0) -> int:
+        # entries older than the TTL, then the oldest ones beyond max_rows (0 = no size bound)
+        cutoff_time = datetime.now(timezone.utc) - timedelta(seconds=ttl_seconds)
+        deleted_count = 0
+
+        async with self.db_client() as session:
+            async with session.begin():
+                statement = delete(EmbeddingCache).where(EmbeddingCache.created_at < cutoff_time)
+                result = await session.execute(statement)
+                deleted_count += result.rowcount
+
+                if max_rows and max_rows > 0:
+                    # created_at of the newest row that no longer fits, served by ix_embedding_cache_created_at
+                    oldest_kept = select(EmbeddingCache.created_at).order_by(
+                        EmbeddingCache.created_at.desc()
+                    ).offset(max_rows).limit(1).scalar_subquery()
+
+                    statement = delete(EmbeddingCache).where(EmbeddingCache.created_at <= oldest_kept)
+                    result = await session.execute(statement)
+                    deleted_count += result.rowcount
+
+        return deleted_count
@@ -0,0 +1,56 @@
+from .BaseDataModel import BaseDataModel
+from .db_schemas import IndexingCheckpoint
+from sqlalchemy.future import select
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.postgresql import insert
+
+class IndexingCheckpointModel(BaseDataModel):
+    def __init__(self, db_client: object):
+        super().__init__(db_client)
+        self.db_client = db_client
+
+    @classmethod
+    async def create_instance(cls, db_client: object):
+        instance = cls(db_client)
+        return instance
+
+    async def get_last_chunk_id(self, project_id: int, collection_name: str):
+        async with self.db_client() as session:
+            statement = select(IndexingCheckpoint.checkpoint_last_chunk_id).where(
+                IndexingCheckpoint.checkpoint_project_id == project_id,
+                IndexingCheckpoint.checkpoint_collection_name == collection_name
+            )
+            result = await session.execute(statement)
+            last_chunk_id = result.scalar_one_or_none()
+        return last_chunk_id or 0
+
+    async def save_checkpoint(self, project_id: int, collection_name: str, last_chunk_id: int):
+        async with self.db_client() as session:
+            async with session.begin():
+                statement = insert(IndexingCheckpoint).values(
+                    checkpoint_project_id=project_id,
+                    checkpoint_collection_name=collection_name,
+                    checkpoint_last_chunk_id=last_chunk_id
+                )
+                statement = statement.on_conflict_do_update(
+                    index_elements=[
+                        IndexingCheckpoint.checkpoint_project_id,
+                        IndexingCheckpoint.checkpoint_collection_name
+                    ],
+                    set_={
+                        "checkpoint_last_chunk_id": last_chunk_id,
+                        "updated_at": func.now()
+                    }
+                )
+                await session.execute(statement)
+        return True
+
+    async def delete_checkpoint(self, project_id: int, collection_name: str):
+        async with self.db_client() as session:
+            statement = delete(IndexingCheckpoint).where(
+                IndexingCheckpoint.checkpoint_project_id == project_id,
+                IndexingCheckpoint.checkpoint_collection_name == collection_name
+            )
+            result = await session.execute(statement)
+            await session.commit()
+        return result.rowcount
@@ -1,7 +1,7 @@
 from .BaseDataModel import BaseDataModel
 from .db_schemas import Project
 from sqlalchemy.future import select
-from sqlalchemy import func
+from sqlalchemy import func, update
 
 class ProjectModel(BaseDataModel):
     def __init__(self, db_client: object):
@@ -51,3 +51,25 @@ class ProjectModel(BaseDataModel):
                 projects = await session.execute(query).scalars().all()
 
                 return projects, total_pages
+
+    async def bump_index_version(self, project_id: int):
+        async with self.db_client() as session:
+            async with session.begin():
+                statement = update(Project).where(
+                    Project.project_id == project_id
+                ).values(
+                    project_index_version=Project.project_index_version + 1
+                ).returning(Project.project_index_version)
+                result = await session.execute(statement)
+                return result.scalar_one_or_none()
+
+    async def set_search_profile(self, project_id: int, search_profile: str = None):
+        async with self.db_client() as session:
+            async with session.begin():
+                statement = update(Project).where(
+                    Project.project_id == project_id
+                ).values(
+                    project_search_profile=search_profile
+                ).returning(Project.project_search_profile)
+                result = await session.execute(statement)
+                return result.scalar_one_or_none()
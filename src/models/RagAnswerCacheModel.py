@@ -0,0 +1,63 @@
+from .BaseDataModel import BaseDataModel
+from .db_schemas import RagAnswerCache, Project
+from sqlalchemy.future import select
+from sqlalchemy import delete, or_
+from sqlalchemy.dialects.postgresql import insert
+from datetime import datetime, timedelta, timezone
+
+class RagAnswerCacheModel(BaseDataModel):
+    def __init__(self, db_client: object):
+        super().__init__(db_client)
+        self.db_client = db_client
+
+    @classmethod
+    async def create_instance(cls, db_client: object):
+        instance = cls(db_client)
+        return instance
+
+    async def get_answer(self, cache_key: str, ttl_seconds: int = None):
+        async with self.db_client() as session:
+            statement = select(RagAnswerCache).where(
+                RagAnswerCache.answer_cache_key == cache_key
+            )
+            if ttl_seconds:
+                cutoff_time = datetime.now(timezone.utc) - timedelta(seconds=ttl_seconds)
+                statement = statement.where(RagAnswerCache.created_at >= cutoff_time)
+
+            result = await session.execute(statement)
+            return result.scalar_one_or_none()
+
+    async def insert_answer(self, cache_key: str, project_id: int, index_version: int,
+                            query: str, answer: str, full_prompt: str = None,
+                            chat_history: list = None):
+        async with self.db_client() as session:
+            async with session.begin():
+                statement = insert(RagAnswerCache).values(
+                    answer_cache_key=cache_key,
+                    answer_project_id=project_id,
+                    answer_index_version=index_version,
+                    answer_query=query,
+                    answer_text=answer,
+                    answer_full_prompt=full_prompt,
+                    answer_chat_history=chat_history,
+                ).on_conflict_do_nothing()
+                await session.execute(statement)
+
+        return True
+
+    async def delete_stale_answers(self, ttl_seconds: int) -> int:
+        # entries of older index versions can never be hit again
+        cutoff_time = datetime.now(timezone.utc) - timedelta(seconds=ttl_seconds)
+        current_version = select(Project.project_index_version).where(
+            Project.project_id == RagAnswerCache.answer_project_id
+        ).scalar_subquery()
+
+        async with self.db_client() as session:
+            async with session.begin():
+                statement = delete(RagAnswerCache).where(or_(
+                    RagAnswerCache.created_at < cutoff_time,
+                    RagAnswerCache.answer_index_version != current_version
+                ))
+                result = await session.execute(statement)
+
+        return result.rowcount
@@ -1,3 +1,3 @@
 from .enums.ResponseEnums import ResponseStatus
-from .enums.ProcessingEnums import ProcessingStatus
+from .enums.ProcessingEnums import ProcessingStatus, ChunkSeparatorEnums
 from .enums.AssetTypeEnum import AssetTypeEnum
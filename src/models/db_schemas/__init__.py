@@ -1 +1 @@
-from models.db_schemas.atlas.schemas import Project, DataChunk, RetrievedDocument, Asset
\ No newline at end of file
+from models.db_schemas.atlas.schemas import Project, DataChunk, RetrievedDocument, Asset, EmbeddingCache, IndexingCheckpoint, RagAnswerCache
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""Add chunk uuid server default
+
+Revision ID: 748024c898c5
+Revises: 33957fe087c8
+Create Date: 2026-10-18 10:03:17.552810
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '748024c898c5'
+down_revision: Union[str, Sequence[str], None] = '33957fe087c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # bulk COPY inserts leave chunk_uuid to the server
+    op.alter_column('chunks', 'chunk_uuid',
+               existing_type=sa.UUID(),
+               server_default=sa.text('gen_random_uuid()'),
+               existing_nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('chunks', 'chunk_uuid',
+               existing_type=sa.UUID(),
+               server_default=None,
+               existing_nullable=False)
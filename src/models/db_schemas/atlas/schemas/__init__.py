@@ -3,3 +3,6 @@ from .project import Project
 from .asset import Asset
 from .datachunk import DataChunk, RetrievedDocument
 from .celery_task_executions import CeleryTaskExecution
+from .embedding_cache import EmbeddingCache
+from .indexing_checkpoint import IndexingCheckpoint
+from .rag_answer_cache import RagAnswerCache
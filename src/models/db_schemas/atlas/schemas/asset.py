@@ -1,5 +1,5 @@
 from .atlas_base import SQLAlchemyBase
-from sqlalchemy import Column, Integer, DateTime, func, String, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, func, String, ForeignKey, Boolean
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy import Index
@@ -16,6 +16,9 @@ class Asset(SQLAlchemyBase):
     asset_name = Column(String, nullable=False)
     asset_size = Column(Integer, nullable=False)
     asset_config = Column(JSONB, nullable=True)
+    asset_content_hash = Column(String(64), nullable=True)
+    # set once the asset's current chunks are in the vector DB, incremental runs only skip indexed assets
+    asset_indexed = Column(Boolean, nullable=False, default=False, server_default="false")
     
     asset_project_id = Column(Integer, ForeignKey("projects.project_id"), nullable=False)
 
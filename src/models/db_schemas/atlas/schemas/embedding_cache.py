@@ -0,0 +1,21 @@
+from .atlas_base import SQLAlchemyBase
+from sqlalchemy import Column, DateTime, func, String
+from sqlalchemy.dialects.postgresql import ARRAY, REAL
+from sqlalchemy import Index
+
+class EmbeddingCache(SQLAlchemyBase):
+
+    __tablename__ = "embedding_cache"
+
+    embedding_backend = Column(String(50), primary_key=True)
+    embedding_model_id = Column(String(255), primary_key=True)
+    embedding_document_type = Column(String(20), primary_key=True)
+    embedding_text_hash = Column(String(64), primary_key=True)  # SHA-256 hash of the embedded text
+
+    embedding_vector = Column(ARRAY(REAL), nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index('ix_embedding_cache_created_at', created_at),
+    )
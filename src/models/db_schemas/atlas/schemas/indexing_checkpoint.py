@@ -0,0 +1,15 @@
+from .atlas_base import SQLAlchemyBase
+from sqlalchemy import Column, Integer, DateTime, func, String, ForeignKey
+
+class IndexingCheckpoint(SQLAlchemyBase):
+
+    __tablename__ = "indexing_checkpoints"
+
+    checkpoint_project_id = Column(Integer, ForeignKey("projects.project_id"), primary_key=True)
+    checkpoint_collection_name = Column(String(255), primary_key=True)
+
+    # every chunk with chunk_id <= this value is committed in the collection
+    checkpoint_last_chunk_id = Column(Integer, nullable=False, default=0)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
@@ -1,5 +1,5 @@
 from .atlas_base import SQLAlchemyBase
-from sqlalchemy import Column, Integer, DateTime, func
+from sqlalchemy import Column, Integer, String, DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from sqlalchemy.orm import relationship
@@ -11,6 +11,12 @@ class Project(SQLAlchemyBase):
     project_id = Column(Integer, primary_key=True, autoincrement=True)
     project_uuid = Column(UUID(as_uuid=True), unique=True, nullable=False, default=uuid.uuid4)
 
+    # bumped whenever the project's vector index changes, versioned caches key on it
+    project_index_version = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # recall/latency profile for the project's searches, NULL follows VECTOR_DB_SEARCH_PROFILE
+    project_search_profile = Column(String, nullable=True)
+
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=True, onupdate=func.now())
 
@@ -0,0 +1,25 @@
+from .atlas_base import SQLAlchemyBase
+from sqlalchemy import Column, Integer, DateTime, func, String, Text, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Index
+
+class RagAnswerCache(SQLAlchemyBase):
+
+    __tablename__ = "rag_answer_cache"
+
+    answer_cache_key = Column(String(64), primary_key=True)  # SHA-256 of the versioned query key
+
+    answer_project_id = Column(Integer, ForeignKey("projects.project_id", ondelete="CASCADE"), nullable=False)
+    answer_index_version = Column(Integer, nullable=False)
+
+    answer_query = Column(Text, nullable=False)
+    answer_text = Column(Text, nullable=False)
+    answer_full_prompt = Column(Text, nullable=True)
+    answer_chat_history = Column(JSONB, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index('ix_rag_answer_cache_project_id', answer_project_id),
+        Index('ix_rag_answer_cache_created_at', created_at),
+    )
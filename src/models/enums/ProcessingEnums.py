@@ -2,4 +2,9 @@ from enum import Enum
 
 class ProcessingStatus(Enum):
     TXT = ".txt"
-    PDF = ".pdf"
\ No newline at end of file
+    PDF = ".pdf"
+
+class ChunkSeparatorEnums(Enum):
+    PARAGRAPH = "paragraph"
+    SENTENCE = "sentence"
+    NEWLINE = "newline"
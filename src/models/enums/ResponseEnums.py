@@ -17,8 +17,12 @@ class ResponseStatus(Enum):
     VECTORDB_COLLECTION_RETURNED= "VECTORDB_COLLECTION_RETURNED"
     VECTORDB_SEARCH_ERROR = "VECTORDB_SEARCH_ERROR"
     VECTORDB_SEARCH_SUCCESS = "VECTORDB_SEARCH_SUCCESS"
+    VECTORDB_BATCH_SEARCH_TOO_LARGE = "VECTORDB_BATCH_SEARCH_TOO_LARGE"
+    VECTORDB_SEARCH_PROFILE_UPDATED = "VECTORDB_SEARCH_PROFILE_UPDATED"
     RAG_ANSWER_GENERATION_FAILED = "RAG_ANSWER_GENERATION_FAILED"
     RAG_ANSWER_GENERATION_SUCCESS = "RAG_ANSWER_GENERATION_SUCCESS"
     INDEXING_STARTED = "INDEXING_STARTED"
+    TEXT_SEARCH_UPGRADE_STARTED = "TEXT_SEARCH_UPGRADE_STARTED"
+    ASSET_IDS_BACKFILL_STARTED = "ASSET_IDS_BACKFILL_STARTED"
     PROCESS_AND_PUSH_WORKFLOW_STARTED = "PROCESS_AND_PUSH_WORKFLOW_STARTED"
     
\ No newline at end of file
@@ -13,7 +13,7 @@ from models.db_schemas import DataChunk, Asset
 from models.ChunkModel import ChunkModel
 from controllers import NLPController
 from tasks.file_processing import process_project_files
-from tasks.process_workflow import process_and_push_workflow
+from tasks.process_workflow import process_and_push_workflow, process_project_files_fanout
 
 logger = logging.getLogger("uvicorn.error")
 
@@ -79,12 +79,33 @@ async def process_endpoint(request: Request, project_id: int, process_request: P
     overlap_size = process_request.overlap_size
     do_reset = process_request.do_reset
 
+    if process_request.fan_out and not process_request.file_id:
+        # one sub-task per asset group, aggregated by a chord
+        task = process_project_files_fanout.delay(
+            project_id=project_id,
+            chunk_size=chunk_size,
+            overlap_size=overlap_size,
+            do_reset=do_reset,
+            separator=process_request.separator,
+            push_after=0,
+            incremental=process_request.incremental,
+        )
+
+        return JSONResponse(
+            content={
+                "signal": ResponseStatus.FILE_PROCESSING_SUCCESS.value,
+                "task_id": task.id
+            }
+        )
+
     task = process_project_files.delay(
         project_id=project_id,
         file_id=process_request.file_id,
         chunk_size=chunk_size,
         overlap_size=overlap_size,
         do_reset=do_reset,
+        separator=process_request.separator,
+        incremental=process_request.incremental,
     )
 
     return JSONResponse(
@@ -101,12 +122,33 @@ async def process_and_push_endpoint(request: Request, project_id: int, process_r
     overlap_size = process_request.overlap_size
     do_reset = process_request.do_reset
 
+    if process_request.fan_out and not process_request.file_id:
+        # indexing is triggered by the chord callback once every group is done
+        workflow_task = process_project_files_fanout.delay(
+            project_id=project_id,
+            chunk_size=chunk_size,
+            overlap_size=overlap_size,
+            do_reset=do_reset,
+            separator=process_request.separator,
+            push_after=1,
+            incremental=process_request.incremental,
+        )
+
+        return JSONResponse(
+            content={
+                "message": ResponseStatus.PROCESS_AND_PUSH_WORKFLOW_STARTED.value,
+                "task_id": workflow_task.id
+            }
+        )
+
     workflow_task = process_and_push_workflow.delay(
         project_id=project_id,
         file_id=process_request.file_id,
         chunk_size=chunk_size,
         overlap_size=overlap_size,
-        do_reset=do_reset
+        do_reset=do_reset,
+        separator=process_request.separator,
+        incremental=process_request.incremental
     )
 
     return JSONResponse(
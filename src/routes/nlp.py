@@ -1,13 +1,17 @@
 from fastapi import APIRouter, status, Request
-from fastapi.responses import JSONResponse
-from routes.schemas.nlp import PushRequest, SearchRequest
+from fastapi.responses import JSONResponse, StreamingResponse
+from routes.schemas.nlp import PushRequest, SearchRequest, BatchSearchRequest, SearchProfileRequest
 from models.ProjectModel import ProjectModel
 from models.ChunkModel import ChunkModel
+from models.RagAnswerCacheModel import RagAnswerCacheModel
+from helpers.config import get_settings
 from controllers import NLPController
 from models import ResponseStatus
 import logging
+import json
 from tqdm.auto import tqdm
-from tasks.data_indexing import index_data_content
+from tasks.data_indexing import index_data_content, upgrade_text_search_index
+from tasks.maintenance import backfill_asset_ids
 
 logger = logging.getLogger("uvicorn.error")
 
@@ -16,10 +20,17 @@ nlp_router = APIRouter(
     tags=["api_v1", "nlp"],
 )
 
+def get_search_filters(search_request):
+    # the providers take plain dicts, unset filter fields are left out
+    if search_request.filters is None:
+        return None
+    return search_request.filters.model_dump(exclude_none=True) or None
+
 @nlp_router.post("/index/push/{project_id}")
 async def index_project(request: Request, project_id: int, push_request: PushRequest):
 
-    task = index_data_content.delay(project_id=project_id, do_reset=push_request.do_reset)
+    task = index_data_content.delay(project_id=project_id, do_reset=push_request.do_reset,
+                                    collection_options=push_request.collection_options)
 
     return JSONResponse(
         content={
@@ -28,6 +39,33 @@ async def index_project(request: Request, project_id: int, push_request: PushReq
             }
     )
 
+@nlp_router.post("/index/text-search/{project_id}")
+async def upgrade_project_text_search(request: Request, project_id: int):
+
+    # adds the full text search column to a collection created before hybrid search,
+    # the table is locked while it is rewritten, so run it in a maintenance window
+    task = upgrade_text_search_index.delay(project_id=project_id)
+
+    return JSONResponse(
+        content={
+            "message": ResponseStatus.TEXT_SEARCH_UPGRADE_STARTED.value,
+            "task_id": task.id
+            }
+    )
+
+@nlp_router.post("/index/asset-ids/{project_id}")
+async def backfill_project_asset_ids(request: Request, project_id: int):
+
+    # points pushed before asset filters existed carry no asset_id in their payload
+    task = backfill_asset_ids.delay(project_id=project_id)
+
+    return JSONResponse(
+        content={
+            "message": ResponseStatus.ASSET_IDS_BACKFILL_STARTED.value,
+            "task_id": task.id
+            }
+    )
+
 @nlp_router.get("/index/info/{project_id}")
 async def get_project_index_info(request: Request, project_id: int):
 
@@ -50,6 +88,26 @@ async def get_project_index_info(request: Request, project_id: int):
                  "collection_info": collection_info}
     )
 
+@nlp_router.post("/index/profile/{project_id}")
+async def set_project_search_profile(request: Request, project_id: int, profile_request: SearchProfileRequest):
+
+    # an empty profile resets the project to the deployment default,
+    # unknown profiles are rejected by the request schema
+    project_model = await ProjectModel.create_instance(request.app.db_client)
+
+    project = await project_model.get_project_or_create_one(project_id)
+
+    search_profile = await project_model.set_search_profile(
+        project_id=project.project_id,
+        search_profile=profile_request.search_profile
+    )
+
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={"message": ResponseStatus.VECTORDB_SEARCH_PROFILE_UPDATED.value,
+                 "search_profile": search_profile}
+    )
+
 @nlp_router.post("/index/search/{project_id}")
 async def search_index(request: Request, project_id: int, search_request: SearchRequest):
 
@@ -61,13 +119,17 @@ async def search_index(request: Request, project_id: int, search_request: Search
         vector_db_client=request.app.vector_db_client,
         generation_client=request.app.generation_client,
         embedding_client=request.app.embedding_client,
-        template_parser=request.app.template_parser
+        template_parser=request.app.template_parser,
+        query_embedding_cache=request.app.query_embedding_cache
     )
 
     results = await nlp_controller.search_vector_db_collection(
         project=project,
         text=search_request.text,
-        limit=search_request.limit
+        limit=search_request.limit,
+        search_mode=search_request.search_mode,
+        filters=get_search_filters(search_request),
+        search_profile=search_request.search_profile
     )
 
     if not results:
@@ -83,24 +145,84 @@ async def search_index(request: Request, project_id: int, search_request: Search
     )
 
 
+@nlp_router.post("/index/search/batch/{project_id}")
+async def search_index_batch(request: Request, project_id: int, search_request: BatchSearchRequest):
+
+    settings = get_settings()
+
+    if len(search_request.texts) > settings.SEARCH_BATCH_MAX_QUERIES:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"message": ResponseStatus.VECTORDB_BATCH_SEARCH_TOO_LARGE.value,
+                     "max_queries": settings.SEARCH_BATCH_MAX_QUERIES}
+        )
+
+    project_model = await ProjectModel.create_instance(request.app.db_client)
+    
+    project = await project_model.get_project_or_create_one(project_id)
+    
+    nlp_controller = NLPController(
+        vector_db_client=request.app.vector_db_client,
+        generation_client=request.app.generation_client,
+        embedding_client=request.app.embedding_client,
+        template_parser=request.app.template_parser,
+        query_embedding_cache=request.app.query_embedding_cache
+    )
+
+    results = await nlp_controller.search_vector_db_collection_batch(
+        project=project,
+        texts=search_request.texts,
+        limit=search_request.limit,
+        filters=get_search_filters(search_request),
+        search_profile=search_request.search_profile
+    )
+
+    if results is False:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"message": ResponseStatus.VECTORDB_SEARCH_ERROR.value}
+        )
+    
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={"message": ResponseStatus.VECTORDB_SEARCH_SUCCESS.value,
+                "results": [
+                    {"text": text, "results": [r.__dict__ for r in query_results]}
+                    for text, query_results in zip(search_request.texts, results)
+                ]}
+    )
+
 @nlp_router.post("/index/answer/{project_id}")
 async def search_index(request: Request, project_id: int, search_request: SearchRequest):
 
+    settings = get_settings()
+
     project_model = await ProjectModel.create_instance(request.app.db_client)
     
     project = await project_model.get_project_or_create_one(project_id)
+
+    answer_cache = None
+    if settings.RAG_ANSWER_CACHE_ENABLED:
+        answer_cache = await RagAnswerCacheModel.create_instance(request.app.db_client)
     
     nlp_controller = NLPController(
         vector_db_client=request.app.vector_db_client,
         generation_client=request.app.generation_client,
         embedding_client=request.app.embedding_client,
-        template_parser=request.app.template_parser
+        template_parser=request.app.template_parser,
+        query_embedding_cache=request.app.query_embedding_cache,
+        answer_cache=answer_cache,
+        answer_cache_ttl=settings.RAG_ANSWER_CACHE_TTL_SECONDS,
+        semantic_answer_cache=request.app.semantic_answer_cache
     )
 
-    answer, full_prompt, chat_history = await nlp_controller.answer_rag_query(
+    answer, full_prompt, chat_history, semantic_match = await nlp_controller.answer_rag_query(
         project=project,
         query=search_request.text,
-        limit=search_request.limit
+        limit=search_request.limit,
+        search_mode=search_request.search_mode,
+        filters=get_search_filters(search_request),
+        search_profile=search_request.search_profile
     )
 
     if not answer:
@@ -114,5 +236,65 @@ async def search_index(request: Request, project_id: int, search_request: Search
         content={"message": ResponseStatus.RAG_ANSWER_GENERATION_SUCCESS.value,
                 "answer": answer,
                 "full_prompt": full_prompt,
-                "chat_history": chat_history}
+                "chat_history": chat_history,
+                "semantic_match": semantic_match}
+    )
+
+
+def format_sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+@nlp_router.post("/index/answer/stream/{project_id}")
+async def stream_answer(request: Request, project_id: int, search_request: SearchRequest):
+
+    project_model = await ProjectModel.create_instance(request.app.db_client)
+    
+    project = await project_model.get_project_or_create_one(project_id)
+    
+    nlp_controller = NLPController(
+        vector_db_client=request.app.vector_db_client,
+        generation_client=request.app.generation_client,
+        embedding_client=request.app.embedding_client,
+        template_parser=request.app.template_parser,
+        query_embedding_cache=request.app.query_embedding_cache
+    )
+
+    retrieved_docs, tokens = await nlp_controller.answer_rag_query_stream(
+        project=project,
+        query=search_request.text,
+        limit=search_request.limit,
+        search_mode=search_request.search_mode,
+        filters=get_search_filters(search_request),
+        search_profile=search_request.search_profile
+    )
+
+    if not retrieved_docs:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"message": ResponseStatus.VECTORDB_SEARCH_ERROR.value}
+        )
+
+    async def event_stream():
+        # retrieval results go out first, then each generated token as it arrives
+        yield format_sse("documents", [doc.__dict__ for doc in retrieved_docs])
+
+        try:
+            async for token in tokens:
+                if await request.is_disconnected():
+                    break
+                yield format_sse("token", token)
+        except Exception as e:
+            logger.error(f"Error while streaming answer: {e}")
+            yield format_sse("error", {"message": ResponseStatus.RAG_ANSWER_GENERATION_FAILED.value})
+            return
+        finally:
+            # releases the upstream LLM response back to the shared pool right away
+            await tokens.aclose()
+
+        yield format_sse("done", {"message": ResponseStatus.RAG_ANSWER_GENERATION_SUCCESS.value})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
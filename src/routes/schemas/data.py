@@ -1,9 +1,16 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
+from models import ChunkSeparatorEnums
 
 class ProcessRequest(BaseModel):
+    # invalid separators are rejected with a 422 instead of failing (and retrying) the task;
+    # the plain value is kept so the request can be passed to Celery as is
+    model_config = ConfigDict(use_enum_values=True)
+
     file_id: str = None
     chunk_size: Optional[int] = 100
     overlap_size: Optional[int] = 20
     do_reset : Optional[int] = 0
-    
\ No newline at end of file
+    separator: ChunkSeparatorEnums = ChunkSeparatorEnums.NEWLINE.value
+    fan_out: Optional[int] = 0
+    incremental: Optional[int] = 0
@@ -1,9 +1,36 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, List
+from stores.vectordb.VectorDBEnums import SearchModeEnums, SearchProfileEnums
 
 class PushRequest(BaseModel):
     do_reset : Optional[int] = 0
+    collection_options : Optional[dict] = None
+
+class SearchFilters(BaseModel):
+    asset_ids : Optional[List[int]] = None
+    page_start : Optional[int] = None
+    page_end : Optional[int] = None
+    metadata : Optional[dict] = None
 
 class SearchRequest(BaseModel):
+    # unknown modes and profiles are rejected with a 422 instead of silently falling back
+    model_config = ConfigDict(use_enum_values=True)
+
     text : str
-    limit : Optional[int] = 5
\ No newline at end of file
+    limit : Optional[int] = 5
+    search_mode : Optional[SearchModeEnums] = None
+    search_profile : Optional[SearchProfileEnums] = None
+    filters : Optional[SearchFilters] = None
+
+class BatchSearchRequest(BaseModel):
+    model_config = ConfigDict(use_enum_values=True)
+
+    texts : List[str]
+    limit : Optional[int] = 5
+    search_profile : Optional[SearchProfileEnums] = None
+    filters : Optional[SearchFilters] = None
+
+class SearchProfileRequest(BaseModel):
+    model_config = ConfigDict(use_enum_values=True)
+
+    search_profile : Optional[SearchProfileEnums] = None
@@ -4,6 +4,7 @@ class LLMEnums(Enum):
     OPENAI = "openai"
     COHERE = "cohere"
     GENAI = "genai"
+    LOCAL = "local"
 
 class OpenAIEnums(Enum):
     SYSTEM = "system"
@@ -18,6 +19,11 @@ class CoHereEnums(Enum):
     DOCUMENT = "search_document"
     QUERY = "search_query"
 
+class LocalEnums(Enum):
+    SYSTEM = "system"
+    USER = "user"
+    ASSISTANT = "assistant"
+
 class DocumentTypeEnums(Enum):
     DOCUMENT = "document"
     QUERY = "query"
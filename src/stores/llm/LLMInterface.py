@@ -18,6 +18,18 @@ class LLMInterface(ABC):
     def embed_text(self, text: str, document_type: str = None):
         pass
 
+    @abstractmethod
+    async def generate_text_async(self, prompt: str, chat_history: list = [], max_output_tokens: int = None, temperature: float = None):
+        pass
+
+    @abstractmethod
+    def generate_text_stream(self, prompt: str, chat_history: list = [], max_output_tokens: int = None, temperature: float = None):
+        pass
+
+    @abstractmethod
+    async def embed_text_async(self, text: str, document_type: str = None):
+        pass
+
     @abstractmethod
     def construct_prompt(self, prompt: str, role: str):
         pass
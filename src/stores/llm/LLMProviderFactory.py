@@ -1,9 +1,36 @@
 from .LLMEnums import LLMEnums
-from .providers import CoHereProvider, OpenAIProvider
+from .providers import CoHereProvider, OpenAIProvider, LocalProvider
+import httpx
+
+# one local provider per process and settings: it owns the loaded model and its batching
+# thread, and celery tasks build a new factory for every run
+_local_providers = {}
 
 class LLMProviderFactory:
     def __init__(self, config: dict):
         self.config = config
+        self.http_client = None
+
+    def get_http_client(self):
+        # one keep-alive pool shared by every provider created by this factory
+        if self.http_client is None:
+            self.http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.config.LLM_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=self.config.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=self.config.LLM_HTTP_KEEPALIVE_EXPIRY
+                ),
+                timeout=httpx.Timeout(
+                    self.config.LLM_HTTP_TIMEOUT,
+                    connect=self.config.LLM_HTTP_CONNECT_TIMEOUT
+                )
+            )
+        return self.http_client
+
+    async def close(self):
+        if self.http_client is not None:
+            await self.http_client.aclose()
+        self.http_client = None
 
     def create(self, provider: str):
         if provider == LLMEnums.OPENAI.value:
@@ -12,7 +39,8 @@ class LLMProviderFactory:
                 base_url=self.config.OPENAI_BASE_URL,
                 defult_input_token=self.config.INPUT_MAX_TOKEN,
                 defult_generation_output_token=self.config.GENERATION_MAX_TOKEN,
-                defult_generation_temperature=self.config.GENERATION_TEMPERATURE
+                defult_generation_temperature=self.config.GENERATION_TEMPERATURE,
+                http_client=self.get_http_client()
             )
 
         if provider == LLMEnums.COHERE.value:
@@ -20,8 +48,23 @@ class LLMProviderFactory:
                 api_key=self.config.COHERE_API_KEY,
                 defult_input_token=self.config.INPUT_MAX_TOKEN,
                 defult_generation_output_token=self.config.GENERATION_MAX_TOKEN,
-                defult_generation_temperature=self.config.GENERATION_TEMPERATURE
-                
+                defult_generation_temperature=self.config.GENERATION_TEMPERATURE,
+                http_client=self.get_http_client()
                 )
+
+        if provider == LLMEnums.LOCAL.value:
+            local_provider_args = {
+                "device": self.config.LOCAL_EMBEDDING_DEVICE,
+                "num_threads": self.config.LOCAL_EMBEDDING_THREADS,
+                "max_batch_size": self.config.LOCAL_EMBEDDING_MAX_BATCH_SIZE,
+                "max_wait_ms": self.config.LOCAL_EMBEDDING_MAX_WAIT_MS,
+                "query_prefix": self.config.LOCAL_EMBEDDING_QUERY_PREFIX,
+                "document_prefix": self.config.LOCAL_EMBEDDING_DOCUMENT_PREFIX,
+                "defult_input_token": self.config.INPUT_MAX_TOKEN,
+            }
+            cache_key = tuple(sorted(local_provider_args.items()))
+            if cache_key not in _local_providers:
+                _local_providers[cache_key] = LocalProvider(**local_provider_args)
+            return _local_providers[cache_key]
     
         return None
\ No newline at end of file
@@ -2,13 +2,16 @@ from ..LLMInterface import LLMInterface
 from ..LLMEnums import CoHereEnums, DocumentTypeEnums
 import logging
 import cohere
+import httpx
+from contextlib import aclosing
 from typing import List, Union
 
 class CoHereProvider(LLMInterface):
     def __init__(self, api_key: str,
                  defult_input_token: int = 1000,
                  defult_generation_output_token: int = 1000,
-                 defult_generation_temperature: float = 0.1):
+                 defult_generation_temperature: float = 0.1,
+                 http_client: httpx.AsyncClient = None):
         
         self.api_key = api_key
 
@@ -23,6 +26,9 @@ class CoHereProvider(LLMInterface):
 
         self.client = cohere.Client(self.api_key)
 
+        # async requests go through the process wide keep-alive pool
+        self.async_client = cohere.AsyncClient(self.api_key, httpx_client=http_client)
+
         self.enums = CoHereEnums
         self.logger = logging.getLogger(__name__)
 
@@ -36,33 +42,85 @@ class CoHereProvider(LLMInterface):
     def get_proccessed_text(self, text: str):
         return text[:self.defult_input_token].strip()
     
-    def generate_text(self, prompt: str,chat_history: list = None, max_output_tokens: int = None, temperature: float = None):
-        if not self.client:
-            return None
-        
-        if not self.generation_model_id:
-            return None
-        
+    def get_generation_args(self, prompt: str, chat_history: list = None, max_output_tokens: int = None, temperature: float = None):
         max_output_tokens = max_output_tokens if max_output_tokens else self.defult_generation_output_token
         temperature = temperature if temperature is not None else self.defult_generation_temperature
 
         chat_history = list(chat_history) if chat_history is not None else []
         chat_history.append(self.construct_prompt(prompt, CoHereEnums.USER.value))
 
-        response = self.client.chat(
-            model=self.generation_model_id,
-            message=self.get_proccessed_text(prompt),
-            chat_history=chat_history,
-            temperature=temperature,
-            max_tokens=max_output_tokens
-        )
+        return {
+            "model": self.generation_model_id,
+            "message": self.get_proccessed_text(prompt),
+            "chat_history": chat_history,
+            "temperature": temperature,
+            "max_tokens": max_output_tokens
+        }
 
+    def get_generated_text(self, response):
         if not response or not response.text:
             self.logger.error("Invalid response from Cohere API.")
             return None
         
         return response.text
-      
+
+    def get_embedding_args(self, text: List[str], document_type: str = None):
+        input_type = CoHereEnums.DOCUMENT.value 
+        if document_type == DocumentTypeEnums.QUERY.value:
+            input_type = CoHereEnums.QUERY.value
+
+        return {
+            "texts": [self.get_proccessed_text(t) for t in text],
+            "model": self.embedding_model_id,
+            "input_type": input_type,
+            "embedding_types": ["float"]
+        }
+
+    def get_embeddings(self, response):
+        if not response or not response.embeddings or not response.embeddings.float:
+            self.logger.error("Invalid embedding response from Cohere API.")
+            return None
+        
+        return [f for f in response.embeddings.float]
+    
+    def generate_text(self, prompt: str,chat_history: list = None, max_output_tokens: int = None, temperature: float = None):
+        if not self.client:
+            return None
+        
+        if not self.generation_model_id:
+            return None
+
+        response = self.client.chat(
+            **self.get_generation_args(prompt, chat_history, max_output_tokens, temperature)
+        )
+
+        return self.get_generated_text(response)
+
+    async def generate_text_async(self, prompt: str,chat_history: list = None, max_output_tokens: int = None, temperature: float = None):
+        if not self.async_client:
+            return None
+        
+        if not self.generation_model_id:
+            return None
+
+        response = await self.async_client.chat(
+            **self.get_generation_args(prompt, chat_history, max_output_tokens, temperature)
+        )
+
+        return self.get_generated_text(response)
+
+
+    async def generate_text_stream(self, prompt: str,chat_history: list = None, max_output_tokens: int = None, temperature: float = None):
+        if not self.async_client or not self.generation_model_id:
+            return
+
+        # closing this generator closes the HTTP response as well
+        async with aclosing(self.async_client.chat_stream(
+            **self.get_generation_args(prompt, chat_history, max_output_tokens, temperature)
+        )) as events:
+            async for event in events:
+                if event.event_type == "text-generation" and event.text:
+                    yield event.text
     
     def embed_text(self, text: Union[str, List[str]], document_type: str = None):
         if not self.client:
@@ -73,23 +131,24 @@ class CoHereProvider(LLMInterface):
 
         if not self.embedding_model_id:
             return None
-        
-        input_type = CoHereEnums.DOCUMENT.value 
-        if document_type == DocumentTypeEnums.QUERY.value:
-            input_type = CoHereEnums.QUERY.value
 
-        response = self.client.embed(
-            texts=[self.get_proccessed_text(t) for t in text],
-            model=self.embedding_model_id,
-            input_type=input_type,
-            embedding_types=["float"]
-        )
+        response = self.client.embed(**self.get_embedding_args(text, document_type))
 
-        if not response or not response.embeddings or not response.embeddings.float:
-            self.logger.error("Invalid embedding response from Cohere API.")
+        return self.get_embeddings(response)
+
+    async def embed_text_async(self, text: Union[str, List[str]], document_type: str = None):
+        if not self.async_client:
             return None
-        
-        return [f for f in response.embeddings.float]
+
+        if isinstance(text, str):
+            text = [text]
+
+        if not self.embedding_model_id:
+            return None
+
+        response = await self.async_client.embed(**self.get_embedding_args(text, document_type))
+
+        return self.get_embeddings(response)
     
     def construct_prompt(self, prompt, role):
         return {
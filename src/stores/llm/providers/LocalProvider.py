@@ -0,0 +1,167 @@
+from ..LLMInterface import LLMInterface
+from ..LLMEnums import LocalEnums, DocumentTypeEnums
+from concurrent.futures import Future
+from typing import List, Union
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+
+class LocalProvider(LLMInterface):
+    """
+    Embedding-only provider running a sentence-transformers model on the local CPU.
+    Concurrent embed_text calls are merged into shared model batches by a single
+    batching thread, so many small query embeddings cost one forward pass.
+    """
+
+    def __init__(self, device: str = "cpu",
+                 num_threads: int = 0,
+                 max_batch_size: int = 64,
+                 max_wait_ms: int = 5,
+                 query_prefix: str = "",
+                 document_prefix: str = "",
+                 defult_input_token: int = 1000):
+
+        self.device = device
+        self.num_threads = num_threads if num_threads and num_threads > 0 else (os.cpu_count() or 1)
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_wait = max(max_wait_ms, 0) / 1000
+
+        self.prefixes = {
+            DocumentTypeEnums.QUERY.value: query_prefix or "",
+            DocumentTypeEnums.DOCUMENT.value: document_prefix or "",
+        }
+
+        self.defult_input_token = defult_input_token
+
+        self.generation_model_id = None
+
+        self.embedding_model_id = None
+        self.embedding_size = None
+
+        self.client = None
+        self.requests = queue.Queue()
+        self.batching_thread = None
+
+        self.enums = LocalEnums
+        self.logger = logging.getLogger(__name__)
+
+    def set_generation_model(self, model_id: str):
+        self.generation_model_id = model_id
+
+    def set_embedding_model(self, model_id: str, embedding_size: int):
+        # the provider is shared per process, keep the loaded model instead of loading a copy
+        if self.client is not None and self.embedding_model_id == model_id:
+            return
+
+        # optional dependency, only needed when EMBEDDING_BACKEND is local
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        torch.set_num_threads(self.num_threads)
+
+        self.client = SentenceTransformer(model_id, device=self.device)
+        self.embedding_model_id = model_id
+
+        model_size = self.client.get_sentence_embedding_dimension()
+        if embedding_size and model_size != embedding_size:
+            self.logger.warning(f"Embedding size {embedding_size} does not match "
+                                f"model {model_id} size {model_size}, using {model_size}")
+        self.embedding_size = model_size
+
+        if self.batching_thread is None:
+            self.batching_thread = threading.Thread(target=self.run_batching, daemon=True)
+            self.batching_thread.start()
+
+        self.logger.info(f"Local embedding model {model_id} loaded on {self.device} "
+                         f"with {self.num_threads} threads")
+
+    def get_proccessed_text(self, text: str):
+        return text[:self.defult_input_token].strip()
+
+    def generate_text(self, prompt: str, chat_history: list = None, max_output_tokens: int = None,
+                      temperature: float = None):
+        self.logger.error("Local provider does not support text generation.")
+        return None
+
+    async def generate_text_async(self, prompt: str, chat_history: list = None, max_output_tokens: int = None,
+                                  temperature: float = None):
+        return self.generate_text(prompt, chat_history, max_output_tokens, temperature)
+
+    async def generate_text_stream(self, prompt: str, chat_history: list = None, max_output_tokens: int = None,
+                                   temperature: float = None):
+        self.logger.error("Local provider does not support text generation.")
+        return
+        yield
+
+    async def embed_text_async(self, text: Union[str, List[str]], document_type: str = None):
+        # waits on the batching thread without blocking the event loop
+        return await asyncio.to_thread(self.embed_text, text, document_type)
+
+    def embed_text(self, text: Union[str, List[str]], document_type: str = None):
+        if not self.client:
+            return None
+
+        if isinstance(text, str):
+            text = [text]
+
+        if len(text) == 0:
+            return []
+
+        prefix = self.prefixes.get(document_type, self.prefixes[DocumentTypeEnums.DOCUMENT.value])
+        texts = [prefix + self.get_proccessed_text(t) for t in text]
+
+        future = Future()
+        self.requests.put((texts, future))
+
+        try:
+            return future.result()
+        except Exception as e:
+            self.logger.error(f"Error while embedding with local model: {e}")
+            return None
+
+    def run_batching(self):
+        while True:
+            pending = [self.requests.get()]
+            pending_count = len(pending[0][0])
+
+            # keep collecting requests until the batch is full or the wait window closes
+            deadline = time.monotonic() + self.max_wait
+            while pending_count < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    request = self.requests.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                pending.append(request)
+                pending_count += len(request[0])
+
+            texts = [t for request_texts, _ in pending for t in request_texts]
+
+            try:
+                vectors = self.client.encode(
+                    texts,
+                    batch_size=self.max_batch_size,
+                    normalize_embeddings=True,
+                    convert_to_numpy=True,
+                    show_progress_bar=False
+                )
+            except Exception as e:
+                for _, future in pending:
+                    future.set_exception(e)
+                continue
+
+            offset = 0
+            for request_texts, future in pending:
+                future.set_result(vectors[offset:offset + len(request_texts)].tolist())
+                offset += len(request_texts)
+
+    def construct_prompt(self, prompt: str, role: str):
+        return {
+            "role": role,
+            "content": prompt
+        }
@@ -1,5 +1,6 @@
 from ..LLMInterface import LLMInterface
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
+import httpx
 import logging
 from ..LLMEnums import OpenAIEnums
 from typing import List, Union
@@ -8,7 +9,8 @@ class OpenAIProvider(LLMInterface):
     def __init__(self, api_key: str, base_url: str = None,
                  defult_input_token: int = 1000,
                  defult_generation_output_token: int = 1000,
-                 defult_generation_temperature: float = 0.1):
+                 defult_generation_temperature: float = 0.1,
+                 http_client: httpx.AsyncClient = None):
         
         self.api_key = api_key
         self.base_url = base_url
@@ -27,6 +29,13 @@ class OpenAIProvider(LLMInterface):
             base_url=self.base_url if self.base_url and len(self.base_url) > 0 else None
             )
 
+        # async requests go through the process wide keep-alive pool
+        self.async_client = AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=self.base_url if self.base_url and len(self.base_url) > 0 else None,
+            http_client=http_client
+            )
+
         self.enums = OpenAIEnums
         self.logger = logging.getLogger(__name__)
 
@@ -42,32 +51,78 @@ class OpenAIProvider(LLMInterface):
     def get_proccessed_text(self, text: str):
         return text[:self.defult_input_token].strip()
     
+    def get_generation_args(self, prompt: str, chat_history: list = None, max_output_tokens: int = None, temperature: float = None):
+        max_output_tokens = max_output_tokens if max_output_tokens else self.defult_generation_output_token
+        temperature = temperature if temperature is not None else self.defult_generation_temperature
+
+        chat_history = list(chat_history) if chat_history is not None else []
+        chat_history.append(self.construct_prompt(prompt, OpenAIEnums.USER.value))
+
+        return {
+            "model": self.generation_model_id,
+            "messages": chat_history,
+            "max_tokens": max_output_tokens,
+            "temperature": temperature
+        }
+
+    def get_generated_text(self, response):
+        if not response or not response.choices or len(response.choices) == 0 or not response.choices[0].message:
+            self.logger.error("No response received from OpenAI.")
+            return None
+        
+        return response.choices[0].message.content
+
+    def get_embeddings(self, response):
+        if not response or len(response.data) == 0 or not response.data[0].embedding:
+            self.logger.error("No embedding data received from OpenAI.")
+            return None
+        
+        return [data.embedding for data in response.data]
+
     def generate_text(self, prompt: str,chat_history: list = None, max_output_tokens: int = None, temperature: float = None):
         if not self.client:
             return None
         
         if not self.generation_model_id:
             return None
-        
-        max_output_tokens = max_output_tokens if max_output_tokens else self.defult_generation_output_token
-        temperature = temperature if temperature is not None else self.defult_generation_temperature
-
-        chat_history = list(chat_history) if chat_history is not None else []
-        chat_history.append(self.construct_prompt(prompt, OpenAIEnums.USER.value))
 
         response = self.client.chat.completions.create(
-            model=self.generation_model_id,
-            messages=chat_history,
-            max_tokens=max_output_tokens,
-            temperature=temperature
+            **self.get_generation_args(prompt, chat_history, max_output_tokens, temperature)
         )
         
-        if not response or not response.choices or len(response.choices) == 0 or not response.choices[0].message:
-            self.logger.error("No response received from OpenAI.")
+        return self.get_generated_text(response)
+
+    async def generate_text_async(self, prompt: str,chat_history: list = None, max_output_tokens: int = None, temperature: float = None):
+        if not self.async_client:
             return None
         
-        return response.choices[0].message.content
-    
+        if not self.generation_model_id:
+            return None
+
+        response = await self.async_client.chat.completions.create(
+            **self.get_generation_args(prompt, chat_history, max_output_tokens, temperature)
+        )
+        
+        return self.get_generated_text(response)
+
+    async def generate_text_stream(self, prompt: str,chat_history: list = None, max_output_tokens: int = None, temperature: float = None):
+        if not self.async_client or not self.generation_model_id:
+            return
+
+        stream = await self.async_client.chat.completions.create(
+            **self.get_generation_args(prompt, chat_history, max_output_tokens, temperature),
+            stream=True
+        )
+
+        # closing this generator closes the HTTP response as well
+        async with stream:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+
+                delta = chunk.choices[0].delta
+                if delta and delta.content:
+                    yield delta.content
        
     def embed_text(self, text: Union[str, List[str]], document_type: str = None):
         if not self.client:
@@ -84,11 +139,24 @@ class OpenAIProvider(LLMInterface):
             model=self.embedding_model_id
         )
 
-        if not response or len(response.data) == 0 or not response.data[0].embedding:
-            self.logger.error("No embedding data received from OpenAI.")
+        return self.get_embeddings(response)
+
+    async def embed_text_async(self, text: Union[str, List[str]], document_type: str = None):
+        if not self.async_client:
             return None
         
-        return [data.embedding for data in response.data]
+        if isinstance(text, str):
+            text = [text]
+
+        if not self.embedding_model_id:
+            return None
+        
+        response = await self.async_client.embeddings.create(
+            input=text,
+            model=self.embedding_model_id
+        )
+
+        return self.get_embeddings(response)
     
     def construct_prompt(self, prompt: str, role: str):
         return {
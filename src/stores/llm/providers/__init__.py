@@ -1,2 +1,3 @@
 from .CoHereProvider import CoHereProvider
-from .OpenAIProvider import OpenAIProvider
\ No newline at end of file
+from .OpenAIProvider import OpenAIProvider
+from .LocalProvider import LocalProvider
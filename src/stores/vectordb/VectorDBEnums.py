@@ -14,12 +14,48 @@ class PgVectorTableSchemaEnums(Enum):
     VECTOR = "vector"
     CHUNK_ID = "chunk_id"
     METADATA = "metadata"
+    TEXT_SEARCH = "text_search"
     _PREFIX = "pgvector"
 
 class PgVectorDistanceMethodEnums(Enum):
     COSINE = "vector_cosine_ops"
     DOT = "vector_l2_ops"
 
+class PgTextSearchConfigEnums(Enum):
+    EN = "english"
+    AR = "arabic"
+
+class SearchModeEnums(Enum):
+    VECTOR = "vector"
+    HYBRID = "hybrid"
+
+class SearchProfileEnums(Enum):
+    FAST = "fast"
+    BALANCED = "balanced"
+    EXACT = "exact"
+
 class PgVectorIndexTypeEnums(Enum):
     IVFFLAT = "ivfflat"
-    HNSW = "hnsw"
\ No newline at end of file
+    HNSW = "hnsw"
+
+class PgVectorIterativeScanEnums(Enum):
+    OFF = "off"
+    STRICT_ORDER = "strict_order"
+    RELAXED_ORDER = "relaxed_order"
+
+class PgVectorStorageModeEnums(Enum):
+    VECTOR = "vector"
+    HALFVEC = "halfvec"
+    BIT = "bit"
+
+class PgHalfVecDistanceMethodEnums(Enum):
+    COSINE = "halfvec_cosine_ops"
+    DOT = "halfvec_l2_ops"
+
+class PgBitDistanceMethodEnums(Enum):
+    HAMMING = "bit_hamming_ops"
+
+class QdrantQuantizationEnums(Enum):
+    SCALAR = "scalar"
+    PRODUCT = "product"
+    BINARY = "binary"
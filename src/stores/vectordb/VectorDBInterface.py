@@ -31,7 +31,8 @@ class VectorDBInterface(ABC):
     @abstractmethod
     def create_collection(self, collection_name: str, 
                                 embedding_size: int, 
-                                do_reset: bool = False):
+                                do_reset: bool = False,
+                                collection_options: dict = None):
         pass
 
     @abstractmethod
@@ -52,5 +53,24 @@ class VectorDBInterface(ABC):
         pass
 
     @abstractmethod
-    def search_by_vector(self, collection_name: str,vector: list, limit: int) -> List[RetrievedDocument]:
+    def build_vector_index(self, collection_name: str):
+        pass
+
+    @abstractmethod
+    def delete_by_record_ids(self, collection_name: str, record_ids: list):
+        pass
+
+    @abstractmethod
+    def search_by_vector(self, collection_name: str,vector: list, limit: int,
+                         filters: dict = None, search_profile: str = None) -> List[RetrievedDocument]:
+        pass
+
+    @abstractmethod
+    def search_hybrid(self, collection_name: str, text: str, vector: list, limit: int,
+                      filters: dict = None, search_profile: str = None) -> List[RetrievedDocument]:
+        pass
+
+    @abstractmethod
+    def search_by_vectors(self, collection_name: str, vectors: list, limit: int,
+                          filters: dict = None, search_profile: str = None) -> List[List[RetrievedDocument]]:
         pass
\ No newline at end of file
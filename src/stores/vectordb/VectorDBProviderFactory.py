@@ -1,5 +1,5 @@
 from .providers import QdrantDBProvider, PGVectorProvider
-from .VectorDBEnums import VectorDBEnums
+from .VectorDBEnums import VectorDBEnums, PgTextSearchConfigEnums, SearchProfileEnums
 from controllers.BaseController import BaseController
 from sqlalchemy.orm import sessionmaker
 
@@ -16,7 +16,24 @@ class VectorDBProviderFactory:
             return QdrantDBProvider(
                 db_client=qdrant_db_client,
                 distance_method = self.config.VECTOR_DB_DISTANCE_METHOD,
-                index_threshold = self.config.VECTOR_DB_PGVEC_INDEX_THRESHOLD
+                index_threshold = self.config.VECTOR_DB_PGVEC_INDEX_THRESHOLD,
+                url = self.config.VECTOR_DB_URL,
+                api_key = self.config.VECTOR_DB_API_KEY,
+                prefer_grpc = self.config.VECTOR_DB_PREFER_GRPC,
+                grpc_port = self.config.VECTOR_DB_GRPC_PORT,
+                timeout = self.config.VECTOR_DB_TIMEOUT,
+                pool_size = self.config.VECTOR_DB_POOL_SIZE,
+                upload_parallel = self.config.VECTOR_DB_UPLOAD_PARALLEL,
+                collection_options = {
+                    "on_disk": self.config.VECTOR_DB_QDRANT_ON_DISK,
+                    "hnsw_on_disk": self.config.VECTOR_DB_QDRANT_HNSW_ON_DISK,
+                    "quantization": self.config.VECTOR_DB_QDRANT_QUANTIZATION,
+                    "always_ram": self.config.VECTOR_DB_QDRANT_QUANTIZATION_ALWAYS_RAM,
+                    "rescore": self.config.VECTOR_DB_QDRANT_RESCORE,
+                    "oversampling": self.config.VECTOR_DB_QDRANT_OVERSAMPLING,
+                },
+                hybrid_candidates_factor = self.config.VECTOR_DB_HYBRID_CANDIDATES_FACTOR,
+                search_profiles = self.get_search_profiles()
             )
         
         if provider == VectorDBEnums.PGVECTOR.value:
@@ -24,7 +41,41 @@ class VectorDBProviderFactory:
                 db_client=self.db_client,
                 default_vector_size = self.config.EMBEDDING_MODEL_SIZE,
                 distance_method = self.config.VECTOR_DB_DISTANCE_METHOD,
-                index_threshold = self.config.VECTOR_DB_PGVEC_INDEX_THRESHOLD
+                index_type = self.config.VECTOR_DB_PGVEC_INDEX_TYPE,
+                index_threshold = self.config.VECTOR_DB_PGVEC_INDEX_THRESHOLD,
+                bulk_load = self.config.VECTOR_DB_PGVEC_BULK_LOAD,
+                maintenance_work_mem = self.config.VECTOR_DB_PGVEC_MAINTENANCE_WORK_MEM,
+                max_parallel_maintenance_workers = self.config.VECTOR_DB_PGVEC_MAX_PARALLEL_WORKERS,
+                storage_mode = self.config.VECTOR_DB_PGVEC_STORAGE_MODE,
+                rescore_factor = self.config.VECTOR_DB_PGVEC_RESCORE_FACTOR,
+                text_search_config = self.get_text_search_config(),
+                hybrid_rrf_k = self.config.VECTOR_DB_HYBRID_RRF_K,
+                hybrid_candidates_factor = self.config.VECTOR_DB_HYBRID_CANDIDATES_FACTOR,
+                iterative_scan = self.config.VECTOR_DB_PGVEC_ITERATIVE_SCAN,
+                search_profiles = self.get_search_profiles(),
+                exact_search_threshold = self.config.VECTOR_DB_EXACT_SEARCH_THRESHOLD
             )
 
-        return None
\ No newline at end of file
+        return None
+
+    def get_text_search_config(self):
+        if self.config.VECTOR_DB_PGVEC_TEXT_SEARCH_CONFIG:
+            return self.config.VECTOR_DB_PGVEC_TEXT_SEARCH_CONFIG
+
+        # follow the primary language, unknown languages are only lowercased
+        language = (self.config.PRIMARY_LANGUAGE or "").upper()
+        if language in PgTextSearchConfigEnums.__members__:
+            return PgTextSearchConfigEnums[language].value
+        return "simple"
+
+    def get_search_profiles(self):
+        return {
+            SearchProfileEnums.FAST.value: {
+                "ef_search": self.config.VECTOR_DB_FAST_EF_SEARCH,
+                "probes": self.config.VECTOR_DB_PGVEC_FAST_PROBES,
+            },
+            SearchProfileEnums.BALANCED.value: {
+                "ef_search": self.config.VECTOR_DB_BALANCED_EF_SEARCH,
+                "probes": self.config.VECTOR_DB_PGVEC_BALANCED_PROBES,
+            },
+        }
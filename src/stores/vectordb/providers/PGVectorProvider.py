@@ -1,33 +1,86 @@
 from ..VectorDBInterface import VectorDBInterface
 from ..VectorDBEnums import (PgVectorDistanceMethodEnums, PgVectorTableSchemaEnums,
-                             PgVectorIndexTypeEnums, DistanceMethodEnums)
+                             PgVectorIndexTypeEnums, DistanceMethodEnums,
+                             PgVectorStorageModeEnums, PgHalfVecDistanceMethodEnums,
+                             PgBitDistanceMethodEnums, PgVectorIterativeScanEnums,
+                             SearchProfileEnums)
 from models.db_schemas import RetrievedDocument
 from typing import List
 import logging
 from sqlalchemy.sql import text as sql_text
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy import event
+from pgvector.asyncpg import register_vector
+import numpy as np
 import json
+import math
 
 class PGVectorProvider(VectorDBInterface):
     def __init__(self, db_client, default_vector_size: int=786,
                  distance_method: str = None,
-                 index_type: str = None, index_threshold: int = 100):
+                 index_type: str = None, index_threshold: int = 100,
+                 bulk_load: bool = False,
+                 maintenance_work_mem: str = None,
+                 max_parallel_maintenance_workers: int = None,
+                 storage_mode: str = None, rescore_factor: int = 4,
+                 text_search_config: str = "simple",
+                 hybrid_rrf_k: int = 60, hybrid_candidates_factor: int = 4,
+                 iterative_scan: str = None,
+                 search_profiles: dict = None, exact_search_threshold: int = 0):
         
         self.db_client = db_client
+        self.logger = logging.getLogger("uvicorn")
         self.default_vector_size = default_vector_size
-        self.index_type = index_type
+        self.index_type = index_type or PgVectorIndexTypeEnums.HNSW.value
         self.index_threshold = index_threshold
 
+        # bulk load: no index maintenance on insert, the index is built once afterwards
+        self.bulk_load = bulk_load
+        self.maintenance_work_mem = maintenance_work_mem
+        self.max_parallel_maintenance_workers = max_parallel_maintenance_workers
+
+        # compact storage modes index a halfvec/bit projection and rescore exactly
+        self.storage_mode = storage_mode or PgVectorStorageModeEnums.VECTOR.value
+        self.rescore_factor = max(rescore_factor, 1)
+
+        # hybrid search fuses vector and full text ranks with reciprocal rank fusion
+        self.text_search_config = text_search_config if (text_search_config or "").isidentifier() else "simple"
+        self.hybrid_rrf_k = max(hybrid_rrf_k, 1)
+        self.hybrid_candidates_factor = max(hybrid_candidates_factor, 1)
+
+        # filtered ANN scans keep walking the index until enough rows pass the filter;
+        # an unknown mode would make every filtered search fail, it falls back to relaxed_order
+        self.iterative_scan = iterative_scan or PgVectorIterativeScanEnums.RELAXED_ORDER.value
+        if self.iterative_scan not in [mode.value for mode in PgVectorIterativeScanEnums]:
+            self.logger.warning(
+                f"Unsupported iterative scan mode: {self.iterative_scan}, "
+                f"using {PgVectorIterativeScanEnums.RELAXED_ORDER.value}"
+            )
+            self.iterative_scan = PgVectorIterativeScanEnums.RELAXED_ORDER.value
+
+        # recall/latency profiles: hnsw.ef_search and ivfflat.probes per profile,
+        # the exact profile (and collections under the threshold) bypass the ANN index
+        self.search_profiles = search_profiles or {
+            SearchProfileEnums.FAST.value: {"ef_search": 40, "probes": 1},
+            SearchProfileEnums.BALANCED.value: {"ef_search": 100, "probes": 10},
+        }
+        self.exact_search_threshold = exact_search_threshold
+
         if distance_method == DistanceMethodEnums.COSINE.value:
             self.distance_method = PgVectorDistanceMethodEnums.COSINE.value
+            self.halfvec_distance_method = PgHalfVecDistanceMethodEnums.COSINE.value
+            self.distance_operator = "<=>"
         elif distance_method == DistanceMethodEnums.DOT.value:
             self.distance_method = PgVectorDistanceMethodEnums.DOT.value
+            self.halfvec_distance_method = PgHalfVecDistanceMethodEnums.DOT.value
+            self.distance_operator = "<->"
 
         self.pgvector_table_prefix = PgVectorTableSchemaEnums._PREFIX.value
-        
-        self.logger = logging.getLogger("uvicorn")
 
         self.default_index_name = lambda collection_name: f"{collection_name}_vector_idx"
+        self.record_id_index_name = lambda collection_name: f"{collection_name}_chunk_id_uidx"
+        self.text_search_index_name = lambda collection_name: f"{collection_name}_text_search_idx"
+        self.metadata_index_name = lambda collection_name: f"{collection_name}_metadata_idx"
     
     async def connect(self):
         async with self.db_client() as session:
@@ -47,6 +100,21 @@ class PGVectorProvider(VectorDBInterface):
                 self.logger.warning(f"Vector extension setup: {str(e)}")
                 await session.rollback()
 
+        await self.register_vector_codec()
+
+    async def register_vector_codec(self):
+        # vectors travel in pgvector's binary format instead of '[..]' text
+        db_engine = self.db_client.kw["bind"]
+
+        if not event.contains(db_engine.sync_engine, "connect", on_connect_register_vector):
+            event.listen(db_engine.sync_engine, "connect", on_connect_register_vector)
+
+        # pooled connections were opened before the codec existed
+        await db_engine.dispose()
+
+    def to_vector(self, vector):
+        return np.asarray(vector, dtype=np.float32)
+
     async def disconnect(self):
         pass
 
@@ -91,8 +159,14 @@ class PGVectorProvider(VectorDBInterface):
 
                 if not table_data:
                     return None
+
+                index_info = await self.get_vector_index_info(collection_name=collection_name)
+                collection_options = await self.get_collection_options(collection_name=collection_name)
                 
                 return {
+                    "storage_mode": collection_options["storage_mode"],
+                    "collection_options": collection_options,
+                    "index_info": index_info,
                     "table_info": {
                         "schemaname": table_data[0],
                         "tablename": table_data[1],
@@ -111,11 +185,13 @@ class PGVectorProvider(VectorDBInterface):
                     f"DROP TABLE IF EXISTS {collection_name};"
                 ))
                 await session.commit()
+
         return True
     
     async def create_collection(self, collection_name: str, 
                                 embedding_size: int = None, 
-                                do_reset: bool = False):
+                                do_reset: bool = False,
+                                collection_options: dict = None):
         
         if do_reset:
             _ = await self.delete_collection(collection_name=collection_name)
@@ -123,6 +199,12 @@ class PGVectorProvider(VectorDBInterface):
         if embedding_size is None:
             embedding_size = self.default_vector_size
 
+        storage_mode = (collection_options or {}).get("storage_mode")
+        if storage_mode not in [mode.value for mode in PgVectorStorageModeEnums]:
+            if storage_mode is not None:
+                self.logger.warning(f"Unsupported storage mode: {storage_mode}, using {self.storage_mode}")
+            storage_mode = None
+
         if not await self.is_collection_exists(collection_name=collection_name):
             self.logger.info(f"Creating table {collection_name}")
             async with self.db_client() as session:
@@ -139,8 +221,372 @@ class PGVectorProvider(VectorDBInterface):
                     ''')
                     await session.execute(create_table_sql)
                     await session.commit()
+
+            await self.set_collection_options(collection_name=collection_name, collection_options={
+                "storage_mode": storage_mode or self.storage_mode,
+                "embedding_size": embedding_size,
+            })
+            await self.create_record_id_index(collection_name=collection_name)
+            await self.create_text_search_index(collection_name=collection_name)
+            await self.create_metadata_index(collection_name=collection_name)
             return True
+
+        current_options = await self.get_collection_options(collection_name=collection_name)
+        if storage_mode and storage_mode != current_options["storage_mode"]:
+            # the index is built over the old projection, rebuild it for the new mode
+            self.logger.info(f"Switching collection {collection_name} to {storage_mode} storage")
+            await self.set_collection_options(collection_name=collection_name, collection_options={
+                **current_options, "storage_mode": storage_mode,
+            })
+            await self.drop_vector_index(collection_name=collection_name)
+
+        # tables created before upserts were introduced have no unique chunk_id
+        # the text search column is not added here: it rewrites the whole table under an
+        # ACCESS EXCLUSIVE lock, existing tables are upgraded by the upgrade_text_search_index
+        # task and keep vector only search until then
+        await self.create_record_id_index(collection_name=collection_name)
+        await self.create_metadata_index(collection_name=collection_name)
         return False
+
+    async def set_collection_options(self, collection_name: str, collection_options: dict):
+        # options live in the table comment, so they follow the table and need no extra schema
+        # COMMENT does not take bind parameters, the options are escaped as a literal
+        options_literal = json.dumps(collection_options).replace("'", "''")
+        async with self.db_client() as session:
+            async with session.begin():
+                await session.execute(sql_text(
+                    f"COMMENT ON TABLE {collection_name} IS '{options_literal}';"
+                ))
+
+    def get_collection_state_sql(self, collection_name: str) -> str:
+        # options, vector dimension and the planner row estimate in one catalog lookup,
+        # no row at all when the table does not exist
+        return f'''
+            SELECT obj_description(to_regclass('{collection_name}'), 'pg_class') AS options,
+                   (SELECT atttypmod FROM pg_attribute
+                    WHERE attrelid = to_regclass('{collection_name}')
+                    AND attname = '{PgVectorTableSchemaEnums.VECTOR.value}') AS embedding_size,
+                   (SELECT reltuples FROM pg_class
+                    WHERE oid = to_regclass('{collection_name}')) AS estimated_count
+            WHERE to_regclass('{collection_name}') IS NOT NULL;
+        '''
+
+    def parse_collection_options(self, record) -> dict:
+        collection_options = {}
+        if record and record.options:
+            try:
+                collection_options = json.loads(record.options)
+            except ValueError:
+                collection_options = {}
+
+        # collections created before storage modes hold full precision vectors
+        collection_options.setdefault("storage_mode", PgVectorStorageModeEnums.VECTOR.value)
+        collection_options.setdefault("embedding_size", record.embedding_size if record else self.default_vector_size)
+
+        return collection_options
+
+    async def get_collection_options(self, collection_name: str) -> dict:
+        # read on every call: Celery workers reset and alter collections behind the API process,
+        # a per-process cache would keep building SQL for the old options
+        async with self.db_client() as session:
+            async with session.begin():
+                state_sql = sql_text(self.get_collection_state_sql(collection_name))
+                record = (await session.execute(state_sql)).fetchone()
+
+        return self.parse_collection_options(record)
+
+    async def get_search_state(self, session, collection_name: str):
+        """
+        Reads the collection options and the planner row estimate inside the search transaction.
+        Returns (None, -1) when the collection does not exist.
+        """
+        state_sql = sql_text(self.get_collection_state_sql(collection_name))
+        record = (await session.execute(state_sql)).fetchone()
+        if record is None:
+            return None, -1
+
+        # -1 before the first ANALYZE
+        estimated_count = int(record.estimated_count) if record.estimated_count is not None else -1
+        return self.parse_collection_options(record), estimated_count
+
+    def get_index_expression(self, collection_options: dict) -> str:
+        vector_column = PgVectorTableSchemaEnums.VECTOR.value
+        embedding_size = collection_options["embedding_size"]
+
+        if collection_options["storage_mode"] == PgVectorStorageModeEnums.HALFVEC.value:
+            return f"(({vector_column}::halfvec({embedding_size}))) {self.halfvec_distance_method}"
+
+        if collection_options["storage_mode"] == PgVectorStorageModeEnums.BIT.value:
+            return f"((binary_quantize({vector_column})::bit({embedding_size}))) {PgBitDistanceMethodEnums.HAMMING.value}"
+
+        return f"{vector_column} {self.distance_method}"
+
+    def build_filter_sql(self, filters: dict):
+        """
+        Translates search filters into SQL conditions and their bind parameters.
+        Supported keys: asset_ids, page_start, page_end and metadata (jsonb containment).
+        """
+        conditions, params = [], {}
+        if not filters:
+            return conditions, params
+
+        chunk_id_column = PgVectorTableSchemaEnums.CHUNK_ID.value
+        metadata_column = PgVectorTableSchemaEnums.METADATA.value
+
+        if filters.get("asset_ids"):
+            # resolved through the chunks table, so records indexed without asset_id still match
+            conditions.append(f'''{chunk_id_column} IN (
+                SELECT chunks.chunk_id FROM chunks WHERE chunks.chunk_asset_id = ANY(:filter_asset_ids)
+            )''')
+            params["filter_asset_ids"] = [int(asset_id) for asset_id in filters["asset_ids"]]
+
+        # a chunk matches a page range when the two ranges overlap
+        if filters.get("page_start") is not None:
+            conditions.append(f"CAST({metadata_column}->>'page_end' AS integer) >= :filter_page_start")
+            params["filter_page_start"] = int(filters["page_start"])
+
+        if filters.get("page_end") is not None:
+            conditions.append(f"CAST({metadata_column}->>'page_start' AS integer) <= :filter_page_end")
+            params["filter_page_end"] = int(filters["page_end"])
+
+        if filters.get("metadata"):
+            conditions.append(f"{metadata_column} @> CAST(:filter_metadata AS jsonb)")
+            params["filter_metadata"] = json.dumps(filters["metadata"], ensure_ascii=False)
+
+        return conditions, params
+
+    def get_search_settings(self, collection_options: dict, estimated_count: int,
+                            search_profile: str, limit: int, filtered: bool = False):
+        """
+        Transaction local settings for one search, and whether it has to run as an exact scan.
+        """
+        search_settings = {}
+
+        # filtered ANN scans keep walking the index until enough rows pass the filter
+        if filtered and self.iterative_scan != PgVectorIterativeScanEnums.OFF.value:
+            search_settings["hnsw.iterative_scan"] = self.iterative_scan
+            # ivfflat only knows relaxed ordering
+            search_settings["ivfflat.iterative_scan"] = PgVectorIterativeScanEnums.RELAXED_ORDER.value
+
+        if (search_profile != SearchProfileEnums.EXACT.value and self.exact_search_threshold
+                and 0 <= estimated_count < self.exact_search_threshold):
+            search_profile = SearchProfileEnums.EXACT.value
+
+        if search_profile == SearchProfileEnums.EXACT.value:
+            # full precision brute force, the planner can not pick the ANN index
+            search_settings["enable_indexscan"] = "off"
+            return search_settings, True
+
+        profile = self.search_profiles.get(search_profile,
+                                           self.search_profiles[SearchProfileEnums.BALANCED.value])
+
+        # the index has to produce every candidate the query asks for
+        candidates_count = int(limit)
+        if collection_options["storage_mode"] != PgVectorStorageModeEnums.VECTOR.value:
+            candidates_count *= self.rescore_factor
+
+        search_settings["hnsw.ef_search"] = min(max(int(profile["ef_search"]), candidates_count), 1000)
+        search_settings["ivfflat.probes"] = int(profile["probes"])
+        return search_settings, False
+
+    async def apply_search_settings(self, session, search_settings: dict):
+        # set_config(..., true) is SET LOCAL, every setting goes in a single round trip
+        if not search_settings:
+            return
+
+        select_sql = ", ".join([
+            f"set_config(:name_{idx}, :value_{idx}, true)" for idx in range(len(search_settings))
+        ])
+        params = {}
+        for idx, (name, value) in enumerate(search_settings.items()):
+            params[f"name_{idx}"] = name
+            params[f"value_{idx}"] = str(value)
+
+        await session.execute(sql_text(f"SELECT {select_sql};"), params)
+
+    def build_search_sql(self, collection_name: str, collection_options: dict, limit: int,
+                         query_vector_sql: str = "CAST(:vector AS vector)",
+                         filter_conditions: list = None, exact: bool = False) -> str:
+        # query_vector_sql lets batch searches plug in a lateral column instead of a parameter
+        id_column = PgVectorTableSchemaEnums.ID.value
+        vector_column = PgVectorTableSchemaEnums.VECTOR.value
+        text_column = PgVectorTableSchemaEnums.TEXT.value
+        embedding_size = collection_options["embedding_size"]
+        storage_mode = collection_options["storage_mode"]
+
+        score_sql = f"1 - ({vector_column} <=> {query_vector_sql})"
+        where_sql = f"WHERE {' AND '.join(filter_conditions)}" if filter_conditions else ""
+
+        if storage_mode == PgVectorStorageModeEnums.VECTOR.value or exact:
+            # ordering by the opclass operator (not the score alias) lets the planner use the index;
+            # the outer sort restores strict order after relaxed iterative scans
+            return f'''
+                SELECT id, text, score FROM (
+                    SELECT 
+                        {id_column} as id,
+                        {text_column} as text,
+                        {score_sql} as score
+                    FROM {collection_name}
+                    {where_sql}
+                    ORDER BY {vector_column} {self.distance_operator} {query_vector_sql}
+                    LIMIT {int(limit)}
+                ) nearest
+                ORDER BY score DESC
+            '''
+
+        # the coarse ORDER BY matches the index expression, so the ANN index is used
+        if storage_mode == PgVectorStorageModeEnums.HALFVEC.value:
+            coarse_order_sql = (f"({vector_column}::halfvec({embedding_size})) {self.distance_operator} "
+                                f"CAST({query_vector_sql} AS halfvec({embedding_size}))")
+        else:
+            coarse_order_sql = (f"(binary_quantize({vector_column})::bit({embedding_size})) <~> "
+                                f"CAST(binary_quantize({query_vector_sql}) AS bit({embedding_size}))")
+
+        candidates_count = int(limit) * self.rescore_factor
+
+        return f'''
+            SELECT id, text, score FROM (
+                SELECT 
+                    {id_column} as id,
+                    {text_column} as text,
+                    {score_sql} as score
+                FROM (
+                    SELECT {id_column}, {text_column}, {vector_column}
+                    FROM {collection_name}
+                    {where_sql}
+                    ORDER BY {coarse_order_sql}
+                    LIMIT {candidates_count}
+                ) candidates
+            ) rescored
+            ORDER BY score DESC
+            LIMIT {int(limit)}
+        '''
+
+    def build_hybrid_search_sql(self, collection_name: str, collection_options: dict, limit: int,
+                                filter_conditions: list = None, exact: bool = False) -> str:
+        # both candidate lists come from their own index, the fusion happens in the same query
+        id_column = PgVectorTableSchemaEnums.ID.value
+        text_column = PgVectorTableSchemaEnums.TEXT.value
+        text_search_column = PgVectorTableSchemaEnums.TEXT_SEARCH.value
+        text_search_config = collection_options["text_search_config"]
+
+        candidates_count = int(limit) * self.hybrid_candidates_factor
+        semantic_sql = self.build_search_sql(
+            collection_name=collection_name,
+            collection_options=collection_options,
+            limit=candidates_count,
+            filter_conditions=filter_conditions,
+            exact=exact
+        )
+        lexical_where_sql = " AND ".join([f"{text_search_column} @@ query", *(filter_conditions or [])])
+
+        return f'''
+            WITH semantic AS (
+                SELECT id, text, ROW_NUMBER() OVER (ORDER BY score DESC) AS rank
+                FROM ({semantic_sql}) semantic_results
+            ),
+            lexical AS (
+                SELECT 
+                    {id_column} as id,
+                    {text_column} as text,
+                    ROW_NUMBER() OVER (ORDER BY ts_rank_cd({text_search_column}, query) DESC) AS rank
+                FROM {collection_name},
+                     websearch_to_tsquery('{text_search_config}', :query_text) query
+                WHERE {lexical_where_sql}
+                ORDER BY rank
+                LIMIT {candidates_count}
+            )
+            SELECT 
+                COALESCE(semantic.text, lexical.text) as text,
+                COALESCE(1.0 / ({self.hybrid_rrf_k} + semantic.rank), 0.0)
+                    + COALESCE(1.0 / ({self.hybrid_rrf_k} + lexical.rank), 0.0) as score
+            FROM semantic
+            FULL OUTER JOIN lexical ON semantic.id = lexical.id
+            ORDER BY score DESC
+            LIMIT {int(limit)}
+        '''
+
+    async def create_text_search_index(self, collection_name: str):
+        collection_options = await self.get_collection_options(collection_name=collection_name)
+        if collection_options.get("text_search_config"):
+            return False
+
+        text_search_column = PgVectorTableSchemaEnums.TEXT_SEARCH.value
+        index_name = self.text_search_index_name(collection_name)
+
+        self.logger.info(f"Creating full text search index for collection {collection_name}...")
+        async with self.db_client() as session:
+            async with session.begin():
+                # a stored generated column keeps the tsvector in sync with every upsert
+                add_column_sql = sql_text(f'''
+                    ALTER TABLE {collection_name}
+                    ADD COLUMN IF NOT EXISTS {text_search_column} tsvector
+                    GENERATED ALWAYS AS (
+                        to_tsvector('{self.text_search_config}', coalesce({PgVectorTableSchemaEnums.TEXT.value}, ''))
+                    ) STORED;
+                ''')
+                create_index_sql = sql_text(f'''
+                    CREATE INDEX IF NOT EXISTS {index_name}
+                    ON {collection_name} USING gin ({text_search_column});
+                ''')
+                await session.execute(add_column_sql)
+                await session.execute(create_index_sql)
+
+        await self.set_collection_options(collection_name=collection_name, collection_options={
+            **collection_options, "text_search_config": self.text_search_config,
+        })
+        return True
+
+    async def create_metadata_index(self, collection_name: str):
+        collection_options = await self.get_collection_options(collection_name=collection_name)
+        if collection_options.get("metadata_index"):
+            return False
+
+        self.logger.info(f"Creating metadata index for collection {collection_name}...")
+        async with self.db_client() as session:
+            async with session.begin():
+                # jsonb_path_ops serves the @> containment filters with a smaller index
+                create_index_sql = sql_text(f'''
+                    CREATE INDEX IF NOT EXISTS {self.metadata_index_name(collection_name)}
+                    ON {collection_name} USING gin ({PgVectorTableSchemaEnums.METADATA.value} jsonb_path_ops);
+                ''')
+                await session.execute(create_index_sql)
+
+        await self.set_collection_options(collection_name=collection_name, collection_options={
+            **collection_options, "metadata_index": True,
+        })
+        return True
+
+    async def create_record_id_index(self, collection_name: str):
+        index_name = self.record_id_index_name(collection_name)
+        async with self.db_client() as session:
+            async with session.begin():
+                check_index_sql = sql_text(f'''
+                    SELECT 1
+                    FROM pg_indexes
+                    WHERE tablename = '{collection_name}'
+                    AND indexname = '{index_name}';
+                ''')
+                result = await session.execute(check_index_sql)
+                if result.scalar_one_or_none():
+                    return False
+
+                self.logger.info(f"Creating unique chunk_id index for collection {collection_name}...")
+
+                # keep the latest vector of each chunk left over by earlier retries
+                dedup_sql = sql_text(f'''
+                    DELETE FROM {collection_name} a
+                    USING {collection_name} b
+                    WHERE a.{PgVectorTableSchemaEnums.CHUNK_ID.value} = b.{PgVectorTableSchemaEnums.CHUNK_ID.value}
+                    AND a.{PgVectorTableSchemaEnums.ID.value} < b.{PgVectorTableSchemaEnums.ID.value};
+                ''')
+                create_index_sql = sql_text(f'''
+                    CREATE UNIQUE INDEX IF NOT EXISTS {index_name}
+                    ON {collection_name} ({PgVectorTableSchemaEnums.CHUNK_ID.value});
+                ''')
+                await session.execute(dedup_sql)
+                await session.execute(create_index_sql)
+        return True
     
     async def is_index_exists(self, collection_name: str) -> bool:
         index_name = self.default_index_name(collection_name)
@@ -156,12 +602,16 @@ class PGVectorProvider(VectorDBInterface):
                 return bool(result.scalar_one_or_none())
             
     async def create_vector_index(self, collection_name: str, 
-                                  index_type: str = PgVectorIndexTypeEnums.HNSW.value):
+                                  index_type: str = None):
+
+        index_type = index_type or self.index_type
 
         is_index_existed = await self.is_index_exists(collection_name=collection_name)
         if is_index_existed:
             return False  
 
+        collection_options = await self.get_collection_options(collection_name=collection_name)
+
         async with self.db_client() as session:
             async with session.begin():
                 count_sql = sql_text(f'''
@@ -179,21 +629,149 @@ class PGVectorProvider(VectorDBInterface):
                 create_index_sql = sql_text(f'''
                     CREATE INDEX {index_name}
                     ON {collection_name}
-                    USING {index_type} ({PgVectorTableSchemaEnums.VECTOR.value} {self.distance_method});
+                    USING {index_type} ({self.get_index_expression(collection_options)});
                 ''')
                 await session.execute(create_index_sql)
 
                 self.logger.info(f"Ending index creation for collection {collection_name}...")
 
+    def get_index_params(self, index_type: str, record_count: int) -> dict:
+        # build parameters follow the pgvector tuning guidelines for the row count
+        if index_type == PgVectorIndexTypeEnums.IVFFLAT.value:
+            if record_count <= 1_000_000:
+                lists = max(record_count // 1000, 1)
+            else:
+                lists = int(math.sqrt(record_count))
+            return {"lists": lists}
+
+        if record_count < 100_000:
+            return {"m": 16, "ef_construction": 64}
+        if record_count < 1_000_000:
+            return {"m": 16, "ef_construction": 128}
+        return {"m": 24, "ef_construction": 200}
+
+    async def build_vector_index(self, collection_name: str, index_type: str = None):
+        """
+        Build the vector index once with CREATE INDEX CONCURRENTLY, so writes are
+        not blocked. Meant to run in the background after a bulk load.
+        """
+        index_type = index_type or self.index_type
+        index_name = self.default_index_name(collection_name)
+
+        if not await self.is_collection_exists(collection_name=collection_name):
+            return False
+
+        collection_options = await self.get_collection_options(collection_name=collection_name)
+        index_info = await self.get_vector_index_info(collection_name=collection_name)
+        if index_info["exists"] and index_info["is_valid"]:
+            return False
+
+        if index_info["build_progress"]:
+            self.logger.info(f"Index build already running for collection {collection_name}")
+            return False
+
+        async with self.db_client() as session:
+            # concurrent index builds can not run inside a transaction block
+            connection = await session.connection(
+                execution_options={"isolation_level": "AUTOCOMMIT"}
+            )
+
+            if index_info["exists"]:
+                # left invalid by an interrupted concurrent build
+                await connection.execute(sql_text(f'''
+                    DROP INDEX CONCURRENTLY IF EXISTS {index_name};
+                '''))
+
+            result = await connection.execute(sql_text(f'''
+                SELECT COUNT(*) FROM {collection_name};
+            '''))
+            record_count = result.scalar_one()
+
+            if record_count < self.index_threshold:
+                return False
+
+            # session level settings on a pooled connection, reset below so they do not leak
+            try:
+                if self.maintenance_work_mem:
+                    await connection.execute(sql_text(
+                        f"SET maintenance_work_mem = '{self.maintenance_work_mem}';"
+                    ))
+
+                if self.max_parallel_maintenance_workers is not None:
+                    await connection.execute(sql_text(
+                        f"SET max_parallel_maintenance_workers = {int(self.max_parallel_maintenance_workers)};"
+                    ))
+
+                index_params = self.get_index_params(index_type=index_type, record_count=record_count)
+                index_params_sql = ", ".join([f"{k} = {v}" for k, v in index_params.items()])
+
+                self.logger.info(f"Building {index_type} index for collection {collection_name} "
+                                 f"with {index_params} over {record_count} records...")
+
+                await connection.execute(sql_text(f'''
+                    CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name}
+                    ON {collection_name}
+                    USING {index_type} ({self.get_index_expression(collection_options)})
+                    WITH ({index_params_sql});
+                '''))
+            finally:
+                await connection.execute(sql_text("RESET maintenance_work_mem;"))
+                await connection.execute(sql_text("RESET max_parallel_maintenance_workers;"))
+
+            self.logger.info(f"Ending index build for collection {collection_name}...")
+
+        return True
+
+    async def get_vector_index_info(self, collection_name: str) -> dict:
+        index_name = self.default_index_name(collection_name)
+        async with self.db_client() as session:
+            async with session.begin():
+                index_sql = sql_text(f'''
+                    SELECT i.indisvalid, pg_relation_size(i.indexrelid)
+                    FROM pg_index i
+                    JOIN pg_class c ON c.oid = i.indexrelid
+                    WHERE c.relname = '{index_name}';
+                ''')
+                progress_sql = sql_text(f'''
+                    SELECT phase, blocks_done, blocks_total, tuples_done, tuples_total
+                    FROM pg_stat_progress_create_index
+                    WHERE relid = to_regclass('{collection_name}');
+                ''')
+
+                index_record = (await session.execute(index_sql)).fetchone()
+                progress_record = (await session.execute(progress_sql)).fetchone()
+
+        build_progress = None
+        if progress_record:
+            build_progress = {
+                "phase": progress_record[0],
+                "blocks_done": progress_record[1],
+                "blocks_total": progress_record[2],
+                "tuples_done": progress_record[3],
+                "tuples_total": progress_record[4],
+            }
+
+        return {
+            "index_name": index_name,
+            "index_type": self.index_type,
+            "exists": index_record is not None,
+            "is_valid": bool(index_record[0]) if index_record else False,
+            "size_bytes": index_record[1] if index_record else 0,
+            "build_progress": build_progress,
+        }
+
+    async def drop_vector_index(self, collection_name: str):
+        index_name = self.default_index_name(collection_name)
+        async with self.db_client() as session:
+            async with session.begin():
+                drop_index_sql = sql_text(f'''
+                    DROP INDEX IF EXISTS {index_name};
+                ''')
+                await session.execute(drop_index_sql)
+
     async def reset_vector_index(self, collection_name: str,
-                                    index_type: str = PgVectorIndexTypeEnums.HNSW.value):
-            index_name = self.default_index_name(collection_name)
-            async with self.db_client() as session:
-                async with session.begin():
-                    drop_index_sql = sql_text(f'''
-                        DROP INDEX IF EXISTS {index_name};
-                    ''')
-                    await session.execute(drop_index_sql)
+                                    index_type: str = None):
+            await self.drop_vector_index(collection_name=collection_name)
 
             return await self.create_vector_index(collection_name=collection_name,
                                                     index_type=index_type)
@@ -218,19 +796,24 @@ class PGVectorProvider(VectorDBInterface):
                      {PgVectorTableSchemaEnums.VECTOR.value}, 
                      {PgVectorTableSchemaEnums.METADATA.value}, 
                      {PgVectorTableSchemaEnums.CHUNK_ID.value})
-                    VALUES (:text, :vector, :metadata, :chunk_id);
+                    VALUES (:text, :vector, :metadata, :chunk_id)
+                    ON CONFLICT ({PgVectorTableSchemaEnums.CHUNK_ID.value}) DO UPDATE SET
+                        {PgVectorTableSchemaEnums.TEXT.value} = EXCLUDED.{PgVectorTableSchemaEnums.TEXT.value},
+                        {PgVectorTableSchemaEnums.VECTOR.value} = EXCLUDED.{PgVectorTableSchemaEnums.VECTOR.value},
+                        {PgVectorTableSchemaEnums.METADATA.value} = EXCLUDED.{PgVectorTableSchemaEnums.METADATA.value};
                 ''')
 
                 metadata_json = json.dumps(metadata, ensure_ascii=False) if metadata is not None else "{}"
                 await session.execute(insert_sql, {
                     "text": text,
-                    "vector": '[' + ','.join([str(v) for v in vector]) + ']',
+                    "vector": self.to_vector(vector),
                     "metadata": metadata_json,
                     "chunk_id": record_id
                 })
                 await session.commit()
                 
-                await self.create_vector_index(collection_name=collection_name)
+        if not self.bulk_load:
+            await self.create_vector_index(collection_name=collection_name)
 
         return True
                 
@@ -254,57 +837,101 @@ class PGVectorProvider(VectorDBInterface):
         if record_ids is None:
             record_ids = [None] * len(texts)
 
+        value_columns = [
+            PgVectorTableSchemaEnums.TEXT.value,
+            PgVectorTableSchemaEnums.VECTOR.value,
+            PgVectorTableSchemaEnums.METADATA.value,
+            PgVectorTableSchemaEnums.CHUNK_ID.value,
+        ]
+        value_columns_sql = ", ".join(value_columns)
+        staging_table = f"{collection_name}_staging"
+
         async with self.db_client() as session:
             async with session.begin():
+                # batches are streamed with binary COPY into a staging table, then upserted
+                await session.execute(sql_text(f'''
+                    CREATE TEMP TABLE IF NOT EXISTS {staging_table} ON COMMIT DROP AS
+                    SELECT {value_columns_sql} FROM {collection_name} WITH NO DATA;
+                '''))
+
+                raw_connection = (await (await session.connection()).get_raw_connection()).driver_connection
+
                 for i in range(0, len(texts), batch_size):
                     batch_texts = texts[i:i+batch_size]
                     batch_vectors = vectors[i:i+batch_size]
                     batch_metadatas = metadatas[i:i+batch_size] 
                     batch_record_ids = record_ids[i:i+batch_size]
 
-                    values = []
-
-                    for _text, _vector, _metadata, _record_id in zip(batch_texts, batch_vectors, batch_metadatas, batch_record_ids):
-                        
-                        matadata_json = json.dumps(_metadata, ensure_ascii=False) if _metadata is not None else "{}"
-                        values.append({
-                            "text": _text,
-                            "vector": '[' + ','.join([str(v) for v in _vector]) + ']',
-                            "metadata": matadata_json,
-                            "chunk_id": _record_id
-                        })
-
-                    batch_insert_sql = sql_text(f'''
-                        INSERT INTO {collection_name} 
-                        ({PgVectorTableSchemaEnums.TEXT.value}, 
-                         {PgVectorTableSchemaEnums.VECTOR.value}, 
-                         {PgVectorTableSchemaEnums.METADATA.value}, 
-                         {PgVectorTableSchemaEnums.CHUNK_ID.value})
-                        VALUES (:text, :vector, :metadata, :chunk_id);
-                        ''')
-                    await session.execute(batch_insert_sql, values)
+                    records = [
+                        (
+                            _text,
+                            self.to_vector(_vector),
+                            json.dumps(_metadata, ensure_ascii=False) if _metadata is not None else "{}",
+                            _record_id
+                        )
+                        for _text, _vector, _metadata, _record_id in zip(batch_texts, batch_vectors, batch_metadatas, batch_record_ids)
+                    ]
+
+                    await raw_connection.copy_records_to_table(
+                        staging_table,
+                        records=records,
+                        columns=value_columns
+                    )
+
+                upsert_sql = sql_text(f'''
+                    INSERT INTO {collection_name} ({value_columns_sql})
+                    SELECT {value_columns_sql} FROM {staging_table}
+                    ON CONFLICT ({PgVectorTableSchemaEnums.CHUNK_ID.value}) DO UPDATE SET
+                        {PgVectorTableSchemaEnums.TEXT.value} = EXCLUDED.{PgVectorTableSchemaEnums.TEXT.value},
+                        {PgVectorTableSchemaEnums.VECTOR.value} = EXCLUDED.{PgVectorTableSchemaEnums.VECTOR.value},
+                        {PgVectorTableSchemaEnums.METADATA.value} = EXCLUDED.{PgVectorTableSchemaEnums.METADATA.value};
+                ''')
+                await session.execute(upsert_sql)
                 
-        await self.create_vector_index(collection_name=collection_name)
+        if not self.bulk_load:
+            await self.create_vector_index(collection_name=collection_name)
         
         return True
     
-    async def search_by_vector(self, collection_name: str,vector: list, limit: int) -> List[RetrievedDocument]:
+    async def delete_by_record_ids(self, collection_name: str, record_ids: list):
         if not await self.is_collection_exists(collection_name=collection_name):
-            self.logger.error(f"Collection {collection_name} does not exist.")
             return False
-        
-        vector = '[' + ','.join([str(v) for v in vector]) + ']'
+
         async with self.db_client() as session:
             async with session.begin():
-                search_sql = sql_text(f'''
-                    SELECT 
-                        {PgVectorTableSchemaEnums.TEXT.value} as text,
-                        1 - ({PgVectorTableSchemaEnums.VECTOR.value} <=> :vector) as score
-                    FROM {collection_name}
-                    ORDER BY score DESC
-                    LIMIT {limit};
+                delete_sql = sql_text(f'''
+                    DELETE FROM {collection_name}
+                    WHERE {PgVectorTableSchemaEnums.CHUNK_ID.value} = ANY(:chunk_ids);
                 ''')
-                result = await session.execute(search_sql, {"vector": vector})
+                await session.execute(delete_sql, {"chunk_ids": list(record_ids)})
+
+        return True
+
+    async def search_by_vector(self, collection_name: str,vector: list, limit: int,
+                               filters: dict = None, search_profile: str = None) -> List[RetrievedDocument]:
+        vector = self.to_vector(vector)
+        filter_conditions, filter_params = self.build_filter_sql(filters)
+        async with self.db_client() as session:
+            async with session.begin():
+                collection_options, estimated_count = await self.get_search_state(session, collection_name)
+                if collection_options is None:
+                    self.logger.error(f"Collection {collection_name} does not exist.")
+                    return False
+
+                search_settings, exact = self.get_search_settings(
+                    collection_options, estimated_count, search_profile=search_profile,
+                    limit=limit, filtered=bool(filter_conditions)
+                )
+                await self.apply_search_settings(session, search_settings)
+
+                search_sql = sql_text(self.build_search_sql(
+                    collection_name=collection_name,
+                    collection_options=collection_options,
+                    limit=limit,
+                    filter_conditions=filter_conditions,
+                    exact=exact
+                ))
+                result = await session.execute(search_sql, {"vector": vector, **filter_params})
                 records = result.fetchall()
                 
                 return [
@@ -312,4 +939,108 @@ class PGVectorProvider(VectorDBInterface):
                         text=record.text,
                         score=record.score
                     ) for record in records
-                ]
\ No newline at end of file
+                ]
+
+    async def search_hybrid(self, collection_name: str, text: str, vector: list, limit: int,
+                            filters: dict = None, search_profile: str = None) -> List[RetrievedDocument]:
+        records = None
+        filter_conditions, filter_params = self.build_filter_sql(filters)
+        async with self.db_client() as session:
+            async with session.begin():
+                collection_options, estimated_count = await self.get_search_state(session, collection_name)
+                if collection_options is None:
+                    self.logger.error(f"Collection {collection_name} does not exist.")
+                    return False
+
+                if collection_options.get("text_search_config"):
+                    search_settings, exact = self.get_search_settings(
+                        collection_options, estimated_count, search_profile=search_profile,
+                        limit=int(limit) * self.hybrid_candidates_factor,
+                        filtered=bool(filter_conditions)
+                    )
+                    await self.apply_search_settings(session, search_settings)
+
+                    search_sql = sql_text(self.build_hybrid_search_sql(
+                        collection_name=collection_name,
+                        collection_options=collection_options,
+                        limit=limit,
+                        filter_conditions=filter_conditions,
+                        exact=exact
+                    ))
+                    result = await session.execute(search_sql, {
+                        "vector": self.to_vector(vector),
+                        "query_text": text,
+                        **filter_params
+                    })
+                    records = result.fetchall()
+
+        if records is None:
+            self.logger.warning(f"Collection {collection_name} has no full text index, using vector search")
+            return await self.search_by_vector(collection_name=collection_name, vector=vector,
+                                               limit=limit, filters=filters,
+                                               search_profile=search_profile)
+
+        # scores are fused RRF scores, comparable only within one result list
+        return [
+            RetrievedDocument(
+                text=record.text,
+                score=record.score
+            ) for record in records
+        ]
+
+    async def search_by_vectors(self, collection_name: str, vectors: list, limit: int,
+                                filters: dict = None, search_profile: str = None) -> List[List[RetrievedDocument]]:
+        if len(vectors) == 0:
+            return []
+
+        filter_conditions, filter_params = self.build_filter_sql(filters)
+
+        # every query vector is its own binary parameter; LATERAL runs the indexed search per row
+        values_sql = ", ".join([
+            f"({idx}, CAST(:vector_{idx} AS vector))" for idx in range(len(vectors))
+        ])
+        async with self.db_client() as session:
+            async with session.begin():
+                collection_options, estimated_count = await self.get_search_state(session, collection_name)
+                if collection_options is None:
+                    self.logger.error(f"Collection {collection_name} does not exist.")
+                    return False
+
+                search_settings, exact = self.get_search_settings(
+                    collection_options, estimated_count, search_profile=search_profile,
+                    limit=limit, filtered=bool(filter_conditions)
+                )
+                await self.apply_search_settings(session, search_settings)
+
+                per_query_sql = self.build_search_sql(
+                    collection_name=collection_name,
+                    collection_options=collection_options,
+                    limit=limit,
+                    query_vector_sql="queries.query_vector",
+                    filter_conditions=filter_conditions,
+                    exact=exact
+                )
+
+                search_sql = sql_text(f'''
+                    SELECT queries.query_idx, results.text, results.score
+                    FROM (VALUES {values_sql}) AS queries(query_idx, query_vector)
+                    CROSS JOIN LATERAL ({per_query_sql}) AS results
+                    ORDER BY queries.query_idx, results.score DESC;
+                ''')
+                result = await session.execute(search_sql, {
+                    **{f"vector_{idx}": self.to_vector(vector) for idx, vector in enumerate(vectors)},
+                    **filter_params
+                })
+                records = result.fetchall()
+
+        results = [[] for _ in vectors]
+        for record in records:
+            results[record.query_idx].append(RetrievedDocument(
+                text=record.text,
+                score=record.score
+            ))
+
+        return results
+
+def on_connect_register_vector(dbapi_connection, connection_record):
+    dbapi_connection.run_async(register_vector)
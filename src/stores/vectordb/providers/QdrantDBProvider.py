@@ -1,20 +1,70 @@
-from qdrant_client import QdrantClient, models
+from qdrant_client import AsyncQdrantClient, models
 from ..VectorDBInterface import VectorDBInterface
-from ..VectorDBEnums import DistanceMethodEnums
+from ..VectorDBEnums import DistanceMethodEnums, QdrantQuantizationEnums, SearchProfileEnums
 from models.db_schemas import RetrievedDocument
+from utils.sparse_text_encoder import encode_sparse_text
 from typing import List
+import asyncio
 import logging
+import httpx
 
 
 class QdrantDBProvider(VectorDBInterface):
     def __init__(self, db_client, default_vector_size: int=786,
                  distance_method: str = None,
-                 index_type: str = None, index_threshold: int = 100):
+                 index_type: str = None, index_threshold: int = 100,
+                 url: str = None, api_key: str = None,
+                 prefer_grpc: bool = False, grpc_port: int = 6334,
+                 timeout: int = None, pool_size: int = 20,
+                 upload_parallel: int = 4,
+                 collection_options: dict = None,
+                 hybrid_candidates_factor: int = 4,
+                 search_profiles: dict = None):
         
         self.client = None
         self.db_client = db_client
         self.distance_method = None
         self.default_vector_size = default_vector_size
+
+        # server mode when a url is set, embedded local mode over db_client (path) otherwise
+        self.url = url
+        self.api_key = api_key
+        self.prefer_grpc = prefer_grpc
+        self.grpc_port = grpc_port
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.upload_parallel = max(upload_parallel, 1)
+
+        # storage defaults for new collections, each collection can override them
+        self.collection_options = {
+            "on_disk": False,
+            "hnsw_on_disk": False,
+            "quantization": None,
+            "always_ram": True,
+            "rescore": True,
+            "oversampling": None,
+            **(collection_options or {}),
+        }
+
+        # hybrid search: a sparse "text" vector next to the dense one, fused with RRF
+        self.sparse_vector_name = "text"
+        self.hybrid_candidates_factor = max(hybrid_candidates_factor, 1)
+        self.sparse_collections = {}
+        self.collection_search_options = {}
+
+        # recall/latency profiles map to hnsw_ef; small collections are already
+        # brute forced by Qdrant below its full_scan_threshold
+        self.search_profiles = search_profiles or {
+            SearchProfileEnums.FAST.value: {"ef_search": 40},
+            SearchProfileEnums.BALANCED.value: {"ef_search": 100},
+        }
+
+        # payload fields used by search filters, indexed so filtered HNSW stays fast
+        self.payload_index_fields = {
+            "metadata.asset_id": models.PayloadSchemaType.INTEGER,
+            "metadata.page_start": models.PayloadSchemaType.INTEGER,
+            "metadata.page_end": models.PayloadSchemaType.INTEGER,
+        }
         
 
         if distance_method == DistanceMethodEnums.COSINE.value:
@@ -25,9 +75,24 @@ class QdrantDBProvider(VectorDBInterface):
         self.logger = logging.getLogger("uvicorn")
 
     async def connect(self):
-        self.client = QdrantClient(path=self.db_client)
+        if not self.url:
+            self.client = AsyncQdrantClient(path=self.db_client)
+            return
+
+        self.client = AsyncQdrantClient(
+            url=self.url,
+            api_key=self.api_key or None,
+            prefer_grpc=self.prefer_grpc,
+            grpc_port=self.grpc_port,
+            timeout=self.timeout,
+            # keep-alive pool shared by all requests of this process (REST transport)
+            limits=httpx.Limits(max_connections=self.pool_size,
+                                max_keepalive_connections=self.pool_size),
+        )
 
     async def disconnect(self):
+        if self.client is not None:
+            await self.client.close()
         self.client = None
 
     async def is_collection_exists(self, collection_name: str) -> bool:
@@ -42,27 +107,202 @@ class QdrantDBProvider(VectorDBInterface):
     async def delete_collection(self, collection_name: str):
         if await self.is_collection_exists(collection_name=collection_name):
             self.logger.info(f"Deleting Qdrant collection: {collection_name}")
+            self.sparse_collections.pop(collection_name, None)
+            self.collection_search_options.pop(collection_name, None)
             return await self.client.delete_collection(collection_name=collection_name)
 
     async def create_collection(self, collection_name: str, 
                                 embedding_size: int, 
-                                do_reset: bool = False):
+                                do_reset: bool = False,
+                                collection_options: dict = None):
         if do_reset and await self.is_collection_exists(collection_name=collection_name):
             _ = await self.delete_collection(collection_name=collection_name)
 
+        # the collection may be recreated with other options
+        self.collection_search_options.pop(collection_name, None)
+
         if not await self.is_collection_exists(collection_name=collection_name):
             self.logger.info(f"Creating Qdrant collection: {collection_name}")
             
+            options = {**self.collection_options, **(collection_options or {})}
+
             await self.client.create_collection(
                 collection_name=collection_name,
                 vectors_config=models.VectorParams(
                     size=embedding_size,
-                    distance=self.distance_method
-                )
+                    distance=self.distance_method,
+                    # memmap storage, only the quantized vectors stay in RAM
+                    on_disk=options["on_disk"]
+                ),
+                hnsw_config=models.HnswConfigDiff(on_disk=options["hnsw_on_disk"]),
+                quantization_config=self.get_quantization_config(options),
+                sparse_vectors_config={
+                    self.sparse_vector_name: models.SparseVectorParams(modifier=models.Modifier.IDF)
+                },
+                # search time options are not part of the collection config, they are kept
+                # in the collection metadata so every process searches with the same ones
+                metadata={
+                    "search_options": {
+                        "rescore": options["rescore"],
+                        "oversampling": options["oversampling"],
+                    }
+                }
             )
+            self.sparse_collections[collection_name] = True
+            await self.create_payload_indexes(collection_name=collection_name)
             return True
+
+        await self.create_payload_indexes(collection_name=collection_name)
         return False
 
+    async def create_payload_indexes(self, collection_name: str):
+        collection_info = await self.client.get_collection(collection_name=collection_name)
+        existing_fields = collection_info.payload_schema or {}
+
+        for field_name, field_schema in self.payload_index_fields.items():
+            if field_name in existing_fields:
+                continue
+
+            self.logger.info(f"Creating payload index {field_name} for collection {collection_name}")
+            await self.client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=field_schema,
+                wait=True
+            )
+
+    def get_search_filter(self, filters: dict = None):
+        """
+        Translates search filters into a Qdrant filter over the point payload.
+        Supported keys: asset_ids, page_start, page_end and metadata (exact values).
+        """
+        if not filters:
+            return None
+
+        conditions = []
+
+        # points indexed before asset_id was part of the payload need the
+        # tasks.maintenance.backfill_asset_ids task to match this filter
+        if filters.get("asset_ids"):
+            conditions.append(models.FieldCondition(
+                key="metadata.asset_id",
+                match=models.MatchAny(any=[int(asset_id) for asset_id in filters["asset_ids"]])
+            ))
+
+        # a chunk matches a page range when the two ranges overlap
+        if filters.get("page_start") is not None:
+            conditions.append(models.FieldCondition(
+                key="metadata.page_end",
+                range=models.Range(gte=int(filters["page_start"]))
+            ))
+
+        if filters.get("page_end") is not None:
+            conditions.append(models.FieldCondition(
+                key="metadata.page_start",
+                range=models.Range(lte=int(filters["page_end"]))
+            ))
+
+        for key, value in (filters.get("metadata") or {}).items():
+            match = models.MatchAny(any=value) if isinstance(value, list) else models.MatchValue(value=value)
+            conditions.append(models.FieldCondition(key=f"metadata.{key}", match=match))
+
+        return models.Filter(must=conditions) if conditions else None
+
+    def get_quantization_config(self, options: dict):
+        quantization = options.get("quantization")
+        always_ram = options.get("always_ram", True)
+
+        if quantization == QdrantQuantizationEnums.SCALAR.value:
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=always_ram
+                )
+            )
+
+        if quantization == QdrantQuantizationEnums.PRODUCT.value:
+            return models.ProductQuantization(
+                product=models.ProductQuantizationConfig(
+                    compression=models.CompressionRatio.X16,
+                    always_ram=always_ram
+                )
+            )
+
+        if quantization == QdrantQuantizationEnums.BINARY.value:
+            return models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(always_ram=always_ram)
+            )
+
+        if quantization:
+            self.logger.warning(f"Unsupported Qdrant quantization: {quantization}")
+
+        return None
+
+    async def has_sparse_vectors(self, collection_name: str) -> bool:
+        # collections created before hybrid search only hold the dense vector
+        if collection_name not in self.sparse_collections:
+            collection_info = await self.client.get_collection(collection_name=collection_name)
+            sparse_vectors = collection_info.config.params.sparse_vectors or {}
+            self.sparse_collections[collection_name] = self.sparse_vector_name in sparse_vectors
+
+        return self.sparse_collections[collection_name]
+
+    def get_point_vector(self, text: str, vector, with_sparse: bool):
+        dense_vector = vector.tolist() if hasattr(vector, "tolist") else vector
+        if not with_sparse:
+            return dense_vector
+
+        indices, values = encode_sparse_text(text)
+        return {
+            "": dense_vector,
+            self.sparse_vector_name: models.SparseVector(indices=indices, values=values)
+        }
+
+    async def get_collection_search_options(self, collection_name: str) -> dict:
+        # cached like the sparse vector flag, a collection keeps its options until it is recreated
+        if collection_name not in self.collection_search_options:
+            collection_info = await self.client.get_collection(collection_name=collection_name)
+            collection_metadata = collection_info.config.metadata or {}
+            search_options = collection_metadata.get("search_options") or {}
+
+            # collections created before search options were stored use the defaults
+            self.collection_search_options[collection_name] = {
+                "quantized": collection_info.config.quantization_config is not None,
+                "rescore": search_options.get("rescore", self.collection_options["rescore"]),
+                "oversampling": search_options.get("oversampling", self.collection_options["oversampling"]),
+            }
+
+            # the same response answers has_sparse_vectors
+            sparse_vectors = collection_info.config.params.sparse_vectors or {}
+            self.sparse_collections[collection_name] = self.sparse_vector_name in sparse_vectors
+
+        return self.collection_search_options[collection_name]
+
+    def get_search_params(self, search_options: dict, search_profile: str = None, limit: int = None):
+        if search_profile == SearchProfileEnums.EXACT.value:
+            # full scan over the original vectors
+            return models.SearchParams(
+                exact=True,
+                quantization=models.QuantizationSearchParams(ignore=True)
+            )
+
+        profile = self.search_profiles.get(search_profile,
+                                           self.search_profiles[SearchProfileEnums.BALANCED.value])
+
+        # quantized collections search the compact vectors, then rescore from the originals
+        quantization = None
+        if search_options["quantized"]:
+            quantization = models.QuantizationSearchParams(
+                rescore=search_options["rescore"],
+                oversampling=search_options["oversampling"]
+            )
+
+        return models.SearchParams(
+            hnsw_ef=max(int(profile["ef_search"]), limit or 0),
+            quantization=quantization
+        )
+
     async def insert_one(self, collection_name: str,text: str, vector: List, 
                          metadata: dict = None, 
                          record_id: str = None):
@@ -71,13 +311,15 @@ class QdrantDBProvider(VectorDBInterface):
             self.logger.error(f"Collection {collection_name} does not exist.")
             return False
         
+        with_sparse = await self.has_sparse_vectors(collection_name=collection_name)
+
         try:
             # Use upsert with PointStruct to insert a single point
             _ = await self.client.upsert(
                 collection_name=collection_name,
                 points=[models.PointStruct(
                     id=record_id,
-                    vector=vector,
+                    vector=self.get_point_vector(text, vector, with_sparse),
                     payload={"text": text, "metadata": metadata}
                 )]
             )
@@ -106,7 +348,12 @@ class QdrantDBProvider(VectorDBInterface):
             self.logger.error(f"Collection {collection_name} does not exist.")
             return False
 
-        for i in range(0, len(texts), batch_size):
+        with_sparse = await self.has_sparse_vectors(collection_name=collection_name)
+
+        # batches are upserted concurrently, bounded by upload_parallel
+        semaphore = asyncio.Semaphore(self.upload_parallel)
+
+        async def upload_batch(i: int):
             batch_end  = i + batch_size
             batch_texts = texts[i:batch_end]
             batch_vectors = vectors[i:batch_end]
@@ -116,28 +363,71 @@ class QdrantDBProvider(VectorDBInterface):
             points = [
                 models.PointStruct(
                     id=batch_record_ids[x],
-                    vector=batch_vectors[x],
+                    vector=self.get_point_vector(batch_texts[x], batch_vectors[x], with_sparse),
                     payload={"text": batch_texts[x], "metadata": batch_metadatas[x]}
                 ) for x in range(len(batch_texts))
             ]
 
-            try:
-                _ = await self.client.upsert(
-                    collection_name=collection_name,
-                    points=points
-                )
-            except Exception as e:
-                self.logger.error(f"Error inserting batch starting at index {i}: {e}")
-                return False
+            async with semaphore:
+                try:
+                    _ = await self.client.upsert(
+                        collection_name=collection_name,
+                        points=points,
+                        wait=True
+                    )
+                except Exception as e:
+                    self.logger.error(f"Error inserting batch starting at index {i}: {e}")
+                    return False
+
+            return True
+
+        results = await asyncio.gather(*[
+            upload_batch(i) for i in range(0, len(texts), batch_size)
+        ])
+
+        return all(results)
+
+    async def build_vector_index(self, collection_name: str):
+        # Qdrant maintains its HNSW graph itself
+        return False
 
+    async def set_records_asset_id(self, collection_name: str, asset_id: int, record_ids: List):
+        # a filter selector skips ids that were never pushed instead of failing the batch
+        _ = await self.client.set_payload(
+            collection_name=collection_name,
+            payload={"asset_id": int(asset_id)},
+            key="metadata",
+            points=models.Filter(must=[models.HasIdCondition(has_id=list(record_ids))]),
+            wait=True
+        )
         return True
 
-    async def search_by_vector(self, collection_name: str, vector: List, limit: int = 5):
+    async def delete_by_record_ids(self, collection_name: str, record_ids: List):
+        if not await self.is_collection_exists(collection_name=collection_name):
+            return False
+
+        try:
+            _ = await self.client.delete(
+                collection_name=collection_name,
+                points_selector=models.PointIdsList(points=list(record_ids))
+            )
+        except Exception as e:
+            self.logger.error(f"Error deleting records: {e}")
+            return False
+
+        return True
+
+    async def search_by_vector(self, collection_name: str, vector: List, limit: int = 5,
+                               filters: dict = None, search_profile: str = None):
+
+        search_options = await self.get_collection_search_options(collection_name=collection_name)
 
         results = await self.client.query_points(
                       collection_name, 
-                      vector, 
-                      limit=limit
+                      vector.tolist() if hasattr(vector, "tolist") else vector, 
+                      query_filter=self.get_search_filter(filters),
+                      limit=limit,
+                      search_params=self.get_search_params(search_options, search_profile, limit)
                     )
         
         if not results or len(results.points) == 0:
@@ -149,4 +439,80 @@ class QdrantDBProvider(VectorDBInterface):
                 "score": point.score
             }) for point in results.points
         ]
-                                            
+
+    async def search_hybrid(self, collection_name: str, text: str, vector: List, limit: int = 5,
+                            filters: dict = None, search_profile: str = None):
+
+        search_options = await self.get_collection_search_options(collection_name=collection_name)
+        if not await self.has_sparse_vectors(collection_name=collection_name):
+            self.logger.warning(f"Collection {collection_name} has no sparse vectors, using vector search")
+            return await self.search_by_vector(collection_name=collection_name, vector=vector,
+                                               limit=limit, filters=filters,
+                                               search_profile=search_profile)
+
+        indices, values = encode_sparse_text(text, is_query=True)
+        candidates_count = limit * self.hybrid_candidates_factor
+        search_filter = self.get_search_filter(filters)
+
+        # both candidate lists are fetched and fused by the server in one request
+        results = await self.client.query_points(
+                      collection_name=collection_name,
+                      prefetch=[
+                          models.Prefetch(
+                              query=vector.tolist() if hasattr(vector, "tolist") else vector,
+                              filter=search_filter,
+                              limit=candidates_count,
+                              params=self.get_search_params(search_options, search_profile, candidates_count)
+                          ),
+                          models.Prefetch(
+                              query=models.SparseVector(indices=indices, values=values),
+                              using=self.sparse_vector_name,
+                              filter=search_filter,
+                              limit=candidates_count
+                          ),
+                      ],
+                      query=models.FusionQuery(fusion=models.Fusion.RRF),
+                      limit=limit,
+                      with_payload=True
+                    )
+
+        if not results or len(results.points) == 0:
+            return None
+
+        return [
+            RetrievedDocument(**{
+                "text": point.payload.get("text", ""),
+                "score": point.score
+            }) for point in results.points
+        ]
+
+    async def search_by_vectors(self, collection_name: str, vectors: List, limit: int = 5,
+                                filters: dict = None, search_profile: str = None):
+
+        if len(vectors) == 0:
+            return []
+
+        search_options = await self.get_collection_search_options(collection_name=collection_name)
+        search_params = self.get_search_params(search_options, search_profile, limit)
+        search_filter = self.get_search_filter(filters)
+        responses = await self.client.query_batch_points(
+            collection_name=collection_name,
+            requests=[
+                models.QueryRequest(
+                    query=vector.tolist() if hasattr(vector, "tolist") else vector,
+                    filter=search_filter,
+                    limit=limit,
+                    params=search_params,
+                    with_payload=True
+                ) for vector in vectors
+            ]
+        )
+
+        return [
+            [
+                RetrievedDocument(**{
+                    "text": point.payload.get("text", ""),
+                    "score": point.score
+                }) for point in response.points
+            ] for response in responses
+        ]
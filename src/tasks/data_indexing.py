@@ -4,8 +4,13 @@ import asyncio
 from fastapi.responses import JSONResponse
 from models.ProjectModel import ProjectModel
 from models.ChunkModel import ChunkModel
+from models.AssetModel import AssetModel
+from models.EmbeddingCacheModel import EmbeddingCacheModel
+from models.IndexingCheckpointModel import IndexingCheckpointModel
 from controllers import NLPController
 from models import ResponseStatus
+from utils.indexing_pipeline import IndexingPipeline
+from stores.vectordb.VectorDBEnums import VectorDBEnums
 from tqdm.auto import tqdm
 import logging
 
@@ -16,16 +21,18 @@ logger = logging.getLogger(__name__)
                  autoretry_for=(Exception,),
                  retry_kwargs={'max_retries': 3, 'countdown': 60}
                 )
-def index_data_content(self, project_id: int, do_reset: int):
+def index_data_content(self, project_id: int, do_reset: int, asset_ids: list = None,
+                       collection_options: dict = None):
 
     logger.warning("index_data_content started")
     return asyncio.run(
-        _index_data_content(self, project_id, do_reset)
+        _index_data_content(self, project_id, do_reset, asset_ids, collection_options)
     )
 
-async def _index_data_content(task_instance, project_id: int, do_reset: int):
+async def _index_data_content(task_instance, project_id: int, do_reset: int,
+                              asset_ids: list = None, collection_options: dict = None):
 
-    db_engine, vector_db_client = None, None
+    db_engine, vector_db_client, llm_provider_factory = None, None, None
 
     try:
 
@@ -50,48 +57,58 @@ async def _index_data_content(task_instance, project_id: int, do_reset: int):
 
             raise Exception(f"No project found for project_id: {project_id}")
     
+        settings = get_settings()
+
+        embedding_cache = None
+        if settings.EMBEDDING_CACHE_ENABLED:
+            embedding_cache = await EmbeddingCacheModel.create_instance(db_client)
+
         nlp_controller = NLPController(
             vector_db_client=vector_db_client,
             generation_client=generation_client,
             embedding_client=embedding_client,
             template_parser=template_parser,
+            embedding_cache=embedding_cache,
         )
 
-        has_records = True
-        page_no = 1
-        inserted_count = 0
-        idx = 0
-
         # Create collection in VectorDB if not exists
         collection_name = nlp_controller.create_collection_name(project.project_id)
 
+        collection_existed = await vector_db_client.is_collection_exists(collection_name=collection_name)
+
         _ = await vector_db_client.create_collection(
             collection_name=collection_name,
             embedding_size=embedding_client.embedding_size,
             do_reset=do_reset,
+            collection_options=collection_options,
         )
 
+        # resume after the last committed chunk of a previous (failed or retried) run;
+        # runs limited to some assets (incremental) do not move the checkpoint
+        checkpoint_model = await IndexingCheckpointModel.create_instance(db_client)
+        use_checkpoint = asset_ids is None
+        last_chunk_id = 0
+
+        if do_reset or not collection_existed:
+            _ = await checkpoint_model.delete_checkpoint(project.project_id, collection_name)
+        elif use_checkpoint:
+            last_chunk_id = await checkpoint_model.get_last_chunk_id(project.project_id, collection_name)
+            if last_chunk_id:
+                logger.warning(f"Resuming indexing after chunk_id: {last_chunk_id}")
+
         # setup batching
-        total_chunks_count = await chunk_model.get_total_chunks_count(project.project_id)
+        # asset_ids limits indexing to those assets' chunks (incremental runs)
+        total_chunks_count = await chunk_model.get_total_chunks_count(project.project_id,
+                                                                      asset_ids=asset_ids,
+                                                                      after_chunk_id=last_chunk_id)
         pbar = tqdm(total=total_chunks_count, desc="Indexing Chunks into VectorDB", position=0)
 
-        while has_records:
-            page_chunks = await chunk_model.get_project_chunks(project_id=project.project_id, page_no=page_no)
-            
-            if len(page_chunks):
-                page_no += 1
-            
-            if not page_chunks or len(page_chunks) == 0:
-                has_records = False
-                break
-
-            chunk_ids = [ c.chunk_id for c in page_chunks ]
-            idx += len(page_chunks)
-            
-            is_inserted = await nlp_controller.index_into_vector_db(
+        async def write_page(page_chunks: list, vectors: list):
+            is_inserted = await nlp_controller.insert_into_vector_db(
                 project=project,
                 chunks=page_chunks,
-                chunk_ids=chunk_ids
+                vectors=vectors,
+                chunk_ids=[ c.chunk_id for c in page_chunks ]
             )
 
             if not is_inserted:
@@ -103,8 +120,41 @@ async def _index_data_content(task_instance, project_id: int, do_reset: int):
                 raise Exception(f"can not insert into vectorDB | project_id: {project_id}")
 
             pbar.update(len(page_chunks))
-            inserted_count += len(page_chunks)
-        
+
+        async def save_checkpoint(page_chunks: list):
+            _ = await checkpoint_model.save_checkpoint(
+                project_id=project.project_id,
+                collection_name=collection_name,
+                last_chunk_id=page_chunks[-1].chunk_id
+            )
+
+        # keyset pages are fetched, embedded and written concurrently
+        indexing_pipeline = IndexingPipeline(
+            chunk_pages=chunk_model.iter_project_chunks(project_id=project.project_id,
+                                                        page_size=settings.INDEXING_PAGE_SIZE,
+                                                        asset_ids=asset_ids,
+                                                        after_chunk_id=last_chunk_id),
+            embed_fn=nlp_controller.embed_chunks,
+            write_fn=write_page,
+            embedding_concurrency=settings.INDEXING_EMBEDDING_CONCURRENCY,
+            queue_size=settings.INDEXING_QUEUE_SIZE,
+            checkpoint_fn=save_checkpoint if use_checkpoint else None
+        )
+
+        inserted_count = await indexing_pipeline.run()
+
+        # incremental processing skips these assets from now on
+        asset_model = await AssetModel.create_instance(db_client)
+        _ = await asset_model.set_assets_indexed(project.project_id, asset_ids=asset_ids)
+
+        # versioned caches (answers) keyed on the old index become unreachable
+        if inserted_count or do_reset:
+            _ = await project_model.bump_index_version(project.project_id)
+
+        # bulk loads skip per-batch index maintenance, build the index once in the background
+        if (settings.VECTOR_DB_BACKEND == VectorDBEnums.PGVECTOR.value
+                and settings.VECTOR_DB_PGVEC_BULK_LOAD):
+            build_vector_index.delay(project_id=project.project_id)
 
         task_instance.update_state(
             state="SUCCESS",
@@ -126,5 +176,125 @@ async def _index_data_content(task_instance, project_id: int, do_reset: int):
             
             if vector_db_client:
                 await vector_db_client.disconnect()
+
+            if llm_provider_factory:
+                await llm_provider_factory.close()
+        except Exception as e:
+            logger.error(f"Task failed while cleaning: {str(e)}")
+
+@celery_app.task(
+                 bind=True, name="tasks.data_indexing.build_vector_index",
+                 autoretry_for=(Exception,),
+                 retry_kwargs={'max_retries': 3, 'countdown': 60}
+                )
+def build_vector_index(self, project_id: int):
+
+    return asyncio.run(
+        _build_vector_index(self, project_id)
+    )
+
+async def _build_vector_index(task_instance, project_id: int):
+
+    db_engine, vector_db_client, llm_provider_factory = None, None, None
+
+    try:
+
+        (db_engine, db_client, llm_provider_factory,
+        vectordb_provider_factory,
+        generation_client, embedding_client,
+        vector_db_client, template_parser) = await get_setup_utils()
+
+        nlp_controller = NLPController(
+            vector_db_client=vector_db_client,
+            generation_client=generation_client,
+            embedding_client=embedding_client,
+            template_parser=template_parser,
+        )
+
+        collection_name = nlp_controller.create_collection_name(project_id)
+
+        is_built = await vector_db_client.build_vector_index(collection_name=collection_name)
+        index_info = None
+        if hasattr(vector_db_client, "get_vector_index_info"):
+            index_info = await vector_db_client.get_vector_index_info(collection_name=collection_name)
+
+        return {
+            "project_id": project_id,
+            "is_built": is_built,
+            "index_info": index_info,
+        }
+
+    except Exception as e:
+        logger.error(f"Task failed: {str(e)}")
+        raise
+    finally:
+        try:
+            if db_engine:
+                await db_engine.dispose()
+
+            if vector_db_client:
+                await vector_db_client.disconnect()
+
+            if llm_provider_factory:
+                await llm_provider_factory.close()
+        except Exception as e:
+            logger.error(f"Task failed while cleaning: {str(e)}")
+
+@celery_app.task(
+                 bind=True, name="tasks.data_indexing.upgrade_text_search_index",
+                 autoretry_for=(Exception,),
+                 retry_kwargs={'max_retries': 3, 'countdown': 60}
+                )
+def upgrade_text_search_index(self, project_id: int):
+
+    return asyncio.run(
+        _upgrade_text_search_index(self, project_id)
+    )
+
+async def _upgrade_text_search_index(task_instance, project_id: int):
+
+    db_engine, vector_db_client, llm_provider_factory = None, None, None
+
+    try:
+
+        (db_engine, db_client, llm_provider_factory,
+        vectordb_provider_factory,
+        generation_client, embedding_client,
+        vector_db_client, template_parser) = await get_setup_utils()
+
+        nlp_controller = NLPController(
+            vector_db_client=vector_db_client,
+            generation_client=generation_client,
+            embedding_client=embedding_client,
+            template_parser=template_parser,
+        )
+
+        collection_name = nlp_controller.create_collection_name(project_id)
+
+        # collections created before hybrid search have no text search column, adding it
+        # rewrites the table under an exclusive lock, so it only runs on explicit request
+        is_upgraded = False
+        if (hasattr(vector_db_client, "create_text_search_index")
+                and await vector_db_client.is_collection_exists(collection_name=collection_name)):
+            is_upgraded = await vector_db_client.create_text_search_index(collection_name=collection_name)
+
+        return {
+            "project_id": project_id,
+            "is_upgraded": is_upgraded,
+        }
+
+    except Exception as e:
+        logger.error(f"Task failed: {str(e)}")
+        raise
+    finally:
+        try:
+            if db_engine:
+                await db_engine.dispose()
+
+            if vector_db_client:
+                await vector_db_client.disconnect()
+
+            if llm_provider_factory:
+                await llm_provider_factory.close()
         except Exception as e:
-            logger.error(f"Task failed while cleaning: {str(e)}")
\ No newline at end of file
+            logger.error(f"Task failed while cleaning: {str(e)}")
@@ -4,8 +4,7 @@ import asyncio
 from models.ProjectModel import ProjectModel
 from models.ChunkModel import ChunkModel
 from models.AssetModel import AssetModel
-from models.db_schemas import DataChunk
-from models import ResponseStatus
+from models import ResponseStatus, ChunkSeparatorEnums
 from models.enums.AssetTypeEnum import AssetTypeEnum
 from controllers import ProcessController
 from controllers import NLPController
@@ -21,20 +20,24 @@ logger = logging.getLogger(__name__)
                 )
 def process_project_files(self, project_id: int, 
                           file_id: int, chunk_size: int,
-                          overlap_size: int, do_reset: int):
+                          overlap_size: int, do_reset: int,
+                          separator: str = ChunkSeparatorEnums.NEWLINE.value,
+                          incremental: int = 0):
 
     # Return the result of the coroutine so Celery task gets the payload
     return asyncio.run(
         _process_project_files(self, project_id, file_id, chunk_size,
-                               overlap_size, do_reset)
+                               overlap_size, do_reset, separator, incremental)
     )
 
 
 async def _process_project_files(task_instance, project_id: int, 
                                  file_id: int, chunk_size: int,
-                                 overlap_size: int, do_reset: int):
+                                 overlap_size: int, do_reset: int,
+                                 separator: str = ChunkSeparatorEnums.NEWLINE.value,
+                                 incremental: int = 0):
 
-    db_engine, vector_db_client = None, None
+    db_engine, vector_db_client, llm_provider_factory = None, None, None
     
     try:
 
@@ -52,7 +55,9 @@ async def _process_project_files(task_instance, project_id: int,
             "file_id": file_id,
             "chunk_size": chunk_size,
             "overlap_size": overlap_size,
-            "do_reset": do_reset
+            "do_reset": do_reset,
+            "separator": separator,
+            "incremental": incremental
         }
         
         task_name = "tasks.file_processing.process_project_files"
@@ -105,7 +110,7 @@ async def _process_project_files(task_instance, project_id: int,
             template_parser=template_parser,
         )
 
-        project_files_ids = {}
+        project_assets = []
 
         if file_id:
             asset_record = await asset_model.get_asset_record_by_id(project.project_id, int(file_id))        
@@ -123,17 +128,11 @@ async def _process_project_files(task_instance, project_id: int,
 
                 raise Exception(f"No assets for file: {file_id}")
 
-            project_files_ids = {
-                asset_record.asset_id:asset_record.asset_name
-            }
+            project_assets = [asset_record]
         else:
             project_assets = await asset_model.get_all_assets(project.project_id, AssetTypeEnum.FILE.value)
-            project_files_ids = {
-                record.asset_id:record.asset_name
-                for record in project_assets
-            }
 
-        if len(project_files_ids) == 0:
+        if len(project_assets) == 0:
             task_instance.update_state(
                 state="FAILURE",
                 meta={"error": ResponseStatus.NO_FILES_TO_PROCESS.value}
@@ -149,49 +148,36 @@ async def _process_project_files(task_instance, project_id: int,
         
         process_controller = ProcessController(project_id)
 
-        no_records = 0
-        no_files = 0
-
         chunk_model = await ChunkModel.create_instance(db_client)
 
+        collection_name = nlp_controller.create_collection_name(project_id=project.project_id)
+
         if do_reset:
             # Delete collection from VectorDB
-            collection_name = nlp_controller.create_collection_name(project_id=project.project_id)
             _ = await vector_db_client.delete_collection(collection_name)
 
             # Delete chunks from DB
             _ = await chunk_model.delete_chunks_by_project_id(project.project_id)
 
-        for asset_id, file_id in project_files_ids.items():
-            file_content = process_controller.get_file_content(file_id)
-
-            if file_content is None:
-                logger.error(f"Error while processing file: {file_id}")
-                continue
-
-            file_chunks = process_controller.process_file_content(
-                file_content=file_content,
-                chunk_size=chunk_size,
-                chunk_overlap=overlap_size
-            )
+            _ = await asset_model.reset_assets_processing_state(project.project_id)
 
-            if file_chunks is None or len(file_chunks) == 0:
-                logger.error(f"No chunks for file_id: {file_id}")
-                pass
-
-            file_chunks_records = [
-                DataChunk(
-                    chunk_text=chunk.page_content,
-                    chunk_metadata=chunk.metadata,
-                    chunk_order=i+1,
-                    chunk_project_id=project.project_id,
-                    chunk_asset_id=asset_id
-                )
-                for i, chunk in enumerate(file_chunks)
-            ]
+        no_records, no_files, processed_asset_ids = await _process_assets(
+            process_controller=process_controller,
+            chunk_model=chunk_model,
+            asset_model=asset_model,
+            vector_db_client=vector_db_client,
+            collection_name=collection_name,
+            project_id=project.project_id,
+            project_assets=project_assets,
+            chunk_size=chunk_size,
+            overlap_size=overlap_size,
+            separator=separator,
+            batch_size=settings.FILE_PROCESSING_BATCH_SIZE,
+            incremental=bool(incremental and not do_reset)
+        )
 
-            no_records += await chunk_model.insert_multiple_chunks(chunks=file_chunks_records)
-            no_files += 1
+        if do_reset or processed_asset_ids:
+            _ = await project_model.bump_index_version(project.project_id)
 
         task_instance.update_state(
             state="SUCCESS",
@@ -212,8 +198,10 @@ async def _process_project_files(task_instance, project_id: int,
                 "message": ResponseStatus.FILE_PROCESSING_SUCCESS.value,
                 "inserted_chunks": no_records,
                 "processed_files": no_files,
+                "processed_asset_ids": processed_asset_ids,
                 "project_id": project_id,
-                "do_reset": do_reset
+                "do_reset": do_reset,
+                "incremental": incremental
                 }
     
     except Exception as e:
@@ -226,5 +214,236 @@ async def _process_project_files(task_instance, project_id: int,
             
             if vector_db_client:
                 await vector_db_client.disconnect()
+
+            if llm_provider_factory:
+                await llm_provider_factory.close()
+        except Exception as e:
+            logger.error(f"Task failed while cleaning: {str(e)}")
+
+
+async def _process_assets(process_controller: ProcessController, chunk_model: ChunkModel,
+                          asset_model: AssetModel, vector_db_client, collection_name: str,
+                          project_id: int, project_assets: list,
+                          chunk_size: int, overlap_size: int, separator: str,
+                          batch_size: int, incremental: bool = False):
+
+    no_records = 0
+    no_files = 0
+    processed_asset_ids = []
+
+    processing_config = {
+        "chunk_size": chunk_size,
+        "overlap_size": overlap_size,
+        "separator": separator,
+    }
+
+    for asset in project_assets:
+        asset_id, file_id = asset.asset_id, asset.asset_name
+
+        # the hash is only needed to detect changes, full runs store none
+        content_hash = None
+
+        if incremental:
+            content_hash = process_controller.get_file_hash(file_id)
+
+            if content_hash is None:
+                logger.error(f"Error while processing file: {file_id}")
+                continue
+
+            if (asset.asset_content_hash == content_hash
+                    and asset.asset_config == processing_config
+                    and asset.asset_indexed):
+                # same bytes, same parameters and already in the vector DB, nothing to refresh
+                continue
+
+            # drop only this asset's vectors and chunks before re-chunking it
+            asset_chunk_ids = await chunk_model.get_asset_chunk_ids(asset_id)
+            if len(asset_chunk_ids):
+                _ = await vector_db_client.delete_by_record_ids(
+                    collection_name=collection_name,
+                    record_ids=asset_chunk_ids
+                )
+                _ = await chunk_model.delete_chunks_by_asset_id(asset_id)
+
+        file_content = process_controller.get_file_content_iterator(file_id)
+
+        if file_content is None:
+            logger.error(f"Error while processing file: {file_id}")
+            continue
+
+        # pages are loaded and split lazily, chunks are flushed in bounded batches
+        file_chunks = process_controller.process_file_content_stream(
+            file_content=file_content,
+            chunk_size=chunk_size,
+            chunk_overlap=overlap_size,
+            separator=separator
+        )
+
+        file_chunks_records = []
+        file_records = 0
+
+        for i, chunk in enumerate(file_chunks):
+            file_chunks_records.append({
+                "chunk_text": chunk.page_content,
+                "chunk_metadata": chunk.metadata,
+                "chunk_order": i+1,
+                "chunk_project_id": project_id,
+                "chunk_asset_id": asset_id
+            })
+
+            if len(file_chunks_records) >= batch_size:
+                inserted_ids = await chunk_model.insert_chunks_bulk(chunks=file_chunks_records)
+                file_records += len(inserted_ids)
+                file_chunks_records = []
+
+        if len(file_chunks_records):
+            inserted_ids = await chunk_model.insert_chunks_bulk(chunks=file_chunks_records)
+            file_records += len(inserted_ids)
+
+        if file_records == 0:
+            logger.error(f"No chunks for file_id: {file_id}")
+
+        await asset_model.update_asset_processing_state(
+            asset_id=asset_id,
+            content_hash=content_hash,
+            processing_config=processing_config
+        )
+
+        no_records += file_records
+        no_files += 1
+        processed_asset_ids.append(asset_id)
+
+    return no_records, no_files, processed_asset_ids
+
+
+@celery_app.task(
+                bind=True, name="tasks.file_processing.process_assets_group",
+                autoretry_for=(Exception,),
+                retry_kwargs={'max_retries': 3, 'countdown': 60}
+                )
+def process_assets_group(self, project_id: int, asset_ids: list,
+                         chunk_size: int, overlap_size: int,
+                         separator: str = ChunkSeparatorEnums.NEWLINE.value,
+                         incremental: int = 0):
+
+    return asyncio.run(
+        _process_assets_group(self, project_id, asset_ids, chunk_size,
+                              overlap_size, separator, incremental)
+    )
+
+
+async def _process_assets_group(task_instance, project_id: int, asset_ids: list,
+                                chunk_size: int, overlap_size: int,
+                                separator: str = ChunkSeparatorEnums.NEWLINE.value,
+                                incremental: int = 0):
+
+    db_engine, vector_db_client, llm_provider_factory = None, None, None
+
+    try:
+
+        (db_engine, db_client, llm_provider_factory, 
+        vectordb_provider_factory,
+        generation_client, embedding_client,
+        vector_db_client, template_parser) = await get_setup_utils()
+
+        idempotency_manager = IdempotencyManager(db_client, db_engine)
+
+        task_args = {
+            "project_id": project_id,
+            "asset_ids": asset_ids,
+            "chunk_size": chunk_size,
+            "overlap_size": overlap_size,
+            "separator": separator,
+            "incremental": incremental
+        }
+
+        task_name = "tasks.file_processing.process_assets_group"
+
+        settings = get_settings()
+
+        should_execute, existing_task = await idempotency_manager.should_execute_task(
+            task_name=task_name,
+            task_args=task_args,
+            celery_task_id=task_instance.request.id,
+            task_time_limit=settings.CELERY_TASK_TIME_LIMIT
+        )
+
+        if not should_execute:
+            logger.warning(f"Can not handle th task | status: {existing_task.status}")
+            return existing_task.result
+
+        task_record = existing_task
+        if not task_record:
+            task_record = await idempotency_manager.create_task_record(
+                task_name=task_name,
+                task_args=task_args,
+                celery_task_id=task_instance.request.id
+            )
+
+        await idempotency_manager.update_task_status(
+            execution_id=task_record.execution_id,
+            status='STARTED'
+        )
+
+        asset_model = await AssetModel.create_instance(db_client)
+        chunk_model = await ChunkModel.create_instance(db_client)
+
+        project_assets = await asset_model.get_assets_by_ids(project_id, asset_ids)
+
+        nlp_controller = NLPController(
+            vector_db_client=vector_db_client,
+            embedding_client=embedding_client,
+            generation_client=generation_client,
+            template_parser=template_parser,
+        )
+
+        no_records, no_files, processed_asset_ids = await _process_assets(
+            process_controller=ProcessController(project_id),
+            chunk_model=chunk_model,
+            asset_model=asset_model,
+            vector_db_client=vector_db_client,
+            collection_name=nlp_controller.create_collection_name(project_id=project_id),
+            project_id=project_id,
+            project_assets=project_assets,
+            chunk_size=chunk_size,
+            overlap_size=overlap_size,
+            separator=separator,
+            batch_size=settings.FILE_PROCESSING_BATCH_SIZE,
+            incremental=bool(incremental)
+        )
+
+        if processed_asset_ids:
+            project_model = await ProjectModel.create_instance(db_client)
+            _ = await project_model.bump_index_version(project_id)
+
+        result = {
+            "message": ResponseStatus.FILE_PROCESSING_SUCCESS.value,
+            "inserted_chunks": no_records,
+            "processed_files": no_files,
+            "processed_asset_ids": processed_asset_ids,
+            "project_id": project_id,
+        }
+
+        await idempotency_manager.update_task_status(
+            execution_id=task_record.execution_id,
+            status='SUCCESS',
+            result=result
+        )
+
+        return result
+
+    except Exception as e:
+        logger.error(f"Task failed: {str(e)}")
+        raise
+    finally:
+        try:
+            if db_engine:
+                await db_engine.dispose()
+            
+            if vector_db_client:
+                await vector_db_client.disconnect()
+
+            if llm_provider_factory:
+                await llm_provider_factory.close()
         except Exception as e:
-            logger.error(f"Task failed while cleaning: {str(e)}")
\ No newline at end of file
+            logger.error(f"Task failed while cleaning: {str(e)}")
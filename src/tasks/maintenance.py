@@ -2,6 +2,10 @@ from celery_app import celery_app, get_setup_utils
 from helpers.config import get_settings
 import asyncio
 from utils.idempotency_manager import IdempotencyManager
+from models.RagAnswerCacheModel import RagAnswerCacheModel
+from models.EmbeddingCacheModel import EmbeddingCacheModel
+from models.ChunkModel import ChunkModel
+from controllers import NLPController
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,7 +23,7 @@ def clean_celery_executions_table(self):
 
 async def _clean_celery_executions_table(task_instance):
 
-    db_engine, vector_db_client = None, None
+    db_engine, vector_db_client, llm_provider_factory = None, None, None
     
     try:
 
@@ -34,6 +38,20 @@ async def _clean_celery_executions_table(task_instance):
         logger.warning(f"cleaning !!!")
         _ = await idempotency_manager.cleanup_old_tasks()
 
+        settings = get_settings()
+        answer_cache_model = await RagAnswerCacheModel.create_instance(db_client)
+        deleted_answers = await answer_cache_model.delete_stale_answers(
+            ttl_seconds=settings.RAG_ANSWER_CACHE_TTL_SECONDS
+        )
+        logger.warning(f"deleted stale cached answers: {deleted_answers}")
+
+        embedding_cache_model = await EmbeddingCacheModel.create_instance(db_client)
+        deleted_vectors = await embedding_cache_model.delete_stale_vectors(
+            ttl_seconds=settings.EMBEDDING_CACHE_TTL_SECONDS,
+            max_rows=settings.EMBEDDING_CACHE_MAX_ROWS
+        )
+        logger.warning(f"deleted stale cached embeddings: {deleted_vectors}")
+
         return True
 
     except Exception as e:
@@ -46,5 +64,81 @@ async def _clean_celery_executions_table(task_instance):
             
             if vector_db_client:
                 await vector_db_client.disconnect()
+
+            if llm_provider_factory:
+                await llm_provider_factory.close()
+        except Exception as e:
+            logger.error(f"Task failed while cleaning: {str(e)}")
+
+@celery_app.task(
+                 bind=True, name="tasks.maintenance.backfill_asset_ids",
+                 autoretry_for=(Exception,),
+                 retry_kwargs={'max_retries': 3, 'countdown': 60}
+                )
+def backfill_asset_ids(self, project_id: int):
+
+    return asyncio.run(
+        _backfill_asset_ids(self, project_id)
+    )
+
+async def _backfill_asset_ids(task_instance, project_id: int):
+
+    db_engine, vector_db_client, llm_provider_factory = None, None, None
+
+    try:
+
+        (db_engine, db_client, llm_provider_factory,
+        vectordb_provider_factory,
+        generation_client, embedding_client,
+        vector_db_client, template_parser) = await get_setup_utils()
+
+        # only payload based stores filter on metadata.asset_id, PGVector joins the chunks table
+        if not hasattr(vector_db_client, "set_records_asset_id"):
+            return {"project_id": project_id, "updated_records": 0}
+
+        nlp_controller = NLPController(
+            vector_db_client=vector_db_client,
+            generation_client=generation_client,
+            embedding_client=embedding_client,
+            template_parser=template_parser,
+        )
+
+        collection_name = nlp_controller.create_collection_name(project_id)
+        if not await vector_db_client.is_collection_exists(collection_name=collection_name):
+            return {"project_id": project_id, "updated_records": 0}
+
+        chunk_model = await ChunkModel.create_instance(db_client)
+
+        updated_records = 0
+        async for page_chunks in chunk_model.iter_project_chunks(project_id=project_id):
+            asset_record_ids = {}
+            for chunk in page_chunks:
+                asset_record_ids.setdefault(chunk.chunk_asset_id, []).append(chunk.chunk_id)
+
+            for asset_id, record_ids in asset_record_ids.items():
+                _ = await vector_db_client.set_records_asset_id(
+                    collection_name=collection_name,
+                    asset_id=asset_id,
+                    record_ids=record_ids
+                )
+            updated_records += len(page_chunks)
+
+        logger.warning(f"backfilled asset ids for project {project_id}: {updated_records}")
+
+        return {"project_id": project_id, "updated_records": updated_records}
+
+    except Exception as e:
+        logger.error(f"Task failed: {str(e)}")
+        raise
+    finally:
+        try:
+            if db_engine:
+                await db_engine.dispose()
+
+            if vector_db_client:
+                await vector_db_client.disconnect()
+
+            if llm_provider_factory:
+                await llm_provider_factory.close()
         except Exception as e:
-            logger.error(f"Task failed while cleaning: {str(e)}")
\ No newline at end of file
+            logger.error(f"Task failed while cleaning: {str(e)}")
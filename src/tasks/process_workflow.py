@@ -1,9 +1,15 @@
-from celery import chain
+from celery import chain, chord, group
 from celery_app import celery_app, get_setup_utils
 from helpers.config import get_settings
 import asyncio
-from tasks.file_processing import process_project_files
-from tasks.data_indexing import _index_data_content
+from tasks.file_processing import process_project_files, process_assets_group
+from tasks.data_indexing import _index_data_content, index_data_content
+from models import ResponseStatus, ChunkSeparatorEnums
+from models.ProjectModel import ProjectModel
+from models.AssetModel import AssetModel
+from models.ChunkModel import ChunkModel
+from models.enums.AssetTypeEnum import AssetTypeEnum
+from controllers import NLPController
 
 import logging
 logger = logging.getLogger(__name__)
@@ -18,8 +24,13 @@ def push_after_process_task(self, prev_task_result):
     project_id = prev_task_result.get("project_id")
     do_reset = prev_task_result.get("do_reset")
 
+    # incremental runs only push the chunks of the assets that were re-processed
+    asset_ids = None
+    if prev_task_result.get("incremental") and not do_reset:
+        asset_ids = prev_task_result.get("processed_asset_ids", [])
+
     task_results = asyncio.run(
-        _index_data_content(self, project_id, do_reset)
+        _index_data_content(self, project_id, do_reset, asset_ids)
     )
 
     return {
@@ -36,10 +47,13 @@ def push_after_process_task(self, prev_task_result):
                 )
 def process_and_push_workflow(self, project_id: int, 
                                     file_id: int, chunk_size: int,
-                                    overlap_size: int, do_reset: int):
+                                    overlap_size: int, do_reset: int,
+                                    separator: str = ChunkSeparatorEnums.NEWLINE.value,
+                                    incremental: int = 0):
 
     workflow = chain(
-        process_project_files.s(project_id, file_id, chunk_size, overlap_size, do_reset),
+        process_project_files.s(project_id, file_id, chunk_size, overlap_size, do_reset,
+                                separator, incremental),
         push_after_process_task.s()
     )
 
@@ -50,4 +64,167 @@ def process_and_push_workflow(self, project_id: int,
         "workflow_id": result.id,
         "tasks": ["tasks.file_processing.process_project_files", 
                   "tasks.data_indexing.index_data_content"]
-    }
\ No newline at end of file
+    }
+
+
+def split_assets_into_groups(assets: list, groups_count: int):
+    """
+    Size-balanced partition of assets: the largest remaining asset always goes
+    to the currently lightest group (LPT scheduling).
+    """
+    groups = [[] for _ in range(groups_count)]
+    groups_sizes = [0] * groups_count
+
+    for asset in sorted(assets, key=lambda a: a.asset_size or 0, reverse=True):
+        lightest = groups_sizes.index(min(groups_sizes))
+        groups[lightest].append(asset.asset_id)
+        groups_sizes[lightest] += asset.asset_size or 0
+
+    return [g for g in groups if len(g) > 0]
+
+
+@celery_app.task(
+                 bind=True, name="tasks.process_workflow.process_project_files_fanout",
+                 autoretry_for=(Exception,),
+                 retry_kwargs={'max_retries': 3, 'countdown': 60}
+                )
+def process_project_files_fanout(self, project_id: int, chunk_size: int,
+                                 overlap_size: int, do_reset: int,
+                                 separator: str = ChunkSeparatorEnums.NEWLINE.value,
+                                 push_after: int = 0, incremental: int = 0):
+
+    return asyncio.run(
+        _process_project_files_fanout(self, project_id, chunk_size, overlap_size,
+                                      do_reset, separator, push_after, incremental)
+    )
+
+
+async def _process_project_files_fanout(task_instance, project_id: int, chunk_size: int,
+                                        overlap_size: int, do_reset: int,
+                                        separator: str = ChunkSeparatorEnums.NEWLINE.value,
+                                        push_after: int = 0, incremental: int = 0):
+
+    db_engine, vector_db_client, llm_provider_factory = None, None, None
+
+    try:
+
+        (db_engine, db_client, llm_provider_factory, 
+        vectordb_provider_factory,
+        generation_client, embedding_client,
+        vector_db_client, template_parser) = await get_setup_utils()
+
+        settings = get_settings()
+
+        project_model = await ProjectModel.create_instance(db_client)
+        project = await project_model.get_project_or_create_one(project_id)
+
+        asset_model = await AssetModel.create_instance(db_client)
+        project_assets = await asset_model.get_all_assets(project.project_id, AssetTypeEnum.FILE.value)
+
+        if len(project_assets) == 0:
+            task_instance.update_state(
+                state="FAILURE",
+                meta={"error": ResponseStatus.NO_FILES_TO_PROCESS.value}
+            )
+
+            raise Exception(f"No files found for project_id: {project.project_id}")
+
+        if do_reset:
+            nlp_controller = NLPController(
+                vector_db_client=vector_db_client,
+                embedding_client=embedding_client,
+                generation_client=generation_client,
+                template_parser=template_parser,
+            )
+
+            # Delete collection from VectorDB
+            collection_name = nlp_controller.create_collection_name(project_id=project.project_id)
+            _ = await vector_db_client.delete_collection(collection_name)
+
+            # Delete chunks from DB
+            chunk_model = await ChunkModel.create_instance(db_client)
+            _ = await chunk_model.delete_chunks_by_project_id(project.project_id)
+
+            _ = await asset_model.reset_assets_processing_state(project.project_id)
+
+            _ = await project_model.bump_index_version(project.project_id)
+
+        # one group per asset unless a maximum number of groups is configured
+        groups_count = len(project_assets)
+        if settings.FILE_PROCESSING_FANOUT_GROUPS > 0:
+            groups_count = min(groups_count, settings.FILE_PROCESSING_FANOUT_GROUPS)
+
+        assets_groups = split_assets_into_groups(project_assets, groups_count)
+
+        incremental = int(bool(incremental and not do_reset))
+
+        workflow = chord(
+            group(
+                process_assets_group.s(project.project_id, asset_ids, chunk_size,
+                                       overlap_size, separator, incremental)
+                for asset_ids in assets_groups
+            ),
+            collect_processing_results.s(project.project_id, do_reset, push_after, incremental)
+        )
+
+        result = workflow.apply_async()
+
+        return {
+            "signal": "WORKFLOW_STARTED",
+            "workflow_id": result.id,
+            "project_id": project_id,
+            "groups_count": len(assets_groups),
+        }
+
+    except Exception as e:
+        logger.error(f"Task failed: {str(e)}")
+        raise
+    finally:
+        try:
+            if db_engine:
+                await db_engine.dispose()
+            
+            if vector_db_client:
+                await vector_db_client.disconnect()
+
+            if llm_provider_factory:
+                await llm_provider_factory.close()
+        except Exception as e:
+            logger.error(f"Task failed while cleaning: {str(e)}")
+
+
+@celery_app.task(
+                 bind=True, name="tasks.process_workflow.collect_processing_results",
+                )
+def collect_processing_results(self, groups_results: list, project_id: int,
+                               do_reset: int, push_after: int = 0, incremental: int = 0):
+
+    inserted_chunks = sum(r.get("inserted_chunks", 0) for r in groups_results if r)
+    processed_files = sum(r.get("processed_files", 0) for r in groups_results if r)
+    processed_asset_ids = [
+        asset_id
+        for r in groups_results if r
+        for asset_id in r.get("processed_asset_ids", [])
+    ]
+
+    logger.warning(f"inserted_chunks: {inserted_chunks} | processed_files: {processed_files}")
+
+    indexing_task_id = None
+    if push_after:
+        # the collection was already dropped before the fan-out if do_reset was set
+        indexing_task = index_data_content.delay(
+            project_id=project_id, do_reset=0,
+            asset_ids=processed_asset_ids if incremental else None
+        )
+        indexing_task_id = indexing_task.id
+
+    return {
+        "message": ResponseStatus.FILE_PROCESSING_SUCCESS.value,
+        "inserted_chunks": inserted_chunks,
+        "processed_files": processed_files,
+        "processed_asset_ids": processed_asset_ids,
+        "project_id": project_id,
+        "do_reset": do_reset,
+        "incremental": incremental,
+        "indexing_task_id": indexing_task_id
+    }
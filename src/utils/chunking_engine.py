@@ -0,0 +1,165 @@
+import bisect
+import regex as re
+from typing import Iterable, Iterator, List, Tuple
+from models.enums.ProcessingEnums import ChunkSeparatorEnums
+
+SEPARATOR_PATTERNS = {
+    ChunkSeparatorEnums.PARAGRAPH.value: re.compile(r'\n\s*\n'),
+    ChunkSeparatorEnums.SENTENCE.value: re.compile(r'(?<=[.!?؟。])\s+|\n'),
+    ChunkSeparatorEnums.NEWLINE.value: re.compile(r'\n'),
+}
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+class ChunkingEngine:
+    """
+    Sliding-window splitter working on character offsets.
+    Pages are consumed lazily; the working buffer only keeps the tail of the
+    text that has not been emitted yet, so every character is copied a bounded
+    number of times and chunks are sliced instead of accumulated.
+    """
+
+    def __init__(self, chunk_size: int, chunk_overlap: int = 0,
+                 separator: str = ChunkSeparatorEnums.NEWLINE.value,
+                 page_separator: str = '\n', min_chunk_length: int = 2):
+
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got: {chunk_size}")
+
+        if separator not in SEPARATOR_PATTERNS:
+            raise ValueError(f"Unsupported separator: {separator}")
+
+        self.chunk_size = chunk_size
+        # overlap must leave room for the window to move forward
+        self.chunk_overlap = min(max(chunk_overlap or 0, 0), chunk_size - 1)
+        self.separator = separator
+        self.pattern = SEPARATOR_PATTERNS[separator]
+        self.page_separator = page_separator
+        self.min_chunk_length = min_chunk_length
+
+    def split(self, pages: Iterable) -> Iterator[Tuple[str, dict]]:
+        """
+        Yields (chunk_text, chunk_metadata) pairs. Offsets in the metadata are
+        positions in the document text built by joining pages with page_separator.
+        """
+        buffer = ""
+        buffer_offset = 0       # document offset of buffer[0]
+        doc_length = 0
+        start = 0               # next chunk start, relative to buffer
+        last_end = 0            # end of the last emitted window, relative to buffer
+        last_char_end = 0       # document offset where the last emitted chunk text ends
+        page_starts: List[int] = []
+        page_numbers: List[int] = []
+
+        for page_idx, page in enumerate(pages):
+            page_text = page.page_content or ""
+            page_no = self._get_page_number(page, page_idx)
+
+            if doc_length > 0:
+                page_text = self.page_separator + page_text
+
+            page_starts.append(doc_length)
+            page_numbers.append(page_no)
+            doc_length += len(page_text)
+
+            # drop what was already emitted, keep the pending tail only
+            buffer = buffer[start:] + page_text
+            buffer_offset += start
+            last_end = max(last_end - start, 0)
+            start = 0
+
+            boundaries, content_ends = self._get_boundaries(buffer)
+
+            while len(buffer) - start > self.chunk_size:
+                end = self._get_chunk_end(boundaries, content_ends, start, last_end)
+                chunk = self._make_chunk(buffer, buffer_offset, start, end,
+                                         page_starts, page_numbers)
+                if chunk and chunk[1]["char_end"] > last_char_end:
+                    last_char_end = chunk[1]["char_end"]
+                    yield chunk
+                last_end = end
+                start = self._get_next_start(buffer, boundaries, start, end)
+
+            # forget pages that ended before the pending tail
+            first_page = bisect.bisect_right(page_starts, buffer_offset + start) - 1
+            if first_page > 0:
+                del page_starts[:first_page]
+                del page_numbers[:first_page]
+
+        # flush the remaining tail
+        if len(buffer) > start:
+            boundaries, content_ends = self._get_boundaries(buffer)
+            while start < len(buffer):
+                end = self._get_chunk_end(boundaries, content_ends, start, last_end)
+                chunk = self._make_chunk(buffer, buffer_offset, start, end,
+                                         page_starts, page_numbers)
+                if chunk and chunk[1]["char_end"] > last_char_end:
+                    last_char_end = chunk[1]["char_end"]
+                    yield chunk
+                if end >= len(buffer):
+                    break
+                last_end = end
+                start = self._get_next_start(buffer, boundaries, start, end)
+
+    def _get_page_number(self, page, page_idx: int) -> int:
+        metadata = getattr(page, "metadata", None) or {}
+        page_no = metadata.get("page")
+        return int(page_no) + 1 if isinstance(page_no, int) else page_idx + 1
+
+    def _get_boundaries(self, buffer: str) -> Tuple[List[int], List[int]]:
+        # a boundary is where the next piece starts, its content ends before the separator
+        boundaries, content_ends = [], []
+        for m in self.pattern.finditer(buffer):
+            boundaries.append(m.end())
+            content_ends.append(m.start())
+        return boundaries, content_ends
+
+    def _get_chunk_end(self, boundaries: List[int], content_ends: List[int],
+                       start: int, last_end: int) -> int:
+        limit = start + self.chunk_size
+        # last separator boundary inside the window, otherwise a hard cut;
+        # the boundary must bring new text, or the window repeats the previous one
+        idx = bisect.bisect_right(boundaries, limit) - 1
+        if idx >= 0 and boundaries[idx] > start and content_ends[idx] > last_end:
+            return boundaries[idx]
+        return limit
+
+    def _get_next_start(self, buffer: str, boundaries: List[int], start: int, end: int) -> int:
+        if self.chunk_overlap == 0:
+            return end
+
+        next_start = end - self.chunk_overlap
+        # snap the overlap to the first boundary so chunks start on a clean cut
+        idx = bisect.bisect_left(boundaries, next_start)
+        if idx < len(boundaries) and boundaries[idx] < end:
+            next_start = boundaries[idx]
+        elif next_start > 0 and not buffer[next_start - 1].isspace():
+            # no boundary in the overlap, start on the next word instead of inside one;
+            # a single word cut by the window is kept whole in the next chunk
+            match = WHITESPACE_PATTERN.search(buffer, next_start, end)
+            if match and match.end() < end:
+                next_start = match.end()
+
+        return next_start if next_start > start else end
+
+    def _make_chunk(self, buffer: str, buffer_offset: int, start: int, end: int,
+                    page_starts: List[int], page_numbers: List[int]):
+
+        raw_text = buffer[start:end]
+        text = raw_text.strip()
+        if len(text) < self.min_chunk_length:
+            return None
+
+        # offsets of the stripped text inside the document
+        char_start = buffer_offset + start + (len(raw_text) - len(raw_text.lstrip()))
+        char_end = char_start + len(text)
+
+        page_start = page_numbers[max(bisect.bisect_right(page_starts, char_start) - 1, 0)]
+        page_end = page_numbers[max(bisect.bisect_right(page_starts, char_end - 1) - 1, 0)]
+
+        return text, {
+            "page_start": page_start,
+            "page_end": page_end,
+            "char_start": char_start,
+            "char_end": char_end,
+        }
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+from typing import AsyncIterator, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+class IndexingPipeline:
+    """
+    Three-stage fetch -> embed -> write pipeline connected by bounded queues.
+    Pages are read from the DB while earlier pages are being embedded and written,
+    so a page costs roughly the slowest stage instead of the sum of all three.
+    """
+
+    def __init__(self, chunk_pages: AsyncIterator[list],
+                 embed_fn: Callable[[list], Awaitable[list]],
+                 write_fn: Callable[[list, list], Awaitable[None]],
+                 embedding_concurrency: int = 2, queue_size: int = 4,
+                 checkpoint_fn: Callable[[list], Awaitable[None]] = None):
+
+        self.chunk_pages = chunk_pages
+        self.embed_fn = embed_fn
+        self.write_fn = write_fn
+        self.embedding_concurrency = max(embedding_concurrency, 1)
+        self.queue_size = max(queue_size, 1)
+        self.checkpoint_fn = checkpoint_fn
+
+    async def run(self) -> int:
+        embed_queue = asyncio.Queue(maxsize=self.queue_size)
+        write_queue = asyncio.Queue(maxsize=self.queue_size)
+        written_count = 0
+
+        # pages can be written out of order when embedding runs concurrently,
+        # so checkpoints only advance over the contiguous prefix of written pages
+        written_pages = {}
+        next_checkpoint_seq = 0
+
+        async def fetch_stage():
+            page_seq = 0
+            async for page_chunks in self.chunk_pages:
+                await embed_queue.put((page_seq, page_chunks))
+                page_seq += 1
+
+            for _ in range(self.embedding_concurrency):
+                await embed_queue.put(None)
+
+        async def embed_worker():
+            while True:
+                item = await embed_queue.get()
+                if item is None:
+                    break
+
+                page_seq, page_chunks = item
+                vectors = await self.embed_fn(page_chunks)
+                await write_queue.put((page_seq, page_chunks, vectors))
+
+        async def embed_stage():
+            await asyncio.gather(*[embed_worker() for _ in range(self.embedding_concurrency)])
+            await write_queue.put(None)
+
+        async def write_stage():
+            nonlocal written_count, next_checkpoint_seq
+            while True:
+                item = await write_queue.get()
+                if item is None:
+                    break
+
+                page_seq, page_chunks, vectors = item
+                await self.write_fn(page_chunks, vectors)
+                written_count += len(page_chunks)
+
+                if self.checkpoint_fn is None:
+                    continue
+
+                written_pages[page_seq] = page_chunks
+                checkpoint_page = None
+                while next_checkpoint_seq in written_pages:
+                    checkpoint_page = written_pages.pop(next_checkpoint_seq)
+                    next_checkpoint_seq += 1
+
+                if checkpoint_page is not None:
+                    await self.checkpoint_fn(checkpoint_page)
+
+        tasks = [
+            asyncio.create_task(fetch_stage()),
+            asyncio.create_task(embed_stage()),
+            asyncio.create_task(write_stage()),
+        ]
+
+        try:
+            # a failing stage would leave the others blocked on their queues
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if task.exception() is not None:
+                    raise task.exception()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return written_count
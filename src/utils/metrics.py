@@ -1,4 +1,4 @@
-from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client import Counter, Gauge, Histogram, generate_latest, CONTENT_TYPE_LATEST
 from fastapi import Response, Request, FastAPI
 from starlette.middleware.base import BaseHTTPMiddleware
 import time
@@ -10,6 +10,18 @@ REQUEST_COUNT = Counter(
 REQUEST_LATENCY = Histogram(
     'http_request_duration_seconds', 'HTTP Request Latency', ['method', 'endpoint']
 )
+QUERY_EMBEDDING_CACHE_REQUESTS = Counter(
+    'query_embedding_cache_requests_total', 'Query embedding cache lookups', ['result']
+)
+QUERY_EMBEDDING_CACHE_BYTES = Gauge(
+    'query_embedding_cache_bytes', 'Query embedding cache size in bytes'
+)
+SEMANTIC_ANSWER_CACHE_REQUESTS = Counter(
+    'semantic_answer_cache_requests_total', 'Semantic answer cache lookups', ['result']
+)
+SEMANTIC_ANSWER_CACHE_HIT_RATIO = Gauge(
+    'semantic_answer_cache_hit_ratio', 'Semantic answer cache hit ratio since startup'
+)
 
 class PrometheusMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
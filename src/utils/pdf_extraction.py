@@ -0,0 +1,12 @@
+import fitz
+from typing import List
+
+# Kept free of heavy imports: this module is loaded by every pool worker.
+
+def get_pdf_page_count(file_path: str) -> int:
+    with fitz.open(file_path) as document:
+        return document.page_count
+
+def extract_pdf_pages_text(file_path: str, page_start: int, page_end: int) -> List[str]:
+    with fitz.open(file_path) as document:
+        return [document[page_no].get_text() for page_no in range(page_start, page_end)]
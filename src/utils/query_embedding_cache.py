@@ -0,0 +1,136 @@
+import hashlib
+import logging
+import time
+import unicodedata
+from collections import OrderedDict
+import numpy as np
+from utils.metrics import QUERY_EMBEDDING_CACHE_REQUESTS, QUERY_EMBEDDING_CACHE_BYTES
+
+logger = logging.getLogger(__name__)
+
+class QueryEmbeddingCache:
+    """
+    In-process LRU cache of query embeddings with a TTL and a memory budget in bytes.
+    When a redis url is given, entries are also shared with the other processes
+    through redis, which is checked on local misses.
+    """
+
+    def __init__(self, max_bytes: int, ttl_seconds: int = 3600,
+                 redis_url: str = None, key_prefix: str = "query_embedding"):
+
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+
+        self.entries = OrderedDict()    # key -> (vector, expires_at)
+        self.size_bytes = 0
+
+        self.redis_client = None
+        if redis_url:
+            import redis.asyncio as redis
+            self.redis_client = redis.from_url(redis_url)
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+    def create_key(self, model_id: str, text: str) -> str:
+        text_hash = hashlib.sha256(self.normalize_text(text).encode("utf-8")).hexdigest()
+        return f"{self.key_prefix}:{model_id}:{text_hash}"
+
+    async def get(self, model_id: str, text: str):
+        return (await self.get_many(model_id, [text]))[0]
+
+    async def get_many(self, model_id: str, texts: list):
+        # local hits first, the remaining keys are read from redis in one MGET
+        keys = [self.create_key(model_id, text) for text in texts]
+        vectors = [self.get_local(key) for key in keys]
+
+        local_hits = sum(1 for vector in vectors if vector is not None)
+        if local_hits:
+            QUERY_EMBEDDING_CACHE_REQUESTS.labels(result="hit").inc(local_hits)
+
+        missing_idx = [idx for idx, vector in enumerate(vectors) if vector is None]
+        if missing_idx and self.redis_client is not None:
+            try:
+                values = await self.redis_client.mget([keys[idx] for idx in missing_idx])
+            except Exception as e:
+                logger.warning(f"Query embedding cache backend unavailable: {e}")
+                values = [None] * len(missing_idx)
+
+            shared_hits = 0
+            for idx, data in zip(missing_idx, values):
+                if data:
+                    vectors[idx] = np.frombuffer(data, dtype=np.float32)
+                    self.put(keys[idx], vectors[idx])
+                    shared_hits += 1
+
+            if shared_hits:
+                QUERY_EMBEDDING_CACHE_REQUESTS.labels(result="shared_hit").inc(shared_hits)
+
+        misses = sum(1 for vector in vectors if vector is None)
+        if misses:
+            QUERY_EMBEDDING_CACHE_REQUESTS.labels(result="miss").inc(misses)
+
+        return vectors
+
+    def get_local(self, key: str):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        vector, expires_at = entry
+        if expires_at > time.monotonic():
+            self.entries.move_to_end(key)
+            return vector
+
+        self.remove(key)
+        return None
+
+    async def set(self, model_id: str, text: str, vector):
+        await self.set_many(model_id, [text], [vector])
+
+    async def set_many(self, model_id: str, texts: list, vectors: list):
+        entries = []
+        for text, vector in zip(texts, vectors):
+            key = self.create_key(model_id, text)
+            vector = np.asarray(vector, dtype=np.float32)
+            self.put(key, vector)
+            entries.append((key, vector))
+
+        if self.redis_client is not None and entries:
+            # one pipelined round trip for the whole batch
+            try:
+                async with self.redis_client.pipeline(transaction=False) as pipeline:
+                    for key, vector in entries:
+                        pipeline.set(key, vector.tobytes(), ex=self.ttl_seconds)
+                    await pipeline.execute()
+            except Exception as e:
+                logger.warning(f"Query embedding cache backend unavailable: {e}")
+
+    def put(self, key: str, vector: np.ndarray):
+        entry_bytes = vector.nbytes + len(key)
+        if entry_bytes > self.max_bytes:
+            return
+
+        if key in self.entries:
+            self.remove(key)
+
+        self.entries[key] = (vector, time.monotonic() + self.ttl_seconds)
+        self.size_bytes += entry_bytes
+
+        # evict least recently used entries until the budget fits
+        while self.size_bytes > self.max_bytes:
+            oldest_key = next(iter(self.entries))
+            self.remove(oldest_key)
+
+        QUERY_EMBEDDING_CACHE_BYTES.set(self.size_bytes)
+
+    def remove(self, key: str):
+        vector, _ = self.entries.pop(key)
+        self.size_bytes -= vector.nbytes + len(key)
+        QUERY_EMBEDDING_CACHE_BYTES.set(self.size_bytes)
+
+    async def close(self):
+        if self.redis_client is not None:
+            await self.redis_client.aclose()
@@ -0,0 +1,113 @@
+from collections import OrderedDict
+import numpy as np
+from utils.metrics import SEMANTIC_ANSWER_CACHE_REQUESTS, SEMANTIC_ANSWER_CACHE_HIT_RATIO
+
+class ProjectAnswerCache:
+    """
+    Fixed-capacity matrix of normalized query embeddings for one project index version.
+    A lookup is a single matrix-vector product; the least recently used row is reused
+    when the cache is full.
+    """
+
+    def __init__(self, index_version: int, max_entries: int):
+        self.index_version = index_version
+        self.max_entries = max_entries
+
+        self.vectors = None         # allocated on the first insert, when the dimension is known
+        self.answers = [None] * max_entries
+        self.last_used = np.zeros(max_entries, dtype=np.int64)
+        self.count = 0
+
+    def lookup(self, query_vector: np.ndarray, threshold: float, tick: int):
+        if self.count == 0:
+            return None
+
+        similarities = self.vectors[:self.count] @ query_vector
+        best_idx = int(np.argmax(similarities))
+
+        if similarities[best_idx] < threshold:
+            return None
+
+        self.last_used[best_idx] = tick
+        return self.answers[best_idx]
+
+    def add(self, query_vector: np.ndarray, answer: tuple, tick: int):
+        if self.vectors is None:
+            self.vectors = np.zeros((self.max_entries, query_vector.shape[0]), dtype=np.float32)
+
+        if self.count < self.max_entries:
+            slot = self.count
+            self.count += 1
+        else:
+            slot = int(np.argmin(self.last_used))
+
+        self.vectors[slot] = query_vector
+        self.answers[slot] = answer
+        self.last_used[slot] = tick
+
+
+class SemanticAnswerCache:
+    """
+    In-memory cache of RAG answers matched by cosine similarity of the query embedding.
+    Entries are kept per project and partition (the retrieval and generation settings
+    the answer was produced with), and dropped as soon as the project's index version moves.
+    """
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 1000, max_projects: int = 100):
+        self.threshold = threshold
+        self.max_entries = max(max_entries, 1)
+        self.max_projects = max(max_projects, 1)
+
+        self.projects = OrderedDict()   # (project_id, partition) -> ProjectAnswerCache
+        self.tick = 0
+        self.hits = 0
+        self.lookups = 0
+
+    @staticmethod
+    def normalize(vector) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def get_project_cache(self, project_id: int, index_version: int, partition: tuple = (),
+                          create: bool = False):
+        cache_key = (project_id, partition)
+        project_cache = self.projects.get(cache_key)
+
+        if project_cache is not None and project_cache.index_version != index_version:
+            # the index changed, answers of the old version are stale
+            del self.projects[cache_key]
+            project_cache = None
+
+        if project_cache is None and create:
+            project_cache = ProjectAnswerCache(index_version=index_version, max_entries=self.max_entries)
+            self.projects[cache_key] = project_cache
+            if len(self.projects) > self.max_projects:
+                self.projects.popitem(last=False)
+
+        if project_cache is not None:
+            self.projects.move_to_end(cache_key)
+
+        return project_cache
+
+    def get(self, project_id: int, index_version: int, query_vector, partition: tuple = ()):
+        self.tick += 1
+        self.lookups += 1
+
+        answer = None
+        project_cache = self.get_project_cache(project_id, index_version, partition)
+        if project_cache is not None:
+            answer = project_cache.lookup(self.normalize(query_vector), self.threshold, self.tick)
+
+        if answer is not None:
+            self.hits += 1
+        SEMANTIC_ANSWER_CACHE_REQUESTS.labels(result="hit" if answer is not None else "miss").inc()
+        SEMANTIC_ANSWER_CACHE_HIT_RATIO.set(self.hits / self.lookups)
+
+        return answer
+
+    def set(self, project_id: int, index_version: int, query_vector, answer: tuple,
+            partition: tuple = ()):
+        self.tick += 1
+        project_cache = self.get_project_cache(project_id, index_version, partition, create=True)
+        project_cache.add(self.normalize(query_vector), answer, self.tick)
@@ -0,0 +1,24 @@
+import re
+import zlib
+from collections import Counter
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+def encode_sparse_text(text: str, is_query: bool = False, k1: float = 1.2):
+    """
+    Hashed bag-of-words sparse vector for lexical matching in Qdrant.
+    Documents get BM25-style saturated term frequencies, queries a flat weight;
+    the IDF part is applied by Qdrant at query time.
+    """
+    tokens = TOKEN_PATTERN.findall((text or "").casefold())
+
+    # crc32 is stable across processes, unlike the builtin hash
+    term_counts = Counter(zlib.crc32(token.encode("utf-8")) & 0x7FFFFFFF for token in tokens)
+
+    indices = list(term_counts.keys())
+    if is_query:
+        values = [1.0] * len(indices)
+    else:
+        values = [count * (k1 + 1) / (count + k1) for count in term_counts.values()]
+
+    return indices, values